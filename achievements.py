@@ -1,5 +1,7 @@
 import pygame
 import json
+from fonts import font_registry, text_cache
+from gamelog import log
 
 class Achievements:
     def __init__(self):
@@ -41,7 +43,7 @@ class Achievements:
             import js  # Pygbag provides this for JavaScript interop
             data = js.loadPlayerData()
             if not data or not isinstance(data, dict):
-                print("Empty or invalid achievements data from localStorage")
+                log.info("Empty or invalid achievements data from localStorage")
                 return
             for key in self.achievements:
                 if key in data:
@@ -50,7 +52,7 @@ class Achievements:
                     elif isinstance(data[key], bool):
                         self.achievements[key]["unlocked"] = data[key]
         except Exception as e:
-            print(f"Failed to load achievements from localStorage: {e}")
+            log.warning("Failed to load achievements from localStorage: %s", e)
 
     def save_achievements(self):
         data = {key: {"unlocked": value["unlocked"]} for key, value in self.achievements.items()}
@@ -58,7 +60,7 @@ class Achievements:
             import js
             js.savePlayerData(data)
         except Exception as e:
-            print(f"Failed to save achievements to localStorage: {e}")
+            log.warning("Failed to save achievements to localStorage: %s", e)
 
     def unlock_achievement(self, achievement):
         if achievement in self.achievements and not self.achievements[achievement]["unlocked"]:
@@ -132,8 +134,8 @@ class Achievements:
             if self.popup_queue:
                 achievement = self.popup_queue[0]
                 text = f"Achievement Unlocked: {achievement}"
-                font = pygame.font.SysFont("Arial", 36, bold=True)
-                text_surface = font.render(text, True, (255, 255, 255))
+                font = font_registry.get("Arial", 36, bold=True)
+                text_surface = text_cache.render(font, text, (255, 255, 255))
                 screen_width, screen_height = screen.get_size()
                 popup_width = text_surface.get_width() + 40
                 popup_height = text_surface.get_height() + 40
@@ -144,10 +146,10 @@ class Achievements:
 
     def draw_achievements_menu(self, screen):
         screen.blit(pygame.Surface((1920, 1080)), (0, 0))
-        font = pygame.font.SysFont("Arial", 24)
+        font = font_registry.get("Arial", 24)
         y = 50
         for name, data in self.achievements.items():
             color = (0, 255, 0) if data["unlocked"] else (255, 0, 0)
-            text = font.render(f"{name}: {data['description']} - {'Unlocked' if data['unlocked'] else 'Locked'}", True, color)
+            text = text_cache.render(font, f"{name}: {data['description']} - {'Unlocked' if data['unlocked'] else 'Locked'}", color)
             screen.blit(text, (50, y))
             y += 30
\ No newline at end of file
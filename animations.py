@@ -0,0 +1,201 @@
+import pygame
+from types import MappingProxyType
+from atlas import atlas
+
+FRAME_WIDTH = 192
+FRAME_HEIGHT = 192
+FRAMES_PER_STATE = 14
+STATE_ROWS = {"idle": 0, "run": 1, "attack": 2, "die": 3}
+
+DEFAULT_COLORS = {
+    "Player_Peasant": (255, 0, 0), "Player_Archer": (0, 255, 0), "Player_Warrior": (0, 0, 255), "Player_Tank": (0, 100, 100),
+    "Bandit_Razor": (255, 100, 0), "Bandit_Madman": (255, 0, 100), "Bandit_Archer": (100, 255, 0), "Bandit_Tank": (100, 0, 100),
+    "Bandit_King": (255, 165, 0),
+    "Zombie_Melee": (255, 0, 0), "Zombie_Archer": (0, 255, 0), "Zombie_Tank": (100, 0, 100), "Zombie_Assassin": (255, 255, 0), "Zombie_Farmer": (0, 255, 255),
+    "Undead_Axeman": (128, 0, 0), "Undead_King": (128, 128, 0), "Undead_Mage": (128, 0, 128), "Undead_Samurai": (0, 128, 128), "Undead_Warrior": (128, 128, 128)
+}
+
+
+class BuildCounter:
+    """Counts mask builds so steady-state rebuilds can be checked against zero."""
+
+    def __init__(self):
+        self.total = 0
+        self.window_count = 0
+        self.window_start = 0
+        self.rate = 0.0
+
+    def record(self):
+        self.total += 1
+        self.window_count += 1
+
+    def per_second(self):
+        now = pygame.time.get_ticks()
+        elapsed = now - self.window_start
+        if elapsed >= 1000:
+            self.rate = self.window_count * 1000 / elapsed
+            self.window_count = 0
+            self.window_start = now
+        return self.rate
+
+
+mask_builds = BuildCounter()
+
+
+def build_mask(surface):
+    mask_builds.record()
+    return pygame.mask.from_surface(surface)
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def faction_folder(faction):
+    faction_name = faction if isinstance(faction, str) else faction.name
+    return faction_name.capitalize()
+
+
+class AnimationRegistry:
+    """
+    Process-wide cache of decoded and scaled unit animations.
+
+    Each (faction, unit name, scale) spritesheet is decoded once; every unit of that
+    type shares the same read-only mapping of state -> tuple of frames. Mirrored
+    (left-facing) sets are flipped once on first request and cached alongside, as
+    are the per-frame collision masks for either facing.
+
+    Frames come from the baked atlas when one is present; those are trimmed, and
+    `get_offsets` gives where each frame sits inside the full-size cell.
+    """
+
+    def __init__(self):
+        self.cache = {}
+        self.offsets = {}
+        self.masks = {}
+        self.missing_spritesheets = set()
+        # Headless runs skip decoding and use blank full-length animations
+        self.headless = False
+
+    def get(self, faction, unit_name, scale_factor=1.0, mirrored=False):
+        key = (faction_folder(faction), unit_name, scale_factor, mirrored)
+        animations = self.cache.get(key)
+        if animations is None:
+            if mirrored:
+                animations, offsets = self.mirror(self.get(faction, unit_name, scale_factor),
+                                                  self.get_offsets(faction, unit_name, scale_factor),
+                                                  int(FRAME_WIDTH * scale_factor))
+            else:
+                animations, offsets = self.load(key[0], unit_name, scale_factor)
+            self.cache[key] = MappingProxyType(animations)
+            self.offsets[key] = MappingProxyType(offsets)
+            animations = self.cache[key]
+        return animations
+
+    def get_offsets(self, faction, unit_name, scale_factor=1.0, mirrored=False):
+        self.get(faction, unit_name, scale_factor, mirrored)
+        return self.offsets[(faction_folder(faction), unit_name, scale_factor, mirrored)]
+
+    def load(self, folder, unit_name, scale_factor):
+        size = (int(FRAME_WIDTH * scale_factor), int(FRAME_HEIGHT * scale_factor))
+        if self.headless:
+            return self.placeholder_animations(size)
+
+        baked = atlas.animation(folder, unit_name, scale_factor)
+        if baked:
+            return baked
+
+        spritesheet_path = f"assets/sprites/{folder}/{unit_name}.png"
+
+        if spritesheet_path in self.missing_spritesheets:
+            return self.default_animations(unit_name, size)
+
+        try:
+            spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
+        except Exception:
+            self.missing_spritesheets.add(spritesheet_path)
+            return self.default_animations(unit_name, size)
+
+        animations = {}
+        for state, row in STATE_ROWS.items():
+            frames = []
+            for i in range(FRAMES_PER_STATE):
+                x = i * FRAME_WIDTH
+                y = row * FRAME_HEIGHT
+                if x + FRAME_WIDTH <= spritesheet.get_width() and y + FRAME_HEIGHT <= spritesheet.get_height():
+                    frame = spritesheet.subsurface((x, y, FRAME_WIDTH, FRAME_HEIGHT))
+                    frames.append(pygame.transform.smoothscale(frame, size))
+            animations[state] = tuple(frames) if frames else (pygame.Surface(size),)
+        animations["hurt"] = (animations["die"][0],)
+        return animations, {state: ((0, 0),) * len(frames) for state, frames in animations.items()}
+
+    def get_masks(self, faction, unit_name, scale_factor=1.0, mirrored=False):
+        key = (faction_folder(faction), unit_name, scale_factor, mirrored)
+        masks = self.masks.get(key)
+        if masks is None:
+            animations = self.get(faction, unit_name, scale_factor, mirrored)
+            built = {}
+            for frame in {frame for frames in animations.values() for frame in frames}:
+                built[frame] = build_mask(frame)
+            masks = MappingProxyType({state: tuple(built[frame] for frame in frames) for state, frames in animations.items()})
+            self.masks[key] = masks
+        return masks
+
+    def mirror(self, animations, offsets, cell_width):
+        flipped = {}
+        for frame in {frame for frames in animations.values() for frame in frames}:
+            flipped[frame] = pygame.transform.flip(frame, True, False)
+        mirrored_animations = {state: tuple(flipped[frame] for frame in frames) for state, frames in animations.items()}
+        # A trimmed frame flips around the full cell, not around its own bounds
+        mirrored_offsets = {state: tuple((cell_width - x - frame.get_width(), y) for frame, (x, y) in zip(frames, offsets[state]))
+                            for state, frames in animations.items()}
+        return mirrored_animations, mirrored_offsets
+
+    def default_animations(self, unit_name, size):
+        default_frame = pygame.Surface(size)
+        default_frame.fill(DEFAULT_COLORS.get(unit_name, (255, 255, 255)))
+        states = ["idle", "run", "attack", "die", "hurt"]
+        return {state: (default_frame,) for state in states}, {state: ((0, 0),) for state in states}
+
+    def placeholder_animations(self, size):
+        """Blank frames with a full sheet's frame counts, so attack hits and death timing match real sprites."""
+        frame = pygame.Surface(size)
+        animations = {state: (frame,) * FRAMES_PER_STATE for state in STATE_ROWS}
+        animations["hurt"] = (frame,)
+        return animations, {state: ((0, 0),) * len(frames) for state, frames in animations.items()}
+
+    def evict_faction(self, faction):
+        folder = faction_folder(faction)
+        for cache in (self.cache, self.offsets, self.masks):
+            for key in [key for key in cache if key[0] == folder]:
+                del cache[key]
+        atlas.release(folder)
+
+    def retain_factions(self, factions):
+        """Evict every cached faction that is not in `factions`."""
+        keep = {faction_folder(faction) for faction in factions}
+        for folder in {key[0] for key in self.cache} - keep:
+            self.evict_faction(folder)
+
+    def resident_bytes(self):
+        """Approximate decoded bytes held per faction folder: frames, mirrored frames, masks and atlas pages."""
+        report = {}
+        for key, animations in self.cache.items():
+            # Frames cut from an atlas page are views; the page itself is counted below
+            frames = {frame for frames in animations.values() for frame in frames if frame.get_parent() is None}
+            report[key[0]] = report.get(key[0], 0) + sum(surface_bytes(frame) for frame in frames)
+        for key, masks in self.masks.items():
+            unique = {id(mask): mask for states in masks.values() for mask in states}.values()
+            report[key[0]] = report.get(key[0], 0) + sum(mask.get_size()[0] * mask.get_size()[1] // 8 for mask in unique)
+        for group, size in atlas.resident_bytes().items():
+            if group in report:
+                report[group] += size
+        return report
+
+    def clear(self):
+        self.cache.clear()
+        self.offsets.clear()
+        self.masks.clear()
+
+
+animation_registry = AnimationRegistry()
\ No newline at end of file
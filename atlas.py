@@ -0,0 +1,99 @@
+import json
+import pygame
+
+ATLAS_DIR = "assets/atlas"
+MANIFEST_PATH = f"{ATLAS_DIR}/manifest.json"
+MANIFEST_VERSION = 1
+
+
+def animation_key(folder, unit_name, scale_factor):
+    return f"{folder}/{unit_name}@{scale_factor:g}"
+
+
+class Atlas:
+    """
+    Reader for the sprite atlas written by bake_atlas.py.
+
+    Pages are grouped by faction (plus an "images" group) and loaded on first use, so
+    releasing a group frees its pages. Every lookup returns None when no manifest was
+    baked or the entry is missing, and callers fall back to the source images.
+    """
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self.manifest = None
+        self.manifest_loaded = False
+        self.pages = {}
+
+    def load_manifest(self):
+        if not self.manifest_loaded:
+            self.manifest_loaded = True
+            try:
+                with open(self.manifest_path) as f:
+                    manifest = json.load(f)
+                if manifest.get("version") == MANIFEST_VERSION:
+                    self.manifest = manifest
+            except Exception:
+                self.manifest = None
+        return self.manifest
+
+    def page(self, index):
+        page = self.pages.get(index)
+        if page is None:
+            page = pygame.image.load(f"{ATLAS_DIR}/{self.manifest['pages'][index]['file']}").convert_alpha()
+            self.pages[index] = page
+        return page
+
+    def region(self, entry):
+        return self.page(entry["page"]).subsurface(entry["rect"])
+
+    def animation(self, folder, unit_name, scale_factor):
+        """Return ({state: frames}, {state: trim offsets}) for a baked unit, or None."""
+        manifest = self.load_manifest()
+        if not manifest:
+            return None
+        entry = manifest["animations"].get(animation_key(folder, unit_name, scale_factor))
+        if not entry:
+            return None
+        try:
+            animations = {}
+            offsets = {}
+            for state, frames in entry["states"].items():
+                animations[state] = tuple(self.region(frame) for frame in frames)
+                offsets[state] = tuple(tuple(frame["offset"]) for frame in frames)
+        except Exception:
+            return None
+        return animations, offsets
+
+    def image(self, path, size):
+        """Return the baked image for `path` at `size`, restored to its untrimmed size, or None."""
+        manifest = self.load_manifest()
+        if not manifest:
+            return None
+        entry = manifest["images"].get(path)
+        if not entry or tuple(entry["size"]) != tuple(size):
+            return None
+        try:
+            image = pygame.Surface(entry["size"], pygame.SRCALPHA)
+            image.blit(self.region(entry), entry["offset"])
+        except Exception:
+            return None
+        return image
+
+    def resident_bytes(self):
+        report = {}
+        for index, page in self.pages.items():
+            group = self.manifest["pages"][index]["group"]
+            report[group] = report.get(group, 0) + page.get_width() * page.get_height() * page.get_bytesize()
+        return report
+
+    def release(self, group):
+        manifest = self.load_manifest()
+        if not manifest:
+            return
+        for index, page in enumerate(manifest["pages"]):
+            if page["group"] == group:
+                self.pages.pop(index, None)
+
+
+atlas = Atlas()
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Bakes unit spritesheets and static images into trimmed atlas pages.
+
+    python bake_atlas.py [--page-size 2048] [--padding 1]
+
+Every unit sheet is sliced into its 192x192 cells, scaled to the unit's sprite_scale
+(288px for Bandit_King), trimmed to the opaque bounds and shelf-packed into pages
+grouped by faction. The manifest records page rects, trim offsets and per-state
+frame counts; AnimationRegistry, Showroom and SpriteStore read it at runtime.
+"""
+import argparse
+import json
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from animations import FRAME_WIDTH, FRAME_HEIGHT, FRAMES_PER_STATE, STATE_ROWS
+from atlas import ATLAS_DIR, MANIFEST_PATH, MANIFEST_VERSION, animation_key
+from units import UNIT_ROSTER
+
+IMAGES = {
+    "assets/images/arrow.png": (32, 16),
+    "assets/images/magicball.png": (32, 32),
+    "assets/images/seed.png": (51, 51),
+    "assets/images/Cart.png": (150, 150),
+}
+
+
+class Piece:
+    def __init__(self, surface, entry):
+        rect = surface.get_bounding_rect()
+        if rect.width == 0 or rect.height == 0:
+            rect = pygame.Rect(0, 0, 1, 1)
+        self.surface = surface.subsurface(rect).copy()
+        self.entry = entry
+        self.entry["offset"] = [rect.x, rect.y]
+        self.cell_pixels = surface.get_width() * surface.get_height()
+
+
+def slice_sheet(path, scale_factor):
+    spritesheet = pygame.image.load(path).convert_alpha()
+    size = (int(FRAME_WIDTH * scale_factor), int(FRAME_HEIGHT * scale_factor))
+    states = {}
+    for state, row in STATE_ROWS.items():
+        frames = []
+        for i in range(FRAMES_PER_STATE):
+            x = i * FRAME_WIDTH
+            y = row * FRAME_HEIGHT
+            if x + FRAME_WIDTH <= spritesheet.get_width() and y + FRAME_HEIGHT <= spritesheet.get_height():
+                cell = spritesheet.subsurface((x, y, FRAME_WIDTH, FRAME_HEIGHT))
+                frames.append(pygame.transform.smoothscale(cell, size))
+        states[state] = frames
+    return spritesheet, states
+
+
+def pack(pieces, page_size, padding):
+    """Shelf-pack pieces (tallest first); returns a list of (width, height, [(piece, x, y)]) pages."""
+    pages = []
+    placed = []
+    x = y = shelf_height = used_width = 0
+    for piece in sorted(pieces, key=lambda p: p.surface.get_height(), reverse=True):
+        width = piece.surface.get_width() + padding
+        height = piece.surface.get_height() + padding
+        if x + width > page_size:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        if y + height > page_size:
+            pages.append((used_width, y + shelf_height, placed))
+            placed = []
+            x = y = shelf_height = used_width = 0
+        placed.append((piece, x, y))
+        x += width
+        shelf_height = max(shelf_height, height)
+        used_width = max(used_width, x)
+    if placed:
+        pages.append((used_width, y + shelf_height, placed))
+    return pages
+
+
+def bake(page_size=2048, padding=1):
+    pygame.display.set_mode((1, 1))
+    groups = {}
+    manifest = {"version": MANIFEST_VERSION, "pages": [], "animations": {}, "images": {}}
+    stats = {"source_files": 0, "source_bytes": 0, "source_pixels": 0, "cell_pixels": 0, "trimmed_pixels": 0}
+
+    def add_source(path, surface):
+        stats["source_files"] += 1
+        stats["source_bytes"] += os.path.getsize(path)
+        stats["source_pixels"] += surface.get_width() * surface.get_height()
+
+    for faction, unit_types in UNIT_ROSTER.items():
+        for unit_type in unit_types:
+            path = f"assets/sprites/{faction}/{unit_type.name}.png"
+            try:
+                spritesheet, states = slice_sheet(path, unit_type.sprite_scale)
+            except Exception as e:
+                print(f"Skipping {path}: {e}")
+                continue
+            add_source(path, spritesheet)
+            entry = {"states": {}, "frame_counts": {}}
+            for state, frames in states.items():
+                entry["states"][state] = []
+                for frame in frames:
+                    piece = Piece(frame, {})
+                    groups.setdefault(faction, []).append(piece)
+                    entry["states"][state].append(piece.entry)
+                entry["frame_counts"][state] = len(frames)
+            if entry["states"].get("die"):
+                entry["states"]["hurt"] = [entry["states"]["die"][0]]
+            manifest["animations"][animation_key(faction, unit_type.name, unit_type.sprite_scale)] = entry
+
+    for path, size in IMAGES.items():
+        try:
+            image = pygame.image.load(path).convert_alpha()
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+            continue
+        add_source(path, image)
+        piece = Piece(pygame.transform.scale(image, size), {"size": list(size)})
+        groups.setdefault("images", []).append(piece)
+        manifest["images"][path] = piece.entry
+
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    baked_bytes = 0
+    page_pixels = 0
+    for group, pieces in groups.items():
+        for width, height, placed in pack(pieces, page_size, padding):
+            index = len(manifest["pages"])
+            file_name = f"{group.lower()}_{index}.png"
+            page = pygame.Surface((width, height), pygame.SRCALPHA)
+            for piece, x, y in placed:
+                page.blit(piece.surface, (x, y))
+                piece.entry["page"] = index
+                piece.entry["rect"] = [x, y, piece.surface.get_width(), piece.surface.get_height()]
+                stats["cell_pixels"] += piece.cell_pixels
+                stats["trimmed_pixels"] += piece.surface.get_width() * piece.surface.get_height()
+            pygame.image.save(page, f"{ATLAS_DIR}/{file_name}")
+            manifest["pages"].append({"file": file_name, "group": group, "size": [width, height]})
+            baked_bytes += os.path.getsize(f"{ATLAS_DIR}/{file_name}")
+            page_pixels += width * height
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+
+    print(f"Sources: {stats['source_files']} files, {stats['source_bytes']:,} bytes, {stats['source_pixels']:,} pixels decoded")
+    print(f"Atlas:   {len(manifest['pages'])} pages, {baked_bytes:,} bytes, {page_pixels:,} pixels decoded")
+    if stats["cell_pixels"]:
+        saved = 100 * (1 - stats["trimmed_pixels"] / stats["cell_pixels"])
+        print(f"Frames:  {stats['cell_pixels']:,} pixels untrimmed, {stats['trimmed_pixels']:,} trimmed ({saved:.1f}% less blit fill)")
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=2048)
+    parser.add_argument("--padding", type=int, default=1)
+    args = parser.parse_args()
+    bake(args.page_size, args.padding)
\ No newline at end of file
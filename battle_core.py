@@ -0,0 +1,334 @@
+"""
+Optional NumPy battle engine for very large battles.
+
+Each side's units live in parallel arrays (position, health, speed, cooldowns,
+state code, animation frame, target) and every tick runs as a handful of
+vectorized passes that mirror Unit.update_animation, Unit.take_damage and
+Unit.move: frame advance and the frame-7 hit, damage and death, nearest-target
+selection and attack start, then movement with same-side spacing, enemy contact
+and base contact. Unit objects can be attached as views; `sync_views` copies the
+arrays back onto them so Unit.draw works unchanged.
+
+Ranged units are resolved as hits on their attack frame instead of spawning
+projectiles. numpy is not part of the web build, so check `available()` first.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+IDLE, RUN, ATTACK, HURT, DIE = range(5)
+STATE_NAMES = ("idle", "run", "attack", "hurt", "die")
+
+FRAMES_PER_STATE = 14
+HIT_FRAME = 7
+BASE_FRAME_DELAY = 100
+UNIT_WIDTH = 120
+# Unit rects start 3px right of x during collision checks, as in check_*_collisions
+RECT_OFFSET = 3
+SPACING_PASSES = 3
+# Game only updates and indexes units inside this window
+SCREEN_LEFT = -192
+SCREEN_RIGHT = 1920
+NO_TARGET = -1
+BASE_TARGET = -2
+
+FLOAT_FIELDS = ("x", "health", "max_health", "attack_power", "attack_range", "speed",
+                "attack_cooldown", "attack_frame_delay", "hurt_duration")
+INT_FIELDS = ("last_attack", "last_update", "hurt_start", "state", "frame", "target",
+              "idle_frames", "run_frames", "attack_frames", "die_frames")
+# Animations whose lengths drive frame cycling, attack end and removal
+FRAME_COUNT_STATES = ("idle", "run", "attack", "die")
+
+
+def available():
+    return np is not None
+
+
+def on_screen(x):
+    return (x >= SCREEN_LEFT) & (x <= SCREEN_RIGHT)
+
+
+class Side:
+    """Struct-of-arrays storage for one direction's units; rows [0, count) are live."""
+
+    def __init__(self, direction, capacity=64):
+        self.direction = direction
+        self.count = 0
+        self.views = []
+        self.arrays = {}
+        for name in FLOAT_FIELDS:
+            self.arrays[name] = np.zeros(capacity, dtype=np.float64)
+        for name in INT_FIELDS:
+            self.arrays[name] = np.zeros(capacity, dtype=np.int64)
+
+    def __getattr__(self, name):
+        arrays = self.__dict__.get("arrays")
+        if arrays is None or name not in arrays:
+            raise AttributeError(name)
+        return arrays[name][:self.count]
+
+    def append(self, values, view):
+        capacity = len(self.arrays["x"])
+        if self.count == capacity:
+            for name, array in self.arrays.items():
+                grown = np.zeros(capacity * 2, dtype=array.dtype)
+                grown[:capacity] = array
+                self.arrays[name] = grown
+        for name, value in values.items():
+            self.arrays[name][self.count] = value
+        self.views.append(view)
+        self.count += 1
+
+    def compact(self, keep):
+        """Drop rows where `keep` is False; returns the old -> new row map (-1 for dropped rows)."""
+        remap = np.where(keep, np.cumsum(keep) - 1, NO_TARGET)
+        kept = int(keep.sum())
+        for name, array in self.arrays.items():
+            array[:kept] = array[:self.count][keep]
+        self.views = [view for view, k in zip(self.views, keep.tolist()) if k]
+        self.count = kept
+        return remap
+
+
+class BattleCore:
+    """
+    Two-sided battle on the single lane, stepped with `tick(now)` in game milliseconds.
+
+    `player_base` is attacked by the enemy side (direction -1) and `enemy_base` by
+    the player side; both need `x`, `get_rect()` and `take_damage()` like Base.
+    """
+
+    def __init__(self, player_base, enemy_base):
+        if np is None:
+            raise RuntimeError("battle_core requires numpy")
+        self.sides = {1: Side(1), -1: Side(-1)}
+        self.bases = {1: enemy_base, -1: player_base}
+        self.kills = {1: 0, -1: 0}
+
+    def add(self, direction, x, health, attack_power, speed, attack_cooldown, attack_range,
+            hurt_duration=200, now=0, view=None, frame_counts=None):
+        """Add one unit; `frame_counts` maps idle/run/attack/die to animation lengths (default 14)."""
+        frame_counts = frame_counts or {}
+        self.sides[direction].append({
+            "x": x, "health": health, "max_health": health, "attack_power": attack_power,
+            "attack_range": attack_range, "speed": speed, "attack_cooldown": attack_cooldown,
+            "attack_frame_delay": attack_cooldown / FRAMES_PER_STATE, "hurt_duration": hurt_duration,
+            "last_attack": 0, "last_update": now, "hurt_start": 0,
+            "state": IDLE, "frame": 0, "target": NO_TARGET,
+            **{f"{state}_frames": frame_counts.get(state, FRAMES_PER_STATE) for state in FRAME_COUNT_STATES},
+        }, view)
+
+    def add_unit(self, unit, now=0):
+        """Copy an existing Unit into the arrays and keep it as the drawing view."""
+        self.add(unit.direction, unit.x, unit.health, unit.attack_power, unit.speed, unit.attack_cooldown,
+                 unit.attack_range, unit.hurt_duration, now, unit,
+                 {state: len(unit.animations.get(state, ())) or 1 for state in FRAME_COUNT_STATES})
+        side = self.sides[unit.direction]
+        side.arrays["max_health"][side.count - 1] = unit.max_health
+
+    def unit_count(self):
+        return self.sides[1].count + self.sides[-1].count
+
+    def tick(self, now):
+        # Player units update before enemy units, as in Game.update, so each side's
+        # hits land before the other side animates and moves
+        for direction, side in self.sides.items():
+            opponent = self.sides[-direction]
+            self.apply_damage(opponent, self.animate(side, opponent, now), now)
+            self.act(side, opponent, now)
+        for direction, side in self.sides.items():
+            self.remove_dead(side, self.sides[-direction])
+
+    def animate(self, side, opponent, now):
+        """Frame advance as in Unit.update_animation; returns damage dealt to each opponent row."""
+        damage = np.zeros(opponent.count)
+        if not side.count:
+            return damage
+        state = side.state.copy()
+        frame = side.frame
+        delay = np.where(state == ATTACK, side.attack_frame_delay, BASE_FRAME_DELAY)
+        due = (now - side.last_update >= delay) & on_screen(side.x)
+        side.last_update[due] = now
+
+        attacking = due & (state == ATTACK)
+        frame[attacking] += 1
+        hits = attacking & (frame == HIT_FRAME)
+        target = side.target
+        unit_hits = hits & (target >= 0)
+        if unit_hits.any():
+            rows = target[unit_hits]
+            alive = opponent.state[rows] != DIE
+            np.add.at(damage, rows[alive], side.attack_power[unit_hits][alive])
+        base_damage = side.attack_power[hits & (target == BASE_TARGET)].sum()
+        base = self.bases[side.direction]
+        if base_damage and base.health > 0:
+            base.take_damage(float(base_damage))
+        finished = attacking & (frame >= side.attack_frames)
+        side.state[finished] = IDLE
+        frame[finished] = 0
+        target[finished] = NO_TARGET
+
+        hurt = due & (state == HURT)
+        frame[hurt] = 0
+        side.state[hurt & (now - side.hurt_start >= side.hurt_duration)] = IDLE
+
+        dying = due & (state == DIE)
+        frame[dying] = np.minimum(frame[dying] + 1, side.die_frames[dying] - 1)
+
+        for code, counts in ((IDLE, side.idle_frames), (RUN, side.run_frames)):
+            cycling = due & (state == code)
+            frame[cycling] = (frame[cycling] + 1) % counts[cycling]
+        return damage
+
+    def apply_damage(self, side, damage, now):
+        """Unit.take_damage for every row hit this tick."""
+        if not side.count:
+            return
+        hit = (damage > 0) & (side.state != DIE)
+        side.health[hit] -= damage[hit]
+        dead = hit & (side.health <= 0)
+        side.health[dead] = 0
+        side.state[dead] = DIE
+        side.frame[dead] = 0
+        side.target[dead] = NO_TARGET
+        hurt = hit & ~dead & (side.state != ATTACK)
+        side.state[hurt] = HURT
+        side.frame[hurt] = 0
+        side.hurt_start[hurt] = now
+
+    def act(self, side, opponent, now):
+        """Targeting and movement for every row that is not attacking or dying, as in Unit.move."""
+        if not side.count:
+            return
+        direction = side.direction
+        x = side.x
+        indexed = (side.state != DIE) & on_screen(x)
+        active = indexed & (side.state != ATTACK)
+
+        # Nearest indexed opponent within range, or the base when strictly closer
+        living = (opponent.state != DIE) & on_screen(opponent.x)
+        opponent_x = np.sort(opponent.x[living])
+        opponent_rows = np.flatnonzero(living)[np.argsort(opponent.x[living], kind="stable")]
+        target = np.full(side.count, NO_TARGET)
+        distance = np.full(side.count, np.inf)
+        if len(opponent_x):
+            right = np.searchsorted(opponent_x, x)
+            left = np.clip(right - 1, 0, len(opponent_x) - 1)
+            right = np.clip(right, 0, len(opponent_x) - 1)
+            left_distance = np.abs(x - opponent_x[left])
+            right_distance = np.abs(x - opponent_x[right])
+            use_left = left_distance <= right_distance
+            distance = np.where(use_left, left_distance, right_distance)
+            target = np.where(use_left, opponent_rows[left], opponent_rows[right])
+            target[distance > side.attack_range] = NO_TARGET
+            distance[distance > side.attack_range] = np.inf
+        base = self.bases[direction]
+        base_distance = np.abs(x - base.x)
+        to_base = (base_distance <= side.attack_range) & (base_distance < distance)
+        target[to_base] = BASE_TARGET
+
+        has_target = active & (target != NO_TARGET)
+        start = has_target & (now - side.last_attack >= side.attack_cooldown)
+        side.state[start] = ATTACK
+        side.frame[start] = 0
+        side.target[start] = target[start]
+        side.last_attack[start] = now
+
+        movers = active & ~has_target
+        if not movers.any():
+            return
+        desired = np.where(movers, x + side.speed * direction, x)
+        rect_left = desired + RECT_OFFSET
+
+        # Stop in front of the first overlapping opponent
+        contact = np.zeros(side.count, dtype=bool)
+        if len(opponent_x):
+            if direction == 1:
+                first = np.searchsorted(opponent_x, rect_left - UNIT_WIDTH, side="right")
+                ahead = opponent_x[np.clip(first, 0, len(opponent_x) - 1)]
+                contact = movers & (first < len(opponent_x)) & (ahead < rect_left + UNIT_WIDTH)
+                desired = np.where(contact, ahead - UNIT_WIDTH, desired)
+            else:
+                last = np.searchsorted(opponent_x, rect_left + UNIT_WIDTH, side="left") - 1
+                ahead = opponent_x[np.clip(last, 0, len(opponent_x) - 1)]
+                contact = movers & (last >= 0) & (ahead + UNIT_WIDTH > rect_left)
+                desired = np.where(contact, ahead + UNIT_WIDTH, desired)
+
+        # Stop at the opposing base
+        base_rect = base.get_rect()
+        at_base = movers & ~contact & (rect_left < base_rect.right) & (rect_left + UNIT_WIDTH > base_rect.left)
+        desired = np.where(at_base, x, desired)
+        stationary = ~movers | contact | at_base
+
+        # Same-side spacing: nobody passes the unit ahead of it. Working in travel
+        # coordinates (u = direction * x) from the front, a walking unit is capped at
+        # UNIT_WIDTH behind the one ahead; stationary units keep their place and start
+        # a new run, so the running minimum is taken per run.
+        order = np.flatnonzero(indexed)
+        order = order[np.argsort(-direction * x[order], kind="stable")]
+        u = direction * desired[order]
+        barrier = stationary[order]
+        barrier[0] = True
+        segment = np.cumsum(barrier)
+        rank = np.arange(len(order)) * UNIT_WIDTH
+        span = float(np.ptp(u)) + rank[-1] + 1
+        capped = np.minimum.accumulate(u + rank - segment * span) - rank + segment * span
+        chain = np.where(barrier, u, np.minimum(u, capped))
+
+        # As in check_*_collisions, a unit only reacts once its offset rect overlaps the
+        # one ahead. Behind a stationary unit, player units close up to it and enemy
+        # units hold position; behind a walking unit both are capped and keep running.
+        # Units update front first, so a stop propagates back through a blocked queue
+        # within one tick: a blocked unit halts when the first unblocked unit ahead of it
+        # is stationary.
+        # Halted enemy units keep their old place rather than the capped one, which
+        # shifts the units behind them; a few passes settle that.
+        positions = np.arange(len(order))
+        new_u = chain
+        for _ in range(SPACING_PASSES):
+            ahead = np.roll(new_u, 1)
+            blocked = ~barrier & (u > ahead - (UNIT_WIDTH + direction * RECT_OFFSET))
+            queue_head = np.maximum.accumulate(np.where(blocked, 0, positions))
+            behind_stationary = blocked & stationary[order][queue_head]
+            if direction == 1:
+                resolved = np.where(behind_stationary, ahead - UNIT_WIDTH, np.minimum(u, ahead - UNIT_WIDTH))
+            else:
+                resolved = np.where(behind_stationary, direction * x[order], np.minimum(u, ahead - UNIT_WIDTH))
+            new_u = np.where(blocked, resolved, u)
+        # A unit capped behind a slower walking one permanently takes its speed
+        following = order[blocked & ~behind_stationary]
+        if len(following):
+            ahead_speed = np.roll(side.speed[order], 1)[blocked & ~behind_stationary]
+            side.speed[following] = np.minimum(side.speed[following], ahead_speed)
+        new_x = x.copy()
+        new_x[order] = direction * new_u
+        halted = np.zeros(side.count, dtype=bool)
+        halted[order] = behind_stationary
+        side.x[movers] = new_x[movers]
+        walking = movers & (side.state != HURT)
+        side.state[walking & (contact | at_base | halted)] = IDLE
+        side.state[walking & ~(contact | at_base | halted)] = RUN
+
+    def remove_dead(self, side, opponent):
+        if not side.count:
+            return
+        finished = (side.state == DIE) & (side.frame >= side.die_frames - 1)
+        if not finished.any():
+            return
+        self.kills[-side.direction] += int(finished.sum())
+        remap = side.compact(~finished)
+        targets = opponent.target
+        on_units = targets >= 0
+        targets[on_units] = remap[targets[on_units]]
+
+    def sync_views(self):
+        """Copy positions, health, states and frames back onto the attached Unit views."""
+        for side in self.sides.values():
+            for view, x, health, state, frame in zip(side.views, side.x.tolist(), side.health.tolist(),
+                                                      side.state.tolist(), side.frame.tolist()):
+                if view is not None:
+                    view.x = x
+                    view.health = health
+                    view.state = STATE_NAMES[state]
+                    view.frame = frame
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Hit-rate parity and tick cost of predicted arrows against the per-tick path.
+
+    python benchmarks/arrow_prediction.py [--levels 1,8,13] [--seeds 3] [--ticks 7200] [--sprites]
+
+Volleys: a line of archers looses the same shots in every mode, at a fixed rate,
+at a row of targets that walk the lane and stop now and then. Each shot's damage
+is its shot number, so hits compare shot by shot with the per-tick path; this
+also times ProjectilePool.update with hundreds and thousands of arrows in the air.
+Battles: headless battles with an archer-heavy script, played in both modes with
+the same seeds. A battle diverges once any shot lands differently, so there the
+hit rates are compared in aggregate. Runs on the headless stand-in sprites unless
+--sprites loads the real art, whose masks make the exact test pixel-perfect.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import headless
+import pygame
+import projectiles
+from browser import set_quiet
+from headless import HeadlessGame, HeadlessProfile, RepeatingInput
+from projectiles import ARROW, ProjectilePool, projectile_pool
+from simclock import sim_clock
+from units import UNIT_ROSTER, Bandit_Tank
+
+# Shots loosed per tick; an arrow is in the air for about 50 ticks
+VOLLEY_RATES = [10, 40]
+VOLLEY_TICKS = 600
+# Targets stop for STOP_FOR ticks in every STOP_EVERY, so predictions have to be redone
+STOP_EVERY = 90
+STOP_FOR = 30
+BATTLE_SCRIPT = ["Archer", "Archer", "Warrior"]
+BATTLE_EVERY = 90
+
+
+class Target(Bandit_Tank):
+    """Never falls; the damage of a hit is the shot number, recorded in `landed`."""
+
+    __slots__ = ("landed",)
+
+    def take_damage(self, damage):
+        self.landed.add(int(damage))
+
+
+def make_targets(landed):
+    targets = [Target("Bandits", 1300 + i * 40) for i in range(10)]
+    for target in targets:
+        target.state = "run"
+        target.landed = landed
+    return targets
+
+
+def walk(targets, tick):
+    running = tick % STOP_EVERY >= STOP_FOR
+    for target in targets:
+        target.state = "run" if running else "idle"
+        if running:
+            target.x += target.speed * target.direction
+
+
+def volleys(per_tick, vectorized, predicted):
+    """Returns (ms per update, average arrows in the air, shots fired, set of shot numbers that landed)."""
+    pool = ProjectilePool(vectorized=vectorized, predicted=predicted)
+    pool.reset()
+    landed = set()
+    targets = make_targets(landed)
+    sim_clock.rng.seed(0)
+    shots = 0
+    in_air = 0
+    elapsed = 0.0
+    for tick in range(VOLLEY_TICKS):
+        for _ in range(per_tick):
+            pool.spawn_arrow(200 + shots % 400, 793, 1, targets[shots % len(targets)], shots)
+            shots += 1
+        walk(targets, tick)
+        in_air += len(pool)
+        pool.save_positions()
+        start = time.perf_counter()
+        pool.update()
+        elapsed += time.perf_counter() - start
+    return elapsed * 1000 / VOLLEY_TICKS, in_air // VOLLEY_TICKS, shots, landed
+
+
+def battle(level_number, seed, max_ticks, predicted):
+    """Returns (arrows fired, arrows landed, winner, ticks played)."""
+    projectile_pool.predicted = predicted
+    profile = HeadlessProfile(level_number, list(UNIT_ROSTER["Player"]))
+    game = HeadlessGame(level_number, profile, pygame.display.get_surface(), None, seed)
+    game.seeds = 10 ** 6
+    script = RepeatingInput(BATTLE_SCRIPT, BATTLE_EVERY)
+    tick = 0
+    while tick < max_ticks and not game.game_over:
+        for unit_type in script.spawns(tick):
+            game.spawn_unit(unit_type)
+        if game.is_paused_by_event():
+            headless.dismiss_dialogs(game)
+        game.step()
+        tick += 1
+    projectile_pool.predicted = False
+    winner = "timeout"
+    if game.game_over:
+        winner = "player" if game.won else "enemy"
+    return projectile_pool.fired[ARROW], projectile_pool.landed[ARROW], winner, tick
+
+
+def rate(landed, fired):
+    return 100 * landed / fired if fired else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--levels", default="1,8,13")
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--ticks", type=int, default=7200)
+    parser.add_argument("--sprites", action="store_true", help="load the real sprites instead of stand-ins")
+    args = parser.parse_args()
+    if args.sprites:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode((1, 1))
+        set_quiet(True)
+    else:
+        headless.init()
+
+    modes = [("loop", False, False)]
+    if projectiles.np is not None:
+        modes.append(("numpy", True, False))
+    modes.append(("predict", False, True))
+
+    print(f"{'in air':>6} {'mode':>7} {'ms/tick':>8} {'shots':>6} {'landed':>6} {'hit %':>6} {'differ':>6}")
+    for per_tick in VOLLEY_RATES:
+        reference = None
+        for name, vectorized, predicted in modes:
+            ms, in_air, shots, landed = volleys(per_tick, vectorized, predicted)
+            reference = landed if reference is None else reference
+            print(f"{in_air:>6} {name:>7} {ms:>8.2f} {shots:>6} {len(landed):>6} {rate(len(landed), shots):>6.2f} "
+                  f"{len(landed ^ reference):>6}")
+
+    print()
+    print(f"{'level':>5} {'seed':>4} {'mode':>7} {'fired':>6} {'landed':>6} {'hit %':>6} {'winner':>8} {'ticks':>6}")
+    totals = {False: [0, 0], True: [0, 0]}
+    for level_number in [int(level) for level in args.levels.split(",")]:
+        for seed in range(1, args.seeds + 1):
+            for predicted in (False, True):
+                fired, landed, winner, ticks = battle(level_number, seed, args.ticks, predicted)
+                totals[predicted][0] += fired
+                totals[predicted][1] += landed
+                print(f"{level_number:>5} {seed:>4} {'predict' if predicted else 'tick':>7} {fired:>6} {landed:>6} "
+                      f"{rate(landed, fired):>6.2f} {winner:>8} {ticks:>6}")
+    per_tick_rate = rate(totals[False][1], totals[False][0])
+    predicted_rate = rate(totals[True][1], totals[True][0])
+    print(f"Hit rate: {per_tick_rate:.2f}% per tick, {predicted_rate:.2f}% predicted "
+          f"({predicted_rate - per_tick_rate:+.2f} points)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
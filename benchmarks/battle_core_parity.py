@@ -0,0 +1,164 @@
+"""
+Runs identical scripted battles through the Unit objects and through battle_core.
+
+    python benchmarks/battle_core_parity.py [--ticks 3000]
+
+Both paths get the same spawn schedule and step the same fixed-rate sim_clock. The
+object path is the Unit-level loop from Game.update (update_animation, move, index
+update, removal); the core runs BattleCore.tick. Units are updated one at a time in the
+object path and in vectorized passes in the core, so per-unit traces drift apart;
+the script compares battle outcomes instead and exits non-zero when they disagree.
+Runs on the headless stand-in sprites, which have the real frame counts; a battle
+in which neither path kills anything or damages a base also fails, since both
+paths sitting idle would otherwise count as agreement.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import battle_core
+import headless
+from animations import animation_registry
+from buildings import Base
+from collisions import BattlefieldIndex
+from simclock import sim_clock
+from units import UNIT_ROSTER
+from units import (Player_PeasantUnit, Player_WarriorUnit, Player_TankUnit,
+                   Bandit_Razor, Bandit_Madman, Bandit_Tank, Zombie_Melee, Zombie_Tank)
+
+BUCKET_SIZE = 400
+PLAYER_SPAWN_X = 100
+ENEMY_SPAWN_X = 1920 - 100
+# Allowed relative difference in kills and base damage between the two paths
+TOLERANCE = 0.25
+
+BATTLES = [
+    {"name": "peasants vs razors", "player": [Player_PeasantUnit], "enemy": [Bandit_Razor], "every": 60, "waves": 20},
+    {"name": "mixed bandits", "player": [Player_PeasantUnit, Player_WarriorUnit, Player_TankUnit],
+     "enemy": [Bandit_Razor, Bandit_Madman, Bandit_Tank], "every": 45, "waves": 30},
+    {"name": "warriors vs peasants", "player": [Player_WarriorUnit], "enemy": [Bandit_Razor], "every": 90, "waves": 15,
+     "enemy_every": 180},
+    {"name": "tanks vs zombies", "player": [Player_TankUnit, Player_WarriorUnit], "enemy": [Zombie_Melee, Zombie_Tank], "every": 40, "waves": 40},
+]
+
+FACTIONS = {unit_type: faction for faction, unit_types in UNIT_ROSTER.items() for unit_type in unit_types}
+
+def frame_counts(unit_type):
+    """Animation lengths a Unit of this type gets, including 1-frame fallbacks for missing sheets."""
+    animations = animation_registry.get(FACTIONS[unit_type], unit_type.name, unit_type.sprite_scale)
+    return {state: len(frames) for state, frames in animations.items()}
+
+
+def make_bases():
+    player_base = Base(x=125, y=580, health=1000, sprite_path="assets/buildings/Player/Skin 1/player_base.png", is_player=True)
+    enemy_base = Base(x=1920 - 250, y=580, health=1000, sprite_path="assets/buildings/Enemy/Zombies/enemy_base.png", is_player=False)
+    return player_base, enemy_base
+
+
+def spawn_x(start, step, positions):
+    x = start
+    for other in positions:
+        if abs(x - other) < 120:
+            x += step
+    return x
+
+
+def schedule(battle, tick):
+    """Unit types spawned on `tick`, as (direction, unit_type) pairs."""
+    spawns = []
+    for direction, roster, every in ((1, battle["player"], battle["every"]), (-1, battle["enemy"], battle.get("enemy_every", battle["every"]))):
+        wave = tick // every
+        if tick % every == 0 and wave < battle["waves"]:
+            spawns.append((direction, roster[wave % len(roster)]))
+    return spawns
+
+
+def outcome(player_base, enemy_base, player_kills, enemy_kills, survivors):
+    winner = "player" if enemy_base.health <= 0 else "enemy" if player_base.health <= 0 else "none"
+    return {"winner": winner, "player_kills": player_kills, "enemy_kills": enemy_kills,
+            "player_base_damage": 1000 - player_base.health, "enemy_base_damage": 1000 - enemy_base.health,
+            "survivors": survivors}
+
+
+def run_objects(battle, ticks):
+    sim_clock.reset()
+    player_base, enemy_base = make_bases()
+    players, enemies = [], []
+    kills = {1: 0, -1: 0}
+    for tick in range(ticks):
+        sim_clock.step()
+        for direction, unit_type in schedule(battle, tick):
+            own = players if direction == 1 else enemies
+            start = PLAYER_SPAWN_X if direction == 1 else ENEMY_SPAWN_X
+            x = spawn_x(start, -120 * direction, [u.x for u in own if u.state != "die"])
+            own.append(unit_type(FACTIONS[unit_type], x))
+        all_units = players + enemies
+        index = BattlefieldIndex(all_units, BUCKET_SIZE)
+        for unit in all_units:
+            if -192 <= unit.x <= 1920:
+                unit.update_animation()
+                unit.move(all_units, enemy_base, player_base, index)
+                index.update(unit)
+        for own, direction in ((players, 1), (enemies, -1)):
+            finished = [u for u in own if u.state == "die" and u.frame >= len(u.animations["die"]) - 1]
+            kills[-direction] += len(finished)
+            own[:] = [u for u in own if u not in finished]
+        if player_base.health <= 0 or enemy_base.health <= 0:
+            break
+    return outcome(player_base, enemy_base, kills[1], kills[-1], len(players) + len(enemies))
+
+
+def run_core(battle, ticks):
+    sim_clock.reset()
+    player_base, enemy_base = make_bases()
+    core = battle_core.BattleCore(player_base, enemy_base)
+    for tick in range(ticks):
+        sim_clock.step()
+        for direction, unit_type in schedule(battle, tick):
+            side = core.sides[direction]
+            living = side.x[side.state != battle_core.DIE].tolist()
+            start = PLAYER_SPAWN_X if direction == 1 else ENEMY_SPAWN_X
+            x = spawn_x(start, -120 * direction, living)
+            core.add(direction, x, unit_type.base_health, unit_type.base_attack, unit_type.base_speed,
+                     unit_type.base_attack_cooldown, unit_type.attack_range, unit_type.hurt_duration, sim_clock.now(),
+                     frame_counts=frame_counts(unit_type))
+        core.tick(sim_clock.now())
+        if player_base.health <= 0 or enemy_base.health <= 0:
+            break
+    return outcome(player_base, enemy_base, core.kills[1], core.kills[-1], core.unit_count())
+
+
+def close(a, b):
+    return abs(a - b) <= TOLERANCE * max(abs(a), abs(b), 10)
+
+
+def idle(result):
+    return not (result["player_kills"] or result["enemy_kills"] or result["player_base_damage"]
+                or result["enemy_base_damage"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=3000)
+    args = parser.parse_args()
+    if not battle_core.available():
+        print("numpy is not installed; battle_core is unavailable")
+        return 1
+    headless.init()
+
+    failures = 0
+    for battle in BATTLES:
+        objects = run_objects(battle, args.ticks)
+        core = run_core(battle, args.ticks)
+        ok = objects["winner"] == core["winner"] and all(close(objects[key], core[key]) for key in objects if key != "winner")
+        no_combat = idle(objects) and idle(core)
+        failures += no_combat or not ok
+        print(f"{battle['name']}: {'NO COMBAT' if no_combat else 'ok' if ok else 'MISMATCH'}")
+        for key in objects:
+            print(f"    {key:>20}: objects={objects[key]!s:>8} core={core[key]!s:>8}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
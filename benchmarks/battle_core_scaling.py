@@ -0,0 +1,67 @@
+"""
+Tick cost of battle_core at large unit counts.
+
+    python benchmarks/battle_core_scaling.py [--ticks 600]
+
+Fills both sides of the lane with evenly spaced units that march into each other,
+then times BattleCore.tick. The target is 5,000 units inside one 60 ticks/s frame.
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import battle_core
+from buildings import Base
+from units import Player_WarriorUnit, Bandit_Razor
+
+TICK_MS = 16
+FRAME_BUDGET_MS = 1000 / 60
+UNIT_COUNTS = [500, 1000, 2000, 5000, 10000]
+
+
+def make_core(count):
+    player_base = Base(x=125, y=580, health=10 ** 9, sprite_path="assets/buildings/Player/Skin 1/player_base.png", is_player=True)
+    enemy_base = Base(x=1920 - 250, y=580, health=10 ** 9, sprite_path="assets/buildings/Enemy/Zombies/enemy_base.png", is_player=False)
+    core = battle_core.BattleCore(player_base, enemy_base)
+    for direction, unit_type, start in ((1, Player_WarriorUnit, 150), (-1, Bandit_Razor, 1770)):
+        per_side = count // 2
+        for i in range(per_side):
+            # Packed over the whole screen so every unit is indexed and acts each tick
+            x = start + direction * (i * 1620 / per_side)
+            core.add(direction, x, unit_type.base_health, unit_type.base_attack, unit_type.base_speed,
+                     unit_type.base_attack_cooldown, unit_type.attack_range, unit_type.hurt_duration)
+    return core
+
+
+def measure(count, ticks):
+    core = make_core(count)
+    now = 0
+    elapsed = 0.0
+    for _ in range(ticks):
+        now += TICK_MS
+        start = time.perf_counter()
+        core.tick(now)
+        elapsed += time.perf_counter() - start
+    return elapsed * 1000 / ticks, core.unit_count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=600)
+    args = parser.parse_args()
+    if not battle_core.available():
+        print("numpy is not installed; battle_core is unavailable")
+        return 1
+
+    print(f"{'units':>6} {'ms/tick':>8} {'us/unit':>8} {'left':>6} {'60 tps':>7}")
+    for count in UNIT_COUNTS:
+        ms, left = measure(count, args.ticks)
+        print(f"{count:>6} {ms:>8.2f} {ms * 1000 / count:>8.2f} {left:>6} {'yes' if ms <= FRAME_BUDGET_MS else 'no':>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Per-tick cost of removing dead units and walking both sides.
+
+    python benchmarks/entity_lifecycle.py [--ticks 300]
+
+Keeps each side of the lane at a fixed unit count while a few units a tick finish
+dying, and times the removal two ways: the list rebuilds Game.update did before
+the entity registry (a comprehension per side, the enemy one filtering against
+the dead list), and EntityRegistry.collect_dead with swap removal. Then times a
+save_position pass over every unit three ways, on the lists each kind of removal
+left behind: through the concatenated lists as before, through the registry, and
+side list by side list as Game's per-tick loops do. Swap removal leaves a side out
+of allocation order, which costs the walk a little on its own.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import headless
+from entities import EntityRegistry, PLAYER, ENEMY
+from units import Player_WarriorUnit, Bandit_Razor
+
+UNIT_COUNTS = [100, 1000, 5000]
+DEATHS_PER_TICK = 5
+
+
+def make_unit(side, i):
+    return Player_WarriorUnit("Player", i % 900) if side == PLAYER else Bandit_Razor("Bandits", 1000 + i % 900)
+
+
+def kill(unit):
+    unit.state = "die"
+    unit.frame = len(unit.animations["die"]) - 1
+
+
+def rebuild(units, enemy_units):
+    units[:] = [unit for unit in units if not (unit.state == "die" and unit.frame >= len(unit.animations["die"]) - 1)]
+    dead_enemies = [enemy for enemy in enemy_units if enemy.state == "die" and enemy.frame >= len(enemy.animations["die"]) - 1]
+    enemy_units[:] = [enemy for enemy in enemy_units if enemy not in dead_enemies]
+    return dead_enemies
+
+
+def registry_removal(entities):
+    entities.collect_dead(PLAYER)
+    entities.collect_dead(ENEMY)
+    return entities.take_died()
+
+
+def measure(count, ticks, use_registry):
+    """Returns (ms per tick to remove the dead, the registry left at the end)."""
+    entities = EntityRegistry()
+    sides = entities.sides
+    add = entities.add if use_registry else lambda unit, side: sides[side].append(unit)
+    spawned = 0
+    removing = 0.0
+    for _ in range(ticks):
+        for side in (PLAYER, ENEMY):
+            while len(sides[side]) < count:
+                add(make_unit(side, spawned), side)
+                spawned += 1
+            # Spread the deaths over the list, as a battle's are
+            for i in range(DEATHS_PER_TICK):
+                kill(sides[side][(spawned * 7 + i * 131) % count])
+        start = time.perf_counter()
+        if use_registry:
+            registry_removal(entities)
+        else:
+            rebuild(*sides)
+        removing += time.perf_counter() - start
+    return removing * 1000 / ticks, entities
+
+
+def walk_concatenated(entities):
+    for unit in entities.sides[PLAYER] + entities.sides[ENEMY]:
+        unit.save_position()
+
+
+def walk_registry(entities):
+    for unit in entities:
+        unit.save_position()
+
+
+def walk_sides(entities):
+    for side in entities.sides:
+        for unit in side:
+            unit.save_position()
+
+
+def timed_walk(walk, entities, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        walk(entities)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=300)
+    args = parser.parse_args()
+    headless.init()
+
+    print(f"{'units/side':>10} {'mode':>9} {'remove ms':>10} {'walk: concat':>12} {'registry':>9} {'sides':>7}")
+    for count in UNIT_COUNTS:
+        for use_registry in (False, True):
+            remove_ms, entities = measure(count, args.ticks, use_registry)
+            walks = [timed_walk(walk, entities, args.ticks) for walk in (walk_concatenated, walk_registry, walk_sides)]
+            print(f"{count:>10} {'registry' if use_registry else 'rebuild':>9} {remove_ms:>10.3f} {walks[0]:>12.3f} "
+                  f"{walks[1]:>9.3f} {walks[2]:>7.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
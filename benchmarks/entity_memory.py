@@ -0,0 +1,99 @@
+"""
+Memory held per live entity: units, seed drops and projectiles.
+
+    python benchmarks/entity_memory.py [--count 2000]
+
+Builds `count` of each entity on the headless stand-in sprites, once one of each
+has warmed the shared animation, sprite and sound caches, and reports the bytes
+tracemalloc sees allocated per entity. The "dict" column holds the same state
+in instance __dict__s, with the constants entities used to copy onto themselves,
+as they were kept before entities had __slots__. Projectiles live in the pool's
+arrays, so theirs is the pool's storage per slot.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import headless
+import projectiles
+from game_logic import SeedDrop
+from projectiles import ProjectilePool
+from units import UNIT_ROSTER, Unit
+
+# Class constants each instance used to carry a copy of
+INSTANCE_COPIES = {
+    Unit: ("y", "scale_factor", "base_frame_delay", "base_attack_cooldown"),
+    SeedDrop: ("y", "lifetime"),
+}
+
+
+def state_names(entity):
+    if hasattr(entity, "__dict__"):
+        return list(vars(entity))
+    names = [name for cls in type(entity).__mro__ for name in getattr(cls, "__slots__", ())]
+    for cls, copies in INSTANCE_COPIES.items():
+        if isinstance(entity, cls):
+            names += copies
+    return names
+
+
+def as_plain(entity, plain_types={}):
+    """A copy of `entity` whose state, and its health bar's, is held in an instance __dict__."""
+    # One class per entity type, so instances share dict keys as the entity classes' own did
+    plain_type = plain_types.get(type(entity))
+    if plain_type is None:
+        plain_type = plain_types[type(entity)] = type(type(entity).__name__, (), {})
+    plain = plain_type()
+    for name in state_names(entity):
+        # Registry slots stay unset outside a battle
+        if not hasattr(entity, name):
+            continue
+        value = getattr(entity, name)
+        if hasattr(type(value), "__slots__") and not isinstance(value, (tuple, str)):
+            value = as_plain(value)
+        setattr(plain, name, value)
+    return plain
+
+
+def per_entity(build, count):
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used / count, kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args()
+    headless.init()
+    count = args.count
+
+    print(f"{'entity':>18} {'bytes':>8} {'dict':>8}")
+    for faction, unit_types in UNIT_ROSTER.items():
+        for unit_type in unit_types:
+            unit_type(faction, 0)
+            slotted, units = per_entity(lambda: [unit_type(faction, i) for i in range(count)], count)
+            plain, _ = per_entity(lambda: [as_plain(unit) for unit in units], count)
+            print(f"{unit_type.name:>18} {slotted:>8.0f} {plain:>8.0f}")
+
+    SeedDrop(0, 0, 1)
+    slotted, drops = per_entity(lambda: [SeedDrop(i, 0, 1) for i in range(count)], count)
+    plain, _ = per_entity(lambda: [as_plain(drop) for drop in drops], count)
+    print(f"{'SeedDrop':>18} {slotted:>8.0f} {plain:>8.0f}")
+
+    modes = [False, True] if projectiles.np is not None else [False]
+    for vectorized in modes:
+        pooled, _ = per_entity(lambda: ProjectilePool(count, vectorized=vectorized), count)
+        print(f"{'projectile (' + ('numpy' if vectorized else 'list') + ')':>18} {pooled:>8.0f} {'-':>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
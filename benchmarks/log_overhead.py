@@ -0,0 +1,76 @@
+"""
+Simulation speed with game logging off, buffered and echoed to the console.
+
+    python benchmarks/log_overhead.py [--level 5] [--ticks 6000] [--seed 1] [--repeat 3]
+
+Plays the same headless battle (level 5 runs through the Bandit King, cart and
+surrender messages) with each logging setup and reports ticks per second and
+messages kept, best of --repeat runs. "console" keeps and echoes every message, as the game did
+before gamelog; its echo goes to os.devnull here, so the browser's cost of
+crossing into JavaScript comes on top of it. "default" is what the game runs
+with: info and up, echoed. "off" keeps nothing.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import headless
+import pygame
+from browser import js
+from gamelog import log, DEBUG, INFO, OFF
+from headless import HeadlessGame, HeadlessProfile, RepeatingInput
+from units import UNIT_ROSTER
+
+# name, kept level, echo level
+SETUPS = [("console", DEBUG, DEBUG), ("buffer", DEBUG, OFF), ("default", INFO, INFO), ("off", OFF, OFF)]
+SCRIPT = ["Warrior", "Archer", "Tank"]
+EVERY = 60
+
+
+def run(level_number, ticks, seed):
+    """Returns (ticks per second, messages kept) for one battle under the current log setup."""
+    profile = HeadlessProfile(level_number, list(UNIT_ROSTER["Player"]))
+    game = HeadlessGame(level_number, profile, pygame.display.get_surface(), None, seed)
+    game.seeds = 10 ** 6
+    script = RepeatingInput(SCRIPT, EVERY)
+    kept = 0
+    played = 0
+    start = time.perf_counter()
+    while played < ticks and not game.game_over:
+        for unit_type in script.spawns(played):
+            game.spawn_unit(unit_type)
+        if game.is_paused_by_event():
+            headless.dismiss_dialogs(game)
+        kept += len(log.buffer)
+        log.clear()
+        game.step()
+        played += 1
+    kept += len(log.buffer)
+    return played / (time.perf_counter() - start), kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--level", type=int, default=5)
+    parser.add_argument("--ticks", type=int, default=6000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    headless.init()
+
+    with open(os.devnull, "w") as devnull:
+        js.console.log = lambda *values: print(*values, file=devnull)
+        print(f"{'logging':>8} {'ticks/s':>8} {'messages':>8} {'speedup':>8}")
+        baseline = None
+        for name, level, echo_level in SETUPS:
+            log.set_level(level, echo_level)
+            rate, kept = max(run(args.level, args.ticks, args.seed) for _ in range(args.repeat))
+            baseline = baseline or rate
+            print(f"{name:>8} {rate:>8.0f} {kept:>8} {rate / baseline:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
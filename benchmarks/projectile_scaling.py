@@ -0,0 +1,79 @@
+"""
+Tick cost of the projectile pool with thousands of shots in flight.
+
+    python benchmarks/projectile_scaling.py [--ticks 300]
+
+A line of archers and mages keeps a fixed number of arrows and magic balls in
+the air at a row of targets, topping the pool back up every tick, and times
+ProjectilePool.update with numpy (when installed) and with the plain loop the
+web build runs. The target is 2,000 projectiles inside one 60 ticks/s frame.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import headless
+import projectiles
+from projectiles import ProjectilePool
+from units import Bandit_Tank
+
+FRAME_BUDGET_MS = 1000 / 60
+IN_FLIGHT = [500, 2000, 5000]
+# One shot in this many is a magic ball
+MAGIC_BALL_EVERY = 5
+
+
+def make_targets():
+    targets = [Bandit_Tank("Bandits", 1300 + i * 40) for i in range(10)]
+    for target in targets:
+        target.health = target.max_health = 10 ** 9
+    return targets
+
+
+def top_up(pool, count, targets, shots):
+    while len(pool) < count:
+        target = targets[shots % len(targets)]
+        x = 200 + shots % 400
+        if shots % MAGIC_BALL_EVERY:
+            pool.spawn_arrow(x, 793, 1, target, 1)
+        else:
+            pool.spawn_magic_ball(x, 793, 1, target, 1)
+        shots += 1
+    return shots
+
+
+def measure(count, ticks, vectorized):
+    pool = ProjectilePool(vectorized=vectorized)
+    pool.reset()
+    targets = make_targets()
+    shots = top_up(pool, count, targets, 0)
+    elapsed = 0.0
+    for _ in range(ticks):
+        pool.save_positions()
+        start = time.perf_counter()
+        pool.update()
+        elapsed += time.perf_counter() - start
+        shots = top_up(pool, count, targets, shots)
+    return elapsed * 1000 / ticks, shots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=300)
+    args = parser.parse_args()
+    headless.init()
+    modes = [False, True] if projectiles.np is not None else [False]
+
+    print(f"{'in flight':>9} {'mode':>6} {'ms/tick':>8} {'shots':>7} {'60 tps':>7}")
+    for count in IN_FLIGHT:
+        for vectorized in modes:
+            ms, shots = measure(count, args.ticks, vectorized)
+            print(f"{count:>9} {'numpy' if vectorized else 'loop':>6} {ms:>8.2f} {shots:>7} "
+                  f"{'yes' if ms <= FRAME_BUDGET_MS else 'no':>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
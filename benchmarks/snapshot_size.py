@@ -0,0 +1,84 @@
+"""
+Size and latency of battle snapshots.
+
+    python benchmarks/snapshot_size.py [--repeat 50]
+
+Plays a headless level 1 battle for a few seconds so units are mid-fight, pads
+both sides out to each unit count, and adds arrows in the air and seed drops on
+the ground at a tenth of the unit count each, since that early in a battle
+archers are rarely in range and few kills have dropped seeds. Then it times
+snapshot.save, snapshot.restore and the compressed text form stored in the
+player data. The target is a sub-millisecond save at 500 units; the times depend
+on the machine, as the bare struct packing of 500 units alone is close to 1 ms on
+a slow one.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import headless
+import pygame
+import snapshot
+from game_logic import SeedDrop
+from entities import PLAYER, ENEMY
+from headless import HeadlessGame, HeadlessProfile, RepeatingInput
+from units import UNIT_ROSTER, Player_WarriorUnit, Bandit_Razor
+
+UNIT_COUNTS = [50, 500, 5000]
+WARMUP_TICKS = 600
+# Units per arrow in flight and per seed drop on the ground
+UNITS_PER_ARROW = 10
+UNITS_PER_DROP = 10
+
+
+def make_game(count):
+    profile = HeadlessProfile(1, list(UNIT_ROSTER["Player"]))
+    game = HeadlessGame(1, profile, pygame.display.get_surface(), None, count)
+    game.seeds = 10 ** 6
+    script = RepeatingInput(["Peasant", "Warrior", "Archer"], 30)
+    for tick in range(WARMUP_TICKS):
+        for unit_type in script.spawns(tick):
+            game.spawn_unit(unit_type)
+        game.step()
+    rng = random.Random(count)
+    while len(game.units) + len(game.enemy_units) < count:
+        game.entities.add(Player_WarriorUnit("Player", rng.uniform(0, 900)), PLAYER)
+        game.entities.add(Bandit_Razor("Bandits", rng.uniform(1000, 1800)), ENEMY)
+    while game.enemy_units and len(game.projectiles) < count // UNITS_PER_ARROW:
+        target = rng.choice(game.enemy_units)
+        game.projectiles.spawn_arrow(rng.uniform(200, 900), 793, 1, target, 15)
+    while len(game.seed_drops) < count // UNITS_PER_DROP:
+        game.seed_drops.append(SeedDrop(rng.uniform(1000, 1800), SeedDrop.y, 1))
+    return game
+
+
+def timed(repeat, function, *args):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function(*args)
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    headless.init()
+
+    print(f"{'units':>6} {'arrows':>6} {'drops':>6} {'bytes':>8} {'text':>8} {'save ms':>8} {'text ms':>8} {'restore ms':>10}")
+    for count in UNIT_COUNTS:
+        game = make_game(count)
+        save_ms, blob = timed(args.repeat, snapshot.save, game)
+        text_ms, text = timed(args.repeat, snapshot.to_text, blob)
+        restore_ms, _ = timed(max(1, args.repeat // 10), snapshot.restore, make_game(0), blob)
+        units = len(game.units) + len(game.enemy_units)
+        print(f"{units:>6} {len(game.projectiles):>6} {len(game.seed_drops):>6} {len(blob):>8} {len(text):>8} {save_ms:>8.3f} {text_ms:>8.3f} "
+              f"{restore_ms:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Unit-count scaling of the per-tick movement and targeting pass.
+
+    python benchmarks/tick_scaling.py [--ticks 60]
+
+For each unit count, runs the same lane of player and enemy units two ways:
+"rebuild" rebuilds the spatial buckets for every move and target query, as the tick
+did before BattlefieldIndex; "index" builds the index once per tick and updates
+moved units in place. Prints the mean cost per tick and per unit.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+from buildings import Base
+from collisions import BattlefieldIndex, find_closest_target
+from units import Player_WarriorUnit, Bandit_Razor
+
+BUCKET_SIZE = 400
+UNIT_COUNTS = [25, 50, 100, 200, 400, 800]
+
+
+def make_battle(count):
+    random.seed(count)
+    player_base = Base(x=125, y=580, health=1000, sprite_path="assets/buildings/Player/Skin 1/player_base.png", is_player=True)
+    enemy_base = Base(x=1920 - 250, y=580, health=1000, sprite_path="assets/buildings/Enemy/Zombies/enemy_base.png", is_player=False)
+    units = [Player_WarriorUnit("Player", random.uniform(0, 900)) for _ in range(count // 2)]
+    units += [Bandit_Razor("Bandits", random.uniform(1000, 1900)) for _ in range(count - count // 2)]
+    return units, player_base, enemy_base
+
+
+def run_tick(units, player_base, enemy_base, rebuild):
+    index = BattlefieldIndex(units, BUCKET_SIZE)
+    for unit in units:
+        base = enemy_base if unit.direction == 1 else player_base
+        if rebuild:
+            index = BattlefieldIndex(units, BUCKET_SIZE)
+        unit.move(units, enemy_base, player_base, index)
+        if rebuild:
+            index = BattlefieldIndex(units, BUCKET_SIZE)
+        else:
+            index.update(unit)
+        find_closest_target(unit, index, base)
+
+
+def measure(count, ticks, rebuild):
+    units, player_base, enemy_base = make_battle(count)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        run_tick(units, player_base, enemy_base, rebuild)
+        # Keep the lane moving instead of settling into attacks
+        for unit in units:
+            unit.state = "run"
+    return (time.perf_counter() - start) * 1000 / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=60)
+    args = parser.parse_args()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'units':>6} {'rebuild ms':>11} {'index ms':>9} {'rebuild us/unit':>16} {'index us/unit':>14}")
+    for count in UNIT_COUNTS:
+        rebuild = measure(count, args.ticks, True)
+        indexed = measure(count, args.ticks, False)
+        print(f"{count:>6} {rebuild:>11.2f} {indexed:>9.2f} {rebuild * 1000 / count:>16.1f} {indexed * 1000 / count:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,15 @@
+from types import SimpleNamespace
+
+# pygbag provides `js` in the browser; desktop and headless runs log to stdout instead
+try:
+    import js
+    IN_BROWSER = True
+except ImportError:
+    js = SimpleNamespace(console=SimpleNamespace(log=print))
+    IN_BROWSER = False
+
+
+def set_quiet(quiet):
+    """Silence console logging outside the browser (headless batches would print every spawn)."""
+    if not IN_BROWSER:
+        js.console.log = (lambda *args: None) if quiet else print
\ No newline at end of file
@@ -1,5 +1,7 @@
 # Version 2.5
 import pygame
+from healthbars import HealthBar
+from sprites import load_image
 
 class Base:
     base_health = 1000
@@ -12,11 +14,12 @@ class Base:
         self.is_player = is_player
         self.sprite_path = sprite_path
         self.destroyed = False
+        self.health_bar = HealthBar(144, 12, (0, 255, 0) if is_player else (255, 0, 0))
         self.load_sprites()
 
     def load_sprites(self):
         try:
-            self.sprite = pygame.image.load(self.sprite_path).convert_alpha()
+            self.sprite = load_image(self.sprite_path)
             self.sprite = pygame.transform.scale(self.sprite, (150, 300))
             if self.is_player and "base" in self.sprite_path.lower():
                 self.sprite = pygame.transform.flip(self.sprite, True, False)
@@ -24,7 +27,7 @@ class Base:
                 destroyed_path = ("assets/buildings/Player/Skin 1/player_base_destroyed.png" 
                                  if "base" in self.sprite_path.lower() 
                                  else "assets/buildings/Player/Skin 1/player_tower_destroyed.png")
-                self.destroyed_sprite = pygame.image.load(destroyed_path).convert_alpha()
+                self.destroyed_sprite = load_image(destroyed_path)
                 self.destroyed_sprite = pygame.transform.scale(self.destroyed_sprite, (150, 300))
                 if "base" in self.sprite_path.lower():
                     self.destroyed_sprite = pygame.transform.flip(self.destroyed_sprite, True, False)
@@ -47,12 +50,6 @@ class Base:
     def draw(self, screen):
         screen.blit(self.destroyed_sprite if self.destroyed else self.sprite, (self.x, self.y))
         if not (self.is_player and "tower" in self.sprite_path.lower()):
-            bar_width = 144
-            bar_height = 12
-            health_ratio = self.health / self.max_health
-            fill_width = bar_width * health_ratio
-            bar_x = self.x + (150 - bar_width) // 2
+            bar_x = self.x + (150 - self.health_bar.width) // 2
             bar_y = self.y - 22
-            pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-            fill_color = (0, 255, 0) if self.is_player else (255, 0, 0)
-            pygame.draw.rect(screen, fill_color, (bar_x, bar_y, fill_width, bar_height))
\ No newline at end of file
+            self.health_bar.draw(screen, bar_x, bar_y, self.health, self.max_health)
\ No newline at end of file
@@ -1,47 +1,153 @@
 import pygame
+from bisect import bisect_left, bisect_right, insort
 
-def find_closest_target(unit, buckets, bucket_size, base):
+class Lane:
+    """One faction's indexed units, kept sorted by x for bisect range queries."""
+
+    def __init__(self):
+        self.xs = []
+        self.units = []
+
+    def insert(self, unit, x):
+        i = bisect_right(self.xs, x)
+        self.xs.insert(i, x)
+        self.units.insert(i, unit)
+
+    def remove(self, unit, x):
+        i = bisect_left(self.xs, x)
+        while self.units[i] is not unit:
+            i += 1
+        del self.xs[i]
+        del self.units[i]
+
+    def between(self, left, right):
+        return self.units[bisect_left(self.xs, left):bisect_right(self.xs, right)]
+
+class BattlefieldIndex:
+    """
+    Index of the living, on-screen units, built once per tick.
+
+    The battlefield is a single lane, so each faction's units are kept in an
+    x-sorted Lane and nearest-enemy and overlap queries are bisect range lookups.
+    Units are also bucketed by x into `bucket_size`-wide columns (clamped to the
+    screen) for Game.find_nearest_target. Call `update(unit)` after a unit moves or
+    dies so it is re-indexed in place instead of the whole index being rebuilt.
+
+    Query results are ordered as a bucket scan meets them (bucket, then `all_units`
+    order), so ties resolve exactly as the original bucket loops did.
+    """
+
+    def __init__(self, units, bucket_size, width=1920):
+        self.bucket_size = bucket_size
+        self.max_bucket = width // bucket_size
+        self.width = width
+        self.order = {}
+        self.buckets = {}
+        self.unit_buckets = {}
+        self.lanes = {}
+        self.lane_x = {}
+        self.max_width = 0
+        for i, unit in enumerate(units):
+            self.order[unit] = i
+            bucket = self.bucket_of(unit)
+            if bucket is not None:
+                self.buckets.setdefault(bucket, []).append(unit)
+                self.unit_buckets[unit] = bucket
+                self.add_to_lane(unit)
+
+    def bucket_of(self, unit):
+        if unit.state != "die" and -192 <= unit.x <= self.width:
+            return max(0, min(int(unit.x // self.bucket_size), self.max_bucket))
+        return None
+
+    def scan_key(self, unit):
+        return self.unit_buckets[unit], self.order[unit]
+
+    def add_to_lane(self, unit):
+        lane = self.lanes.get(unit.faction)
+        if lane is None:
+            lane = self.lanes[unit.faction] = Lane()
+        lane.insert(unit, unit.x)
+        self.lane_x[unit] = unit.x
+        self.max_width = max(self.max_width, unit.get_rect().width)
+
+    def update(self, unit):
+        if unit not in self.order:
+            return
+        old = self.unit_buckets.get(unit)
+        new = self.bucket_of(unit)
+        if old == new and (old is None or self.lane_x[unit] == unit.x):
+            return
+        if old is not None:
+            self.lanes[unit.faction].remove(unit, self.lane_x.pop(unit))
+            if old != new:
+                self.buckets[old].remove(unit)
+                del self.unit_buckets[unit]
+        if new is not None:
+            if old != new:
+                insort(self.buckets.setdefault(new, []), unit, key=self.order.__getitem__)
+                self.unit_buckets[unit] = new
+            self.add_to_lane(unit)
+
+    def nearest_enemy(self, unit, max_distance):
+        """
+        Closest living unit of another faction within `max_distance` of `unit`, or None.
+
+        Equal distances go to the unit a bucket scan meets first. As with the bucket
+        lookup, nothing is found when the whole range lies left of bucket 0.
+        """
+        if int((unit.x + max_distance) // self.bucket_size) < 0:
+            return None
+        best = None
+        best_distance = None
+        for faction, lane in self.lanes.items():
+            if faction == unit.faction:
+                continue
+            i = bisect_left(lane.xs, unit.x)
+            # Walk outward from unit.x on each side until past the range or the best so far
+            for side in (range(i - 1, -1, -1), range(i, len(lane.units))):
+                for j in side:
+                    other = lane.units[j]
+                    distance = abs(unit.x - other.x)
+                    if distance > max_distance or (best is not None and distance > best_distance):
+                        break
+                    if other.state == "die":
+                        continue
+                    if best is None or distance < best_distance or self.scan_key(other) < self.scan_key(best):
+                        best = other
+                        best_distance = distance
+        return best
+
+    def overlapping(self, left, width):
+        """Units whose rect may overlap x in [left, left + width], in bucket-scan order."""
+        found = []
+        for lane in self.lanes.values():
+            found += lane.between(left - self.max_width - 2, left + width + 2)
+        found.sort(key=self.scan_key)
+        return found
+
+def find_closest_target(unit, index, base):
     """
     Find the closest enemy unit or base within the unit's attack range from its current position.
     
     Args:
         unit: The unit object.
-        buckets: Dictionary of spatial buckets containing units.
-        bucket_size: Size of each spatial bucket.
+        index: The tick's BattlefieldIndex.
         base: The enemy base (for player units) or player base (for enemy units).
     
     Returns:
         The closest target within attack range, or None if no target is found.
     """
     attack_range = unit.attack_range
-    # Determine buckets to check based on attack range
-    left_x = unit.x - attack_range
-    right_x = unit.x + attack_range
-    left_bucket = int(left_x // bucket_size)
-    right_bucket = int(right_x // bucket_size)
-    
-    potential_targets = []
-    
-    # Check units in nearby buckets
-    for b in range(left_bucket, right_bucket + 1):
-        if b in buckets:
-            for other in buckets[b]:
-                if other.faction != unit.faction and other.state != "die":
-                    distance = abs(unit.x - other.x)
-                    if distance <= attack_range:
-                        potential_targets.append((distance, other))
+    target = index.nearest_enemy(unit, attack_range)
     
-    # Check the base
+    # Check the base; a unit at the same distance wins the tie
     base_distance = abs(unit.x - base.x)
-    if base_distance <= attack_range:
-        potential_targets.append((base_distance, base))
-    
-    if potential_targets:
-        potential_targets.sort(key=lambda x: x[0])
-        return potential_targets[0][1]  # Return the closest target
-    return None
+    if base_distance <= attack_range and (target is None or base_distance < abs(unit.x - target.x)):
+        return base
+    return target
 
-def check_player_collisions(unit, buckets, bucket_size, enemy_base):
+def check_player_collisions(unit, index, enemy_base):
     """
     Collision logic for player units (direction == 1).
     
@@ -52,7 +158,7 @@ def check_player_collisions(unit, buckets, bucket_size, enemy_base):
         - target: Unit or base to attack, or None.
     """
     # Check if there's a target within attack range from current position
-    target = find_closest_target(unit, buckets, bucket_size, enemy_base)
+    target = find_closest_target(unit, index, enemy_base)
     if target:
         new_state = "attack"
         new_x = unit.x  # Stay in place if attacking
@@ -61,28 +167,21 @@ def check_player_collisions(unit, buckets, bucket_size, enemy_base):
     # If no target in range, proceed with movement and collision checks
     new_x = unit.x + unit.speed * unit.direction
     unit_rect = pygame.Rect(new_x + 3, unit.y, 120, 192)  # Offset as in V2.29
-    bucket_x = int(new_x // bucket_size)
-    check_buckets = [bucket_x - 1, bucket_x, bucket_x + 1]
     
     blocking_unit = None  # Same faction, ahead
     enemy_unit = None     # Opposing faction
     target = None
     
     # Check unit collisions
-    for b in check_buckets:
-        if b not in buckets:
+    for other in index.overlapping(unit_rect.x, unit_rect.width):
+        if other is unit or other.state == "die":
             continue
-        for other in buckets[b]:
-            if other is unit or other.state == "die":
-                continue
-            if unit_rect.colliderect(other.get_rect()):
-                if other.faction == unit.faction and other.x > unit.x:  # Ahead for player
-                    blocking_unit = other
-                elif other.faction != unit.faction:
-                    enemy_unit = other
-                    break
-        if enemy_unit:
-            break
+        if unit_rect.colliderect(other.get_rect()):
+            if other.faction == unit.faction and other.x > unit.x:  # Ahead for player
+                blocking_unit = other
+            elif other.faction != unit.faction:
+                enemy_unit = other
+                break
     
     # Handle enemy collision
     if enemy_unit:
@@ -119,7 +218,7 @@ def check_player_collisions(unit, buckets, bucket_size, enemy_base):
     new_state = "run" if unit.state != "hurt" else "hurt"
     return new_x, new_state, None
 
-def check_enemy_collisions(unit, buckets, bucket_size, player_base):
+def check_enemy_collisions(unit, index, player_base):
     """
     Collision logic for enemy units (direction == -1).
     
@@ -130,7 +229,7 @@ def check_enemy_collisions(unit, buckets, bucket_size, player_base):
         - target: Unit or base to attack, or None.
     """
     # Check if there's a target within attack range from current position
-    target = find_closest_target(unit, buckets, bucket_size, player_base)
+    target = find_closest_target(unit, index, player_base)
     if target:
         new_state = "attack"
         new_x = unit.x  # Stay in place if attacking
@@ -139,28 +238,21 @@ def check_enemy_collisions(unit, buckets, bucket_size, player_base):
     # If no target in range, proceed with movement and collision checks
     new_x = unit.x + unit.speed * unit.direction  # direction = -1, moves left
     unit_rect = pygame.Rect(new_x + 3, unit.y, 120, 192)  # Consistent offset
-    bucket_x = int(new_x // bucket_size)
-    check_buckets = [bucket_x - 1, bucket_x, bucket_x + 1]
     
     blocking_unit = None  # Same faction, ahead (smaller x)
     enemy_unit = None     # Opposing faction (player units)
     target = None
     
     # Check unit collisions
-    for b in check_buckets:
-        if b not in buckets:
+    for other in index.overlapping(unit_rect.x, unit_rect.width):
+        if other is unit or other.state == "die":
             continue
-        for other in buckets[b]:
-            if other is unit or other.state == "die":
-                continue
-            if unit_rect.colliderect(other.get_rect()):
-                if other.faction == unit.faction and other.x < unit.x:  # Ahead for enemy
-                    blocking_unit = other
-                elif other.faction != unit.faction:
-                    enemy_unit = other
-                    break
-        if enemy_unit:
-            break
+        if unit_rect.colliderect(other.get_rect()):
+            if other.faction == unit.faction and other.x < unit.x:  # Ahead for enemy
+                blocking_unit = other
+            elif other.faction != unit.faction:
+                enemy_unit = other
+                break
     
     # Handle enemy (player unit) collision
     if enemy_unit:
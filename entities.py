@@ -0,0 +1,77 @@
+"""
+Live units of a battle, by side.
+
+    entities = EntityRegistry()
+    entities.add(unit, PLAYER)
+    for unit in entities:           # player side, then enemy side
+        ...
+
+Each side is one list, which Game also exposes as `units` and `enemy_units`.
+Units get a stable `entity_id` when added and remember their place in their
+side's list, so removal moves the last unit into the gap and pops instead of
+rebuilding the list; a side's order is therefore not spawn order. Iterating the
+registry walks both sides without building a combined list; per-tick loops over
+every unit walk `sides` one list at a time, which is cheaper still.
+
+Units whose death animation has finished are taken off by `collect_dead`, and
+`take_died` hands back everything collected since the last call as (side, unit)
+pairs in the order they were removed, so the rewards for a tick's deaths are
+dealt with in one place.
+"""
+from itertools import chain
+
+PLAYER, ENEMY = 0, 1
+
+
+class EntityRegistry:
+    def __init__(self):
+        self.sides = ([], [])
+        self.by_id = {}
+        self.next_id = 1
+        self.died = []
+
+    def __iter__(self):
+        return chain(*self.sides)
+
+    def __len__(self):
+        return len(self.sides[PLAYER]) + len(self.sides[ENEMY])
+
+    def add(self, unit, side):
+        units = self.sides[side]
+        unit.entity_id = self.next_id
+        unit.entity_index = len(units)
+        units.append(unit)
+        self.by_id[unit.entity_id] = unit
+        self.next_id += 1
+        return unit
+
+    def remove(self, unit, side):
+        units = self.sides[side]
+        last = units.pop()
+        if last is not unit:
+            units[unit.entity_index] = last
+            last.entity_index = unit.entity_index
+        del self.by_id[unit.entity_id]
+
+    def get(self, entity_id):
+        return self.by_id.get(entity_id)
+
+    def clear(self, side=None):
+        """Drop every unit of `side`, or of both sides, without death events."""
+        for i in (PLAYER, ENEMY) if side is None else (side,):
+            for unit in self.sides[i]:
+                del self.by_id[unit.entity_id]
+            self.sides[i].clear()
+
+    def collect_dead(self, side):
+        """Remove the units of `side` whose death animation has finished and queue them as died."""
+        dead = [unit for unit in self.sides[side]
+                if unit.state == "die" and unit.frame >= len(unit.animations["die"]) - 1]
+        for unit in dead:
+            self.remove(unit, side)
+            self.died.append((side, unit))
+
+    def take_died(self):
+        died = self.died
+        self.died = []
+        return died
\ No newline at end of file
@@ -1,16 +1,19 @@
 import pygame
 from units import Player_ArcherUnit, Bandit_Razor
+from sounds import sound_bank
+from sprites import load_image
+from inputlog import OKAY
+from fonts import font_registry, text_cache, OPEN_SANS_BOLD, OPEN_SANS_REGULAR
 
 class EventHandler:
     def __init__(self, game):
         self.game = game
         self.okay_button = pygame.Rect(0, 0, 250, 80)
+        self.click_sound = sound_bank.handle("assets/sounds/UI/button_click.wav")
         try:
-            self.click_sound = pygame.mixer.Sound("assets/sounds/UI/button_click.wav")
-            self.text_bg = pygame.image.load("assets/ui/ui_text.png").convert_alpha()
-            self.button_bg = pygame.image.load("assets/ui/ui_buttons.png").convert_alpha()
+            self.text_bg = load_image("assets/ui/ui_text.png")
+            self.button_bg = load_image("assets/ui/ui_buttons.png")
         except Exception:
-            self.click_sound = None
             self.text_bg = pygame.Surface((100, 30))
             self.text_bg.fill((50, 50, 50))
             self.button_bg = pygame.Surface((100, 30))
@@ -20,20 +23,25 @@ class EventHandler:
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_x, mouse_y = event.pos
             if self.okay_button.collidepoint(mouse_x, mouse_y):
-                if self.click_sound:
-                    self.click_sound.play()
-                if self.game.show_intro:
-                    self.game.show_intro = False
-                elif self.game.show_end_story:
-                    self.game.show_end_story = False
-                    self.game.handle_level_completion()
-                elif self.game.show_bandit_intro:
-                    self.game.show_bandit_intro = False
-                elif self.game.show_king_threat:
-                    self.game.show_king_threat = False
-                elif self.game.show_surrender_part_two:
-                    self.game.show_surrender_part_two = False
-                    self.game.show_end_story = True
+                self.press_okay()
+
+    def press_okay(self):
+        """Dismiss the open story dialog. Recorded by action, not position, since the button moves with the dialog."""
+        self.game.recorder.record(OKAY)
+        if self.click_sound:
+            self.click_sound.play()
+        if self.game.show_intro:
+            self.game.show_intro = False
+        elif self.game.show_end_story:
+            self.game.show_end_story = False
+            self.game.handle_level_completion()
+        elif self.game.show_bandit_intro:
+            self.game.show_bandit_intro = False
+        elif self.game.show_king_threat:
+            self.game.show_king_threat = False
+        elif self.game.show_surrender_part_two:
+            self.game.show_surrender_part_two = False
+            self.game.show_end_story = True
 
     def update(self):
         if self.game.show_bandit_surrender:
@@ -90,12 +98,8 @@ class EventHandler:
         return False
 
     def draw(self, screen):
-        try:
-            FONT_CTA = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 40)
-            FONT_BODY = pygame.font.Font("assets/fonts/OpenSans-Regular.ttf", 32)
-        except Exception:
-            FONT_CTA = pygame.font.SysFont("Open Sans", 40, bold=True)
-            FONT_BODY = pygame.font.SysFont("Open Sans", 32)
+        FONT_CTA = font_registry.get(OPEN_SANS_BOLD, 40)
+        FONT_BODY = font_registry.get(OPEN_SANS_REGULAR, 32)
         PADDING = 40
 
         if self.game.show_intro:
@@ -108,7 +112,7 @@ class EventHandler:
                 "Defend your base with your trusty peasants.",
                 "Good luck, commander!"
             ]
-            text_surfaces = [FONT_BODY.render(line, True, (249, 249, 242)) for line in story_text]
+            text_surfaces = [text_cache.render(FONT_BODY, line, (249, 249, 242)) for line in story_text]
             max_width = max(surface.get_width() for surface in text_surfaces) + 2 * PADDING
             total_height = sum(surface.get_height() for surface in text_surfaces) + 2 * PADDING
             bg = pygame.transform.scale(self.text_bg, (max_width, total_height))
@@ -120,7 +124,7 @@ class EventHandler:
             self.okay_button.topleft = (1920 // 2 - 125, bg_y + total_height + 20)
             bg_button = pygame.transform.scale(self.button_bg, (self.okay_button.width, self.okay_button.height))
             screen.blit(bg_button, self.okay_button.topleft)
-            okay_text = FONT_CTA.render("Okay", True, (249, 249, 242))
+            okay_text = text_cache.render(FONT_CTA, "Okay", (249, 249, 242))
             screen.blit(okay_text, (self.okay_button.x + (self.okay_button.width - okay_text.get_width()) // 2, self.okay_button.y + (self.okay_button.height - okay_text.get_height()) // 2))
 
         elif self.game.show_end_story:
@@ -132,8 +136,8 @@ class EventHandler:
                 "The bandit threat is subdued!",
                 "A new ally joins your ranks."
             ]
-            text_surfaces = [FONT_BODY.render(line, True, (249, 249, 242)) for line in story_text]
-            unlock_text = FONT_BODY.render("New Unit Unlocked: Archer", True, (249, 249, 242))
+            text_surfaces = [text_cache.render(FONT_BODY, line, (249, 249, 242)) for line in story_text]
+            unlock_text = text_cache.render(FONT_BODY, "New Unit Unlocked: Archer", (249, 249, 242))
             max_width = max(max(surface.get_width() for surface in text_surfaces), unlock_text.get_width()) + 2 * PADDING
             total_height = sum(surface.get_height() for surface in text_surfaces) + unlock_text.get_height() + 192 + 20 + 2 * PADDING
             bg = pygame.transform.scale(self.text_bg, (max_width, total_height))
@@ -144,7 +148,7 @@ class EventHandler:
                 screen.blit(surface, (bg_x + PADDING + (max_width - 2 * PADDING - surface.get_width()) // 2, bg_y + PADDING + i * surface.get_height()))
             try:
                 archer = Player_ArcherUnit("Player", 0)
-                archer_icon = pygame.transform.scale(archer.animations["idle"][0], (192, 192))
+                archer_icon = archer.get_icon()
                 screen.blit(archer_icon, (bg_x + (max_width - 192) // 2, bg_y + PADDING + sum(surface.get_height() for surface in text_surfaces)))
             except Exception:
                 pass  # Skip icon if it fails
@@ -152,11 +156,11 @@ class EventHandler:
             self.okay_button.topleft = (1920 // 2 - 125, bg_y + total_height + 20)
             bg_button = pygame.transform.scale(self.button_bg, (self.okay_button.width, self.okay_button.height))
             screen.blit(bg_button, self.okay_button.topleft)
-            okay_text = FONT_CTA.render("Okay", True, (249, 249, 242))
+            okay_text = text_cache.render(FONT_CTA, "Okay", (249, 249, 242))
             screen.blit(okay_text, (self.okay_button.x + (self.okay_button.width - okay_text.get_width()) // 2, self.okay_button.y + (self.okay_button.height - okay_text.get_height()) // 2))
 
         elif self.game.show_bandit_intro and self.game.bandit_king:
-            text = FONT_BODY.render("Who dares trespass?", True, (249, 249, 242))
+            text = text_cache.render(FONT_BODY, "Who dares trespass?", (249, 249, 242))
             bg = pygame.transform.scale(self.text_bg, (text.get_width() + 2 * PADDING, text.get_height() + 2 * PADDING))
             bg_x = self.game.bandit_king.x - (text.get_width() + 2 * PADDING) // 2
             bg_y = self.game.bandit_king.y - 120
@@ -165,11 +169,11 @@ class EventHandler:
             self.okay_button.topleft = (bg_x + (bg.get_width() - self.okay_button.width) // 2, bg_y + bg.get_height() + 20)
             bg_button = pygame.transform.scale(self.button_bg, (self.okay_button.width, self.okay_button.height))
             screen.blit(bg_button, self.okay_button.topleft)
-            okay_text = FONT_CTA.render("Okay", True, (249, 249, 242))
+            okay_text = text_cache.render(FONT_CTA, "Okay", (249, 249, 242))
             screen.blit(okay_text, (self.okay_button.x + (self.okay_button.width - okay_text.get_width()) // 2, self.okay_button.y + (self.okay_button.height - okay_text.get_height()) // 2))
 
         elif self.game.show_king_threat and self.game.bandit_king:
-            text = FONT_BODY.render("Prepare to face my wrath!", True, (249, 249, 242))
+            text = text_cache.render(FONT_BODY, "Prepare to face my wrath!", (249, 249, 242))
             bg = pygame.transform.scale(self.text_bg, (text.get_width() + 2 * PADDING, text.get_height() + 2 * PADDING))
             bg_x = self.game.bandit_king.x - (text.get_width() + 2 * PADDING) // 2
             bg_y = self.game.bandit_king.y - 120
@@ -178,7 +182,7 @@ class EventHandler:
             self.okay_button.topleft = (bg_x + (bg.get_width() - self.okay_button.width) // 2, bg_y + bg.get_height() + 20)
             bg_button = pygame.transform.scale(self.button_bg, (self.okay_button.width, self.okay_button.height))
             screen.blit(bg_button, self.okay_button.topleft)
-            okay_text = FONT_CTA.render("Okay", True, (249, 249, 242))
+            okay_text = text_cache.render(FONT_CTA, "Okay", (249, 249, 242))
             screen.blit(okay_text, (self.okay_button.x + (self.okay_button.width - okay_text.get_width()) // 2, self.okay_button.y + (self.okay_button.height - okay_text.get_height()) // 2))
 
         elif self.game.show_bandit_surrender and self.game.bandit_king:
@@ -186,7 +190,7 @@ class EventHandler:
                 "Cease fire! Greater foes loom",
                 "ahead—we must unite."
             ]
-            text_surfaces = [FONT_BODY.render(line, True, (249, 249, 242)) for line in lines]
+            text_surfaces = [text_cache.render(FONT_BODY, line, (249, 249, 242)) for line in lines]
             max_width = max(surface.get_width() for surface in text_surfaces) + 2 * PADDING
             total_height = sum(surface.get_height() for surface in text_surfaces) + 2 * PADDING
             bg = pygame.transform.scale(self.text_bg, (max_width, total_height))
@@ -201,7 +205,7 @@ class EventHandler:
                 "Take these bows and arrows;",
                 "they’ll serve you well."
             ]
-            text_surfaces = [FONT_BODY.render(line, True, (249, 249, 242)) for line in lines]
+            text_surfaces = [text_cache.render(FONT_BODY, line, (249, 249, 242)) for line in lines]
             max_width = max(surface.get_width() for surface in text_surfaces) + 2 * PADDING
             total_height = sum(surface.get_height() for surface in text_surfaces) + 2 * PADDING
             bg = pygame.transform.scale(self.text_bg, (max_width, total_height))
@@ -213,5 +217,5 @@ class EventHandler:
             self.okay_button.topleft = (bg_x + (max_width - self.okay_button.width) // 2, bg_y + total_height + 20)
             bg_button = pygame.transform.scale(self.button_bg, (self.okay_button.width, self.okay_button.height))
             screen.blit(bg_button, self.okay_button.topleft)
-            okay_text = FONT_CTA.render("Okay", True, (249, 249, 242))
+            okay_text = text_cache.render(FONT_CTA, "Okay", (249, 249, 242))
             screen.blit(okay_text, (self.okay_button.x + (self.okay_button.width - okay_text.get_width()) // 2, self.okay_button.y + (self.okay_button.height - okay_text.get_height()) // 2))
\ No newline at end of file
@@ -0,0 +1,60 @@
+import pygame
+from collections import OrderedDict
+from gamelog import log
+
+OPEN_SANS_BOLD = "assets/fonts/OpenSans-Bold.ttf"
+OPEN_SANS_REGULAR = "assets/fonts/OpenSans-Regular.ttf"
+
+# System font used when a bundled font file cannot be opened
+FALLBACKS = {
+    OPEN_SANS_BOLD: ("Open Sans", True),
+    OPEN_SANS_REGULAR: ("Open Sans", False),
+}
+
+
+class FontRegistry:
+    """Opens each (face, size, bold) once; `face` is a .ttf path or a system font name."""
+
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, face, size, bold=False):
+        key = (face, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.load(face, size, bold)
+            self.fonts[key] = font
+        return font
+
+    def load(self, face, size, bold):
+        if face.endswith(".ttf"):
+            try:
+                return pygame.font.Font(face, size)
+            except Exception as e:
+                log.warning("Failed to load font: %s - %s", face, e)
+                face, bold = FALLBACKS.get(face, (None, bold))
+        return pygame.font.SysFont(face, size, bold=bold)
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color)."""
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.capacity:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+
+font_registry = FontRegistry()
+text_cache = TextCache()
\ No newline at end of file
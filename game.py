@@ -1,7 +1,7 @@
 import pygame
 from menu import MainMenu
 from game_logic import Game
-from units import preload_all_animations
+from gamelog import log
 
 def main():
     pygame.init()
@@ -17,9 +17,8 @@ def main():
         pygame.mixer.music.set_volume(0.5)
         pygame.mixer.music.play(-1)  # -1 ensures infinite looping
     except Exception as e:
-        print(f"Failed to load or play Menu.mp3: {e}")
+        log.warning("Failed to load or play Menu.mp3: %s", e)
 
-    preload_all_animations()
     main_menu = MainMenu(screen, clock)
     running = True
 
@@ -4,73 +4,75 @@ from levels import Level
 from buildings import Base
 from ui import UI
 from units import Unit, Player_ArcherUnit, Bandit_King, Bandit_Razor, CartUnit
+from collisions import BattlefieldIndex
+from entities import EntityRegistry, PLAYER, ENEMY
 from factions import Player, Bandits, Undead, Zombies
-import js
+from level_assets import level_assets
+from sprites import sprite_store, load_image
+from fonts import font_registry, text_cache, OPEN_SANS_BOLD, OPEN_SANS_REGULAR
+from healthbars import health_bars
+from simclock import sim_clock
+from projectiles import projectile_pool
+from inputlog import InputRecorder, SPAWN, UPGRADE, REPLAY_PATH
+from gamelog import log
 import asyncio
+import traceback
 
 class SeedDrop:
+    __slots__ = ("x", "value", "creation_time", "alpha")
+    y = 920 - 40
+    lifetime = 5000
+
     def __init__(self, x, y, value):
-        self.x = x + random.uniform(-20, 20)
-        self.y = 920 - 40
+        self.x = x + sim_clock.rng.uniform(-20, 20)
         self.value = value
-        self.creation_time = pygame.time.get_ticks()
-        self.lifetime = 5000
+        self.creation_time = sim_clock.now()
         self.alpha = 255
-        try:
-            self.sprite = pygame.image.load("assets/images/seed.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (51, 51))
-        except Exception as e:
-            js.console.log(f"Failed to load seed sprite: assets/images/seed.png - {str(e)}")
-            self.sprite = pygame.Surface((51, 51))
-            self.sprite.fill((249, 249, 242))  # Fallback off-white surface
+
+    @staticmethod
+    def get_sprite():
+        return sprite_store.get("assets/images/seed.png", (51, 51), fallback_color=(249, 249, 242))  # Fallback off-white surface
 
     def update(self):
-        elapsed = pygame.time.get_ticks() - self.creation_time
+        elapsed = sim_clock.now() - self.creation_time
         if elapsed > self.lifetime - 1000:
             self.alpha = max(0, 255 * (self.lifetime - elapsed) / 1000)
-            self.sprite.set_alpha(int(self.alpha))
 
     def draw(self, screen):
-        screen.blit(self.sprite, (self.x, self.y))
+        # The seed sprite is shared, so fading uses the store's pre-faded copies
+        screen.blit(sprite_store.get_faded(self.get_sprite(), self.alpha), (self.x, self.y))
 
     def is_expired(self):
-        return pygame.time.get_ticks() - self.creation_time >= self.lifetime
+        return sim_clock.now() - self.creation_time >= self.lifetime
 
 class Tower:
+    __slots__ = ("x", "y", "sprite")
+
     def __init__(self, x, y, sprite_path, base_width, base_height):
         self.x = x
         self.y = y
-        try:
-            self.sprite = pygame.image.load(sprite_path).convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (base_width, base_height))
-        except Exception as e:
-            js.console.log(f"Failed to load tower sprite: {sprite_path} - {str(e)}")
-            self.sprite = pygame.Surface((base_width, base_height))
-            self.sprite.fill((0, 0, 255))  # Fallback blue surface
+        self.sprite = sprite_store.get(sprite_path, (base_width, base_height), fallback_color=(0, 0, 255))  # Fallback blue surface
 
     def draw(self, screen):
         screen.blit(self.sprite, (self.x, self.y))
 
 class Wall:
+    __slots__ = ("x", "y", "sprite")
+
     def __init__(self, x, y, sprite_path):
         self.x = x
         self.y = y
-        try:
-            self.sprite = pygame.image.load(sprite_path).convert_alpha()
-            orig_width, orig_height = self.sprite.get_size()
-            new_width = int(orig_width * 0.75)
-            new_height = int(orig_height * 0.75)
-            self.sprite = pygame.transform.scale(self.sprite, (new_width, new_height))
-        except Exception as e:
-            js.console.log(f"Failed to load wall sprite: {sprite_path} - {str(e)}")
-            self.sprite = pygame.Surface((75, 225))
-            self.sprite.fill((150, 150, 150))  # Fallback gray surface
+        self.sprite = sprite_store.get(sprite_path, scale=0.75, fallback_size=(75, 225), fallback_color=(150, 150, 150))  # Fallback gray surface
 
     def draw(self, screen):
         screen.blit(self.sprite, (self.x, self.y))
 
+CRASH_LOG_PATH = "last_crash.log"
+
 class Game:
     passive_income = 0.1
+    # Ten simulated seconds between snapshots of the battle into the save data
+    AUTOSAVE_TICKS = 600
     BUCKET_SIZE = 400
     FACTION_MAP = {
         "Player": Player(),
@@ -79,15 +81,22 @@ class Game:
         "Zombies": Zombies()
     }
 
-    def __init__(self, level_number, main_menu, screen, clock):
+    def __init__(self, level_number, main_menu, screen, clock, seed=None):
+        # A fresh seed per battle unless replaying one; it is saved with the input log
+        self.seed = random.randrange(1 << 32) if seed is None else seed
+        sim_clock.reset(self.seed)
         self.player_faction = "Player"
         self.level = Level(level_number)
         self.enemy_faction = self.level.faction
+        level_assets.load(self.level, main_menu.get_available_units())
         self.seeds = 50
-        self.units = []
-        self.enemy_units = []
+        # Live units by side; units and enemy_units are the registry's own lists
+        self.entities = EntityRegistry()
+        self.units, self.enemy_units = self.entities.sides
         self.seed_drops = []
-        self.arrows = []
+        # Arrows and magic balls in flight
+        self.projectiles = projectile_pool
+        self.projectiles.reset()
         self.xp = 0
         self.max_xp = 100
         self.level_up_available = False
@@ -112,13 +121,13 @@ class Game:
         # Battlefield background
         self.static_surface = pygame.Surface((1920, 1040)).convert()
         try:
-            battlefield = pygame.image.load("assets/backgrounds/battlefield.png").convert()
+            battlefield = load_image("assets/backgrounds/battlefield.png", alpha=False)
             orig_height = battlefield.get_height()
             crop_height = int(orig_height * 0.95)
             battlefield = battlefield.subsurface((0, 0, battlefield.get_width(), crop_height))
             self.static_surface.blit(pygame.transform.scale(battlefield, (1920, 880)), (0, 0))
         except Exception as e:
-            js.console.log(f"Failed to load battlefield background: assets/backgrounds/battlefield.png - {str(e)}")
+            log.warning("Failed to load battlefield background: assets/backgrounds/battlefield.png - %s", e)
             self.static_surface.fill((0, 100, 0))  # Fallback green surface
         pygame.draw.rect(self.static_surface, (14, 39, 59), (0, 880, 1920, 160))
 
@@ -133,7 +142,7 @@ class Game:
 
 
         self.ui = UI(self, 1920)
-        self.last_enemy_spawn = pygame.time.get_ticks()
+        self.last_enemy_spawn = sim_clock.now()
         self.game_over = False
         self.won = False
         self.fade_alpha = 0
@@ -154,7 +163,7 @@ class Game:
         self.show_surrender_part_two = False
         self.show_king_threat = False
 
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = sim_clock.now()
         self.main_menu.achievements.check_achievements("game_started", {})
         self.frame_count = 0
         self.surrender_triggered = False
@@ -162,17 +171,20 @@ class Game:
         self.scale_factor = 1.0
         
         try:
-            self.menu_button_bg = pygame.image.load("assets/ui/ui_buttons.png").convert_alpha()
+            self.menu_button_bg = load_image("assets/ui/ui_buttons.png")
         except Exception as e:
-            js.console.log(f"Failed to load menu button background: assets/ui/ui_buttons.png - {str(e)}")
+            log.warning("Failed to load menu button background: assets/ui/ui_buttons.png - %s", e)
             self.menu_button_bg = pygame.Surface((60, 40))
             self.menu_button_bg.fill((147, 208, 207))  # Fallback cyan surface
 
         from eventhandler import EventHandler
         self.event_handler = EventHandler(self)
+        self.recorder = InputRecorder(self)
+        self.last_autosave = sim_clock.ticks
         self.running = True  # Added to ensure run loop works
 
     def spawn_unit(self, unit_type):
+        self.recorder.record(SPAWN, unit_type.name)
         if self.seeds >= unit_type.cost:
             self.seeds -= unit_type.cost
             spawn_x = 100
@@ -202,14 +214,16 @@ class Game:
             new_unit.attack_frame_delay = new_unit.attack_cooldown / 14
             new_unit.speed += movement_speed_increase
             
-            self.units.append(new_unit)
+            self.entities.add(new_unit, PLAYER)
             self.main_menu.achievements.check_achievements("unit_spawned", {"unit": new_unit})
-            js.console.log(f"Spawned {unit_type.__name__}: Health={new_unit.max_health:.1f}, Damage={new_unit.attack_power:.1f}, Speed={new_unit.speed:.1f}, Attack Cooldown={new_unit.attack_cooldown}")
+            if log.debug_on:
+                log.debug("Spawned %s: Health=%.1f, Damage=%.1f, Speed=%.1f, Attack Cooldown=%s", unit_type.__name__,
+                          new_unit.max_health, new_unit.attack_power, new_unit.speed, new_unit.attack_cooldown)
             return new_unit
 
     def spawn_enemy_unit(self):
         if self.enemy_spawns_stopped:
-            js.console.log("Enemy spawn blocked after base destroyed or king spawned")
+            log.debug("Enemy spawn blocked after base destroyed or king spawned")
             return
         unit_type = self.level.get_next_enemy_unit()
         if not unit_type:
@@ -225,34 +239,38 @@ class Game:
         new_unit.health = new_unit.max_health
         new_unit.attack_power *= faction.attack_mod
         new_unit.speed *= faction.speed_mod
-        self.enemy_units.append(new_unit)
-        js.console.log(f"Spawned enemy {unit_type.__name__}: Health={new_unit.max_health:.1f}, Damage={new_unit.attack_power:.1f}, Speed={new_unit.speed:.1f}")
+        self.entities.add(new_unit, ENEMY)
+        if log.debug_on:
+            log.debug("Spawned enemy %s: Health=%.1f, Damage=%.1f, Speed=%.1f", unit_type.__name__,
+                      new_unit.max_health, new_unit.attack_power, new_unit.speed)
 
     def spawn_bandit_king(self):
         self.bandit_king = Bandit_King(self.enemy_faction, 1920 - 250)
-        self.enemy_units.append(self.bandit_king)
+        self.entities.add(self.bandit_king, ENEMY)
         self.show_bandit_intro = True
         self.units_moving_back = True
         self.king_moving = True
         self.enemy_spawns_stopped = True
         self.surrender_triggered = False
-        js.console.log(f"Bandit King spawned at x={self.bandit_king.x}")
+        log.info("Bandit King spawned at x=%s", self.bandit_king.x)
 
     def spawn_cart_and_razor(self):
         razor_unit = Bandit_Razor(self.enemy_faction, 1920 - 100)
         razor_unit.speed = 1.5
-        self.enemy_units.append(razor_unit)
-        js.console.log(f"Spawned Bandit Razor at x={razor_unit.x} with speed={razor_unit.speed}")
+        self.entities.add(razor_unit, ENEMY)
+        log.info("Spawned Bandit Razor at x=%s with speed=%s", razor_unit.x, razor_unit.speed)
 
         target_x = self.bandit_king.x - 50
         self.cart = CartUnit(2000, 880 - 150, target_x)
-        js.console.log(f"Spawned Cart at x={self.cart.x} with speed={self.cart.speed}")
+        log.info("Spawned Cart at x=%s with speed=%s", self.cart.x, self.cart.speed)
 
     def apply_upgrade(self, unit, upgrade_type):
         unit_name = unit.__class__.__name__.replace("Player_", "").replace("Unit", "")
         upgrade_data = self.main_menu.unit_upgrades.get(unit_name, {}).get(upgrade_type.capitalize())
         if not upgrade_data or unit.state == "die":
             return
+        if unit in self.units:
+            self.recorder.record(UPGRADE, self.units.index(unit), upgrade_type)
         cost = upgrade_data["cost"]
         if self.main_menu.secured_seeds >= cost:
             self.main_menu.secured_seeds -= cost
@@ -284,18 +302,10 @@ class Game:
                 "Zombie_Melee": 10, "Zombie_Archer": 15, "Zombie_Tank": 25, "Zombie_Assassin": 20,
                 "Bandit_King": 100}.get(unit.name, 10)
 
-    def get_buckets(self, units):
-        buckets = {}
-        for unit in units:
-            if unit.state != "die" and -192 <= unit.x <= 1920:
-                bucket_x = max(0, min(int(unit.x // self.BUCKET_SIZE), 1920 // self.BUCKET_SIZE))
-                buckets.setdefault(bucket_x, []).append(unit)
-        return buckets
-
-    def find_nearest_target(self, unit, all_units, base):
-        bucket_x = int(unit.x // self.BUCKET_SIZE)
-        check_buckets = [max(0, bucket_x - 1), bucket_x, min(1920 // self.BUCKET_SIZE, bucket_x + 1)]
-        buckets = self.get_buckets(all_units)
+    def find_nearest_target(self, unit, index, base):
+        bucket_x = int(unit.x // index.bucket_size)
+        check_buckets = [max(0, bucket_x - 1), bucket_x, min(index.max_bucket, bucket_x + 1)]
+        buckets = index.buckets
         
         nearest = None
         min_dist = unit.attack_range
@@ -313,6 +323,81 @@ class Game:
             nearest = base
         return nearest
 
+    def handle_deaths(self, died):
+        """Seeds, XP, seed drops and kill achievements for the units removed this tick, in removal order."""
+        for side, enemy in died:
+            if side != ENEMY:
+                continue
+            if enemy == self.bandit_king:
+                log.info("Bandit King being removed from enemy_units due to death")
+                self.bandit_king = None
+                if self.level.level_number == 5:
+                    self.handle_level_completion()
+            reward = self.get_seed_reward(enemy)
+            self.seeds += reward
+            self.xp += self.get_xp_reward(enemy)
+            for _ in range(reward):
+                self.seed_drops.append(SeedDrop(enemy.x, enemy.y, 1))
+            self.main_menu.achievements.check_achievements("unit_killed", {"unit": enemy, "killer": "Player"})
+
+    def save_positions(self):
+        for side in self.entities.sides:
+            for entity in side:
+                entity.save_position()
+        self.projectiles.save_positions()
+        if self.cart:
+            self.cart.save_position()
+
+    def step(self):
+        """Advance the simulation by one fixed tick."""
+        sim_clock.step()
+        self.update()
+        self.recorder.checkpoint()
+
+    def end_battle(self, won):
+        """Mark the battle won or lost; its saved snapshot is dropped so the ending can't be resumed."""
+        self.game_over = True
+        self.won = won
+        self.clear_saved_battle()
+
+    def handle_level_completion(self):
+        self.end_battle(True)
+
+    def clear_saved_battle(self):
+        if self.main_menu.battle_snapshot is not None:
+            self.main_menu.battle_snapshot = None
+            self.main_menu.save_player_data()
+
+    def autosave(self):
+        """Keep a snapshot of the battle in the player data so it can be resumed; cleared once the battle is over."""
+        import snapshot
+        self.main_menu.battle_snapshot = None if self.game_over else snapshot.to_text(snapshot.save(self))
+        self.main_menu.save_player_data()
+        self.last_autosave = sim_clock.ticks
+
+    def resume_saved_battle(self):
+        """Continue the saved battle if it is of this level. Returns whether one was restored."""
+        import snapshot
+        text = self.main_menu.battle_snapshot
+        if not text:
+            return False
+        try:
+            blob = snapshot.from_text(text)
+            if snapshot.level_of(blob) != self.level.level_number:
+                return False
+            if snapshot.has_ended(blob):
+                log.info("Saved battle had already ended; discarding it")
+                self.clear_saved_battle()
+                return False
+            snapshot.restore(self, blob)
+        except Exception as e:
+            log.warning("Failed to resume saved battle: %s", e)
+            return False
+        self.recorder.resumed(text)
+        self.last_autosave = sim_clock.ticks
+        log.info("Resumed saved battle at tick %d", sim_clock.ticks)
+        return True
+
     def is_paused_by_event(self):
         return (self.show_intro or self.show_end_story or self.show_bandit_intro or 
                 self.show_surrender_part_two or self.show_king_threat)
@@ -328,39 +413,38 @@ class Game:
         if not self.is_paused_by_event():
             self.seeds += self.passive_income
 
-        all_units = self.units + self.enemy_units
-
         self.event_handler.update()
 
         if self.is_paused_by_event():
             return True
 
-        if self.bandit_king:
-            js.console.log(f"Bandit King status - state: {self.bandit_king.state}, "
-                           f"health: {self.bandit_king.health}/{self.bandit_king.max_health}, "
-                           f"x: {self.bandit_king.x}, in enemy_units: {self.bandit_king in self.enemy_units}")
+        if self.bandit_king and log.debug_on:
+            log.debug("Bandit King status - state: %s, health: %s/%s, x: %s, in enemy_units: %s", self.bandit_king.state,
+                      self.bandit_king.health, self.bandit_king.max_health, self.bandit_king.x,
+                      self.bandit_king in self.enemy_units)
 
         if self.cart and self.cart.moving:
             razor_unit = next((unit for unit in self.enemy_units if isinstance(unit, Bandit_Razor)), None)
             if razor_unit and self.bandit_king:
                 razor_dist = abs(razor_unit.x - self.bandit_king.x)
                 cart_dist = abs(self.cart.x - self.cart.target_x)
-                js.console.log(f"Cart x={self.cart.x}, target_x={self.cart.target_x}, dist={cart_dist}, "
-                               f"Razor x={razor_unit.x}, King x={self.bandit_king.x}, dist={razor_dist}")
+                if log.debug_on:
+                    log.debug("Cart x=%s, target_x=%s, dist=%s, Razor x=%s, King x=%s, dist=%s", self.cart.x,
+                              self.cart.target_x, cart_dist, razor_unit.x, self.bandit_king.x, razor_dist)
                 if razor_dist < 150 and cart_dist < 20:
                     self.cart.x = self.cart.target_x
                     self.cart.moving = False
                     self.show_surrender_part_two = True
-                    js.console.log("Cart stopped and surrender part two triggered")
+                    log.info("Cart stopped and surrender part two triggered")
             self.cart.update()
 
         if self.bandit_king and not self.surrender_triggered:
             if (self.bandit_king.health <= self.bandit_king.max_health * 0.1 and 
                 self.main_menu.max_level <= 5):
-                js.console.log("Surrender triggered: Bandit King at 10% health")
+                log.info("Surrender triggered: Bandit King at 10% health")
                 self.show_bandit_surrender = True
                 self.surrender_triggered = True
-                self.arrows = []
+                self.projectiles.clear()
                 self.spawn_cart_and_razor()
                 self.cart.moving = True
                 for unit in self.units + [self.bandit_king]:
@@ -368,12 +452,14 @@ class Game:
                         unit.state = "idle"
                         unit.is_attacking = False
                         unit.attack_target = None
-                        js.console.log(f"Unit {unit.name} set to idle")
+                        log.debug("Unit %s set to idle", unit.name)
 
         self.event_handler.handle_units_moving_back()
         self.event_handler.handle_king_moving()
 
-        for unit in self.units[:]:
+        index = BattlefieldIndex(self.entities, self.BUCKET_SIZE)
+
+        for unit in self.units:
             if -192 <= unit.x <= 1920:
                 if self.cart and (self.cart.moving or self.show_surrender_part_two) or self.king_moving:
                     unit.state = "idle"
@@ -381,27 +467,26 @@ class Game:
                     unit.attack_target = None
                     unit.update_animation()
                 else:
-                    arrow = unit.update_animation()
-                    if arrow:
-                        self.arrows.append(arrow)
-                    unit.move(all_units, self.enemy_base, self.player_base, self.get_buckets(all_units), self.BUCKET_SIZE)
+                    unit.update_animation()
+                    unit.move(self.entities, self.enemy_base, self.player_base, index)
                     if unit.x >= 1920 - 120:
                         unit.x = 1920 - 120
                         unit.state = "idle"
+                    index.update(unit)
                     if self.bandit_king and unit.in_attack_range(self.bandit_king):
                         unit.attack(self.bandit_king)
                     elif unit.in_attack_range(self.enemy_base):
                         unit.attack(self.enemy_base)
                     else:
-                        nearest_target = self.find_nearest_target(unit, all_units, self.enemy_base)
+                        nearest_target = self.find_nearest_target(unit, index, self.enemy_base)
                         if nearest_target:
                             unit.attack(nearest_target)
 
-        self.units[:] = [unit for unit in self.units if not (unit.state == "die" and unit.frame >= len(unit.animations["die"]) - 1)]
+        self.entities.collect_dead(PLAYER)
 
-        for enemy in self.enemy_units[:]:
-            if enemy == self.bandit_king:
-                js.console.log(f"Updating Bandit King: state={enemy.state}, x={enemy.x}")
+        for enemy in self.enemy_units:
+            if enemy == self.bandit_king and log.debug_on:
+                log.debug("Updating Bandit King: state=%s, x=%s", enemy.state, enemy.x)
             if -192 <= enemy.x <= 1920:
                 if (self.cart and (self.cart.moving or self.show_surrender_part_two) or self.king_moving) and not isinstance(enemy, Bandit_Razor):
                     enemy.state = "idle"
@@ -409,41 +494,29 @@ class Game:
                     enemy.attack_target = None
                     enemy.update_animation()
                 else:
-                    arrow = enemy.update_animation()
-                    if arrow:
-                        self.arrows.append(arrow)
-                    enemy.move(all_units, self.enemy_base, self.player_base, self.get_buckets(all_units), self.BUCKET_SIZE)
+                    enemy.update_animation()
+                    enemy.move(self.entities, self.enemy_base, self.player_base, index)
                     if enemy.x <= 120:
                         enemy.x = 120
                         enemy.state = "idle"
+                    index.update(enemy)
                     if enemy.in_attack_range(self.player_base):
                         enemy.attack(self.player_base)
                     else:
-                        nearest_target = self.find_nearest_target(enemy, all_units, self.player_base)
+                        nearest_target = self.find_nearest_target(enemy, index, self.player_base)
                         if nearest_target:
                             enemy.attack(nearest_target)
 
-        dead_enemies = [enemy for enemy in self.enemy_units if enemy.state == "die" and enemy.frame >= len(enemy.animations["die"]) - 1]
-        for enemy in dead_enemies:
-            if enemy == self.bandit_king:
-                js.console.log("Bandit King being removed from enemy_units due to death")
-                self.bandit_king = None
-                if self.level.level_number == 5:
-                    self.handle_level_completion()
-            self.seeds += self.get_seed_reward(enemy)
-            self.xp += self.get_xp_reward(enemy)
-            for _ in range(self.get_seed_reward(enemy)):
-                self.seed_drops.append(SeedDrop(enemy.x, enemy.y, 1))
-            self.main_menu.achievements.check_achievements("unit_killed", {"unit": enemy, "killer": "Player"})
-        self.enemy_units[:] = [enemy for enemy in self.enemy_units if enemy not in dead_enemies]
+        self.entities.collect_dead(ENEMY)
+        self.handle_deaths(self.entities.take_died())
 
         self.seed_drops[:] = [drop for drop in self.seed_drops if not drop.is_expired()]
         for drop in self.seed_drops:
             drop.update()
 
-        self.arrows[:] = [arrow for arrow in self.arrows if not arrow.update(all_units)]
+        self.projectiles.update()
 
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         if not self.enemy_spawns_stopped and now - self.last_enemy_spawn >= 3000:
             self.spawn_enemy_unit()
             self.last_enemy_spawn = now
@@ -454,22 +527,21 @@ class Game:
             self.level_up_available = False
 
         if self.player_base.health <= 0:
-            self.game_over = True
-            self.won = False
+            self.end_battle(False)
         elif self.enemy_base.health <= 0:
             if self.level.level_number == 5 and self.bandit_king is None:
                 for enemy in self.enemy_units:
                     enemy.state = "die"
                     enemy.frame = 0
-                self.enemy_units = []
+                self.entities.clear(ENEMY)
                 self.enemy_spawns_stopped = True
-                js.console.log("Enemy base destroyed, spawning Bandit King")
+                log.info("Enemy base destroyed, spawning Bandit King")
                 self.spawn_bandit_king()
             elif self.level.level_number != 5:
                 for enemy in self.enemy_units:
                     enemy.state = "die"
                     enemy.frame = 0
-                self.enemy_units = []
+                self.entities.clear(ENEMY)
                 self.enemy_spawns_stopped = True
                 self.handle_level_completion()
 
@@ -490,7 +562,10 @@ class Game:
                 events = pygame.event.get()
                 for event in events:
                     if event.type == pygame.QUIT:
+                        self.autosave()
                         self.running = False
+                    elif event.type == pygame.WINDOWFOCUSLOST:
+                        self.autosave()
                     elif event.type == pygame.MOUSEBUTTONDOWN:
                         self.event_handler.handle_events(event)
                         result = self.ui.handle_event(event)
@@ -498,7 +573,13 @@ class Game:
                             self.spawn_unit(result)
                 
                 ### Update Game State ###
-                self.update()
+                # Fixed-rate simulation steps for the real time that has passed; slow
+                # frames run several steps, fast ones may run none and only redraw
+                for _ in range(sim_clock.advance(self.clock.tick(60))):
+                    self.save_positions()
+                    self.step()
+                if sim_clock.ticks - self.last_autosave >= self.AUTOSAVE_TICKS:
+                    self.autosave()
 
                 ### Draw to Screen ###
                 self.draw(self.screen)
@@ -506,21 +587,38 @@ class Game:
                 ### Update Display and Yield ###
                 pygame.display.flip()
                 await asyncio.sleep(0.001)  # Yield control to the browser's event loop
-                
-                ### Frame Rate Control ###
-                self.clock.tick(60)  # Cap at 60 FPS
             
             except Exception as e:
+                # Leave the last messages before the crash next to the input log for the bug report
+                log.error("Battle loop crashed at tick %d:\n%s", sim_clock.ticks, traceback.format_exc())
+                log.dump()
+                try:
+                    log.dump(CRASH_LOG_PATH)
+                except Exception:
+                    pass
+                # A snapshot from before the crash could put the player straight back into it on the next launch
+                try:
+                    self.clear_saved_battle()
+                except Exception:
+                    pass
                 break
 
+        try:
+            self.recorder.save(REPLAY_PATH)
+            log.info("Battle input log saved to %s (level %d, seed %d)", REPLAY_PATH, self.level.level_number, self.seed)
+        except Exception as e:
+            log.warning("Failed to save battle input log: %s", e)
+
     def draw(self, screen):
+        health_bars.set_unit_count(len(self.entities))
         screen.blit(self.static_surface, (0, 0))
         self.player_wall_back.draw(screen)
-        for unit in self.units + self.enemy_units:
-            if -192 <= unit.x <= 1920:
-                unit.draw(screen)
-                if unit == self.selected_unit:
-                    pygame.draw.rect(screen, (255, 255, 0), unit.get_rect(), 2)
+        for side in self.entities.sides:
+            for unit in side:
+                if -192 <= unit.x <= 1920:
+                    unit.draw(screen)
+                    if unit == self.selected_unit:
+                        pygame.draw.rect(screen, (255, 255, 0), unit.get_rect(), 2)
         self.player_base.draw(screen)
         self.player_wall.draw(screen)
         if self.player_tower:
@@ -528,21 +626,15 @@ class Game:
         self.enemy_base.draw(screen)
         for drop in self.seed_drops:
             drop.draw(screen)
-        for arrow in self.arrows:
-            arrow.draw(screen)
+        self.projectiles.draw(screen)
         if self.cart:
             self.cart.draw(screen)
         
         self.ui.draw(screen)
 
         # Use TrueType fonts with increased size for clarity
-        try:
-            FONT_CTA = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 28)  # Increased from 24
-            FONT_BODY = pygame.font.Font("assets/fonts/OpenSans-Regular.ttf", 24)  # Increased from 20
-        except Exception as e:
-            print(f"Failed to load fonts in Game: {e}")
-            FONT_CTA = pygame.font.SysFont("Open Sans", 28, bold=True)
-            FONT_BODY = pygame.font.SysFont("Open Sans", 24)
+        FONT_CTA = font_registry.get(OPEN_SANS_BOLD, 28)  # Increased from 24
+        FONT_BODY = font_registry.get(OPEN_SANS_REGULAR, 24)  # Increased from 20
         
         self.event_handler.draw(screen)
 
@@ -552,21 +644,21 @@ class Game:
             overlay.set_alpha(self.fade_alpha)
             screen.blit(overlay, (0, 0))
             if self.fade_alpha >= 255:
-                result_text = FONT_CTA.render("Victory" if self.won else "Defeat", True, (255, 255, 255))
+                result_text = text_cache.render(FONT_CTA, "Victory" if self.won else "Defeat", (255, 255, 255))
                 screen.blit(result_text, (1920 // 2 - result_text.get_width() // 2, 880 // 2 - 50))
                 pygame.draw.rect(screen, (147, 208, 207), self.return_button)
-                return_text = FONT_CTA.render("Return to Menu", True, (249, 249, 242))
+                return_text = text_cache.render(FONT_CTA, "Return to Menu", (249, 249, 242))
                 screen.blit(return_text, (self.return_button.x + 20, self.return_button.y + 20))
         elif not self.show_intro and not self.show_end_story and not self.show_bandit_intro and not self.show_surrender_part_two and not self.show_king_threat:
             menu_bg = pygame.transform.scale(self.menu_button_bg, (self.menu_button.width, self.menu_button.height))
             screen.blit(menu_bg, (self.menu_button.x, self.menu_button.y))
-            menu_text = FONT_CTA.render("Menu", True, (249, 249, 242))
+            menu_text = text_cache.render(FONT_CTA, "Menu", (249, 249, 242))
             screen.blit(menu_text, (self.menu_button.x + (self.menu_button.width - menu_text.get_width()) // 2, self.menu_button.y + (self.menu_button.height - menu_text.get_height()) // 2))
 
             if self.menu_open:
                 for option, rect in self.menu_options.items():
                     pygame.draw.rect(screen, (128, 131, 134), rect)
-                    text = FONT_BODY.render(option, True, (249, 249, 242))
+                    text = text_cache.render(FONT_BODY, option, (249, 249, 242))
                     screen.blit(text, (rect.x + 10, rect.y + 10))
                 
                 if self.show_options_submenu:
@@ -575,10 +667,10 @@ class Game:
                     pygame.draw.rect(screen, (147, 208, 207), options_window_rect, 2)
                     for option, rect in self.options_submenu_buttons.items():
                         pygame.draw.rect(screen, (128, 131, 134), rect)
-                        text = FONT_BODY.render(option, True, (249, 249, 242))
+                        text = text_cache.render(FONT_BODY, option, (249, 249, 242))
                         screen.blit(text, (rect.x + 10, rect.y + 10))
 
-            level_text = FONT_BODY.render(f"Level: {self.level.level_number} - {self.enemy_faction}", True, (249, 249, 242))
+            level_text = text_cache.render(FONT_BODY, f"Level: {self.level.level_number} - {self.enemy_faction}", (249, 249, 242))
             screen.blit(level_text, (1920 // 2 - level_text.get_width() // 2, 20))
 
             xp_bar_width = 200
@@ -588,12 +680,12 @@ class Game:
             xp_bar_rect = pygame.Rect(1920 // 2 - xp_bar_width // 2, 100, xp_bar_width, xp_bar_height)
             pygame.draw.rect(screen, (128, 131, 134), xp_bar_rect)
             pygame.draw.rect(screen, (0, 255, 255), (xp_bar_rect.x, xp_bar_rect.y, xp_fill_width, xp_bar_height))
-            xp_text = FONT_BODY.render(f"XP: {int(self.xp)}/{int(self.max_xp)}", True, (249, 249, 242))
+            xp_text = text_cache.render(FONT_BODY, f"XP: {int(self.xp)}/{int(self.max_xp)}", (249, 249, 242))
             screen.blit(xp_text, (xp_bar_rect.x + xp_bar_width // 2 - xp_text.get_width() // 2, xp_bar_rect.y - 30))
 
             if self.level_up_available:
                 pygame.draw.rect(screen, (147, 208, 207), self.level_up_button)
-                level_up_text = FONT_BODY.render("Level Up", True, (249, 249, 242))
+                level_up_text = text_cache.render(FONT_BODY, "Level Up", (249, 249, 242))
                 screen.blit(level_up_text, (self.level_up_button.x + 50, self.level_up_button.y + 10))
         
         self.main_menu.achievements.draw_popup(screen)
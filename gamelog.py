@@ -0,0 +1,82 @@
+"""
+Leveled game logging with an in-memory ring buffer.
+
+    from gamelog import log
+    log.info("Bandit King spawned at x=%s", king.x)
+    if log.debug_on:
+        log.debug("State: %s, Frame: %s", self.state, self.frame)
+
+Messages below `log.level` are dropped before any formatting; hot paths also
+check the precomputed `debug_on`/`info_on` flags first, so a disabled message
+costs one attribute read and no call. Kept messages are %-formatted once, stored
+with their simulation tick in a buffer of the last `capacity` messages for crash
+dumps, and those at or above `echo_level` also go to the console (js.console.log,
+which crosses into JavaScript in the browser). `dump()` writes the buffer out on
+demand, to the console or a file.
+"""
+from collections import deque
+
+from browser import js
+from simclock import sim_clock
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+# Above every level: nothing is kept, or nothing echoed
+OFF = 100
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+CAPACITY = 500
+
+
+class GameLog:
+    def __init__(self, capacity=CAPACITY, level=INFO, echo_level=INFO):
+        self.buffer = deque(maxlen=capacity)
+        self.set_level(level, echo_level)
+
+    def set_level(self, level, echo_level=None):
+        """Keep messages at `level` and above; echo those at `echo_level` (default: the same) and above."""
+        self.level = level
+        self.echo_level = level if echo_level is None else echo_level
+        self.debug_on = level <= DEBUG
+        self.info_on = level <= INFO
+
+    def write(self, level, message, args):
+        if args:
+            message = message % args
+        self.buffer.append((sim_clock.ticks, level, message))
+        if level >= self.echo_level:
+            js.console.log(message)
+
+    def debug(self, message, *args):
+        if self.level <= DEBUG:
+            self.write(DEBUG, message, args)
+
+    def info(self, message, *args):
+        if self.level <= INFO:
+            self.write(INFO, message, args)
+
+    def warning(self, message, *args):
+        if self.level <= WARNING:
+            self.write(WARNING, message, args)
+
+    def error(self, message, *args):
+        if self.level <= ERROR:
+            self.write(ERROR, message, args)
+
+    def lines(self):
+        return [f"[tick {tick}] {LEVEL_NAMES[level]} {message}" for tick, level, message in self.buffer]
+
+    def dump(self, path=None):
+        """Write the buffered messages, oldest first, to the file at `path` or else to the console."""
+        lines = self.lines()
+        if path is None:
+            for line in lines:
+                js.console.log(line)
+        else:
+            with open(path, "w") as f:
+                f.write("".join(line + "\n" for line in lines))
+        return len(lines)
+
+    def clear(self):
+        self.buffer.clear()
+
+
+log = GameLog()
\ No newline at end of file
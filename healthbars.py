@@ -0,0 +1,66 @@
+import math
+import pygame
+from fonts import font_registry
+
+BACKGROUND_COLOR = (100, 100, 100)
+LABEL_COLOR = (255, 255, 255)
+
+
+class HealthBarRenderer:
+    """
+    Shared cache of pre-rendered health bar surfaces.
+
+    Bars are quantized to `steps` fill levels per (width, height, colour), so each
+    distinct bar is rendered once. HP labels are hidden while more than `label_limit`
+    units are on screen, or always when `labels_enabled` is False.
+    """
+
+    def __init__(self, steps=32, label_limit=40):
+        self.steps = steps
+        self.label_limit = label_limit
+        self.labels_enabled = True
+        self.show_labels = True
+        self.bars = {}
+
+    def set_unit_count(self, count):
+        self.show_labels = self.labels_enabled and count <= self.label_limit
+
+    def get_bar(self, width, height, fill_color, ratio):
+        # Round up so a unit that is still alive never shows an empty bar
+        step = min(self.steps, max(0, math.ceil(ratio * self.steps)))
+        key = (width, height, fill_color, step)
+        bar = self.bars.get(key)
+        if bar is None:
+            bar = pygame.Surface((width, height))
+            bar.fill(BACKGROUND_COLOR)
+            pygame.draw.rect(bar, fill_color, (0, 0, width * step // self.steps, height))
+            self.bars[key] = bar
+        return bar
+
+
+health_bars = HealthBarRenderer()
+
+
+class HealthBar:
+    """Per-entity health bar; the "hp/max" label is re-rendered only when its integer value changes."""
+
+    __slots__ = ("width", "height", "fill_color", "font_size", "label_offset", "label", "label_value")
+
+    def __init__(self, width, height, fill_color, font_size=None, label_offset=0):
+        self.width = width
+        self.height = height
+        self.fill_color = fill_color
+        self.font_size = font_size
+        self.label_offset = label_offset
+        self.label = None
+        self.label_value = None
+
+    def draw(self, screen, x, y, health, max_health):
+        screen.blit(health_bars.get_bar(self.width, self.height, self.fill_color, health / max_health), (x, y))
+        if self.font_size and health_bars.show_labels:
+            value = (int(health), max_health)
+            if value != self.label_value:
+                font = font_registry.get("Arial", self.font_size)
+                self.label = font.render(f"{value[0]}/{max_health}", True, LABEL_COLOR)
+                self.label_value = value
+            screen.blit(self.label, (x + (self.width - self.label.get_width()) // 2, y - self.label_offset))
\ No newline at end of file
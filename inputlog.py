@@ -0,0 +1,84 @@
+"""
+Compact per-battle input log for exact replays.
+
+A log holds everything a battle depends on besides the code and assets: level,
+RNG seed, the player's profile at the start, and every player input tagged
+with the simulation tick it was applied before. Inputs are recorded as
+actions rather than mouse positions:
+
+    [tick, "s", unit name]               spawn_unit
+    [tick, "u", index in units, type]    apply_upgrade
+    [tick, "o"]                          story dialog okay
+
+Every CHECKPOINT_TICKS ticks a CRC of the battle state is stored as well, so
+replay.py can tell exactly where a replay stops matching.
+"""
+import copy
+import json
+import zlib
+from animations import animation_registry
+from simclock import sim_clock
+
+LOG_VERSION = 1
+SPAWN = "s"
+UPGRADE = "u"
+OKAY = "o"
+CHECKPOINT_TICKS = 300
+REPLAY_PATH = "last_battle.replay.json"
+
+
+def state_hash(game):
+    # Numbers go through float() so a battle restored from a snapshot (which stores doubles) hashes the same
+    units = [(unit.name, float(unit.x), float(unit.health), unit.state, unit.frame)
+             for unit in game.entities]
+    state = (sim_clock.ticks, float(game.seeds), game.xp, float(game.player_base.health),
+             float(game.enemy_base.health), units, game.projectiles.positions())
+    return zlib.crc32(repr(state).encode())
+
+
+class InputRecorder:
+    def __init__(self, game):
+        self.game = game
+        profile = game.main_menu
+        self.header = {
+            "version": LOG_VERSION,
+            "level": game.level.level_number,
+            "seed": game.seed,
+            "max_level": profile.max_level,
+            "secured_seeds": profile.secured_seeds,
+            "unit_upgrades": copy.deepcopy(profile.unit_upgrades),
+            "player_units": [unit_type.name for unit_type in profile.get_available_units()],
+            # Headless battles run on blank stand-in sprites, which replay must use as well
+            "placeholder_assets": animation_registry.headless,
+        }
+        self.inputs = []
+        self.checkpoints = []
+
+    def resumed(self, snapshot_text):
+        """The battle continues from a saved snapshot, which replay restores before the first input."""
+        self.header["snapshot"] = snapshot_text
+
+    def record(self, code, *args):
+        self.inputs.append([sim_clock.ticks, code, *args])
+
+    def checkpoint(self):
+        if sim_clock.ticks % CHECKPOINT_TICKS == 0:
+            self.checkpoints.append([sim_clock.ticks, state_hash(self.game)])
+
+    def to_dict(self):
+        # Base upgrades are applied to the game rather than kept on the profile
+        return {**self.header, "base_health": self.game.player_base.max_health,
+                "passive_income": self.game.passive_income, "ticks": sim_clock.ticks,
+                "inputs": self.inputs, "checkpoints": self.checkpoints}
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+
+def load_log(path):
+    with open(path) as f:
+        log = json.load(f)
+    if log.get("version") != LOG_VERSION:
+        raise ValueError(f"Unsupported input log version: {log.get('version')}")
+    return log
\ No newline at end of file
@@ -0,0 +1,85 @@
+from functools import partial
+from animations import animation_registry
+from sprites import sprite_store
+from sounds import sound_bank
+from units import UNIT_ROSTER, Bandit_King, Undead_Mage
+from gamelog import log
+
+BANDIT_KING_LEVEL = 5
+SEED_IMAGE = ("assets/images/seed.png", (51, 51))
+ARROW_IMAGE = ("assets/images/arrow.png", (32, 16))
+MAGICBALL_IMAGE = ("assets/images/magicball.png", (32, 32))
+CART_IMAGE = ("assets/images/Cart.png", (150, 150))
+MENU_SOUNDS = ["assets/sounds/UI/button_click.wav", "assets/sounds/UI/button_back.wav"]
+
+
+class LevelAssets:
+    """
+    Resolves and loads the unit animations, images and sounds a single level needs.
+
+    Only the player's available units, the level's enemy roster and its boss are
+    decoded before the battle starts. Factions the level does not use are evicted,
+    so at most the player's and one enemy faction's frames stay resident.
+
+    `steps` and `menu_steps` return the manifest as (label, callable) pairs that a
+    StreamingLoader can run in slices; `load` runs a level's steps in one go.
+    """
+
+    def resolve(self, level, player_units):
+        """Return ([(faction, unit_type)], [(image path, size)]) for `level`."""
+        units = [("Player", unit_type) for unit_type in player_units]
+        units += [(level.faction, unit_type) for unit_type in level.units]
+        images = [SEED_IMAGE, ARROW_IMAGE]
+        if level.level_number == BANDIT_KING_LEVEL:
+            units.append((level.faction, Bandit_King))
+            images.append(CART_IMAGE)
+        if Undead_Mage in level.units:
+            images.append(MAGICBALL_IMAGE)
+        return units, images
+
+    def steps(self, level, player_units):
+        units, images = self.resolve(level, player_units)
+        factions = {faction for faction, _ in units}
+        steps = [("unused factions", partial(animation_registry.retain_factions, factions))]
+        sounds = []
+        for faction, unit_type in units:
+            label = f"{faction}/{unit_type.name}"
+            scale = unit_type.sprite_scale
+            steps.append((label, partial(animation_registry.get, faction, unit_type.name, scale)))
+            steps.append((f"{label} masks", partial(animation_registry.get_masks, faction, unit_type.name, scale)))
+            if faction != "Player":
+                # Enemies face left and also draw from the mirrored set
+                steps.append((f"{label} mirrored", partial(animation_registry.get, faction, unit_type.name, scale, True)))
+                steps.append((f"{label} mirrored masks", partial(animation_registry.get_masks, faction, unit_type.name, scale, True)))
+            for handle in (unit_type.attack_sound, unit_type.death_sound):
+                if handle and handle.sound_id not in sounds:
+                    sounds.append(handle.sound_id)
+        steps += [(path, partial(sprite_store.get, path, size)) for path, size in images]
+        steps += [(sound_id, partial(sound_bank.get, sound_id)) for sound_id in sounds]
+        return steps
+
+    def menu_steps(self):
+        """Assets the main menu draws before it can take input: player unit icons and UI sounds."""
+        steps = [(f"Player/{unit_type.name}", partial(animation_registry.get, "Player", unit_type.name, unit_type.sprite_scale))
+                 for unit_type in UNIT_ROSTER["Player"]]
+        steps += [(sound_id, partial(sound_bank.get, sound_id)) for sound_id in MENU_SOUNDS]
+        return steps
+
+    def load(self, level, player_units):
+        for label, step in self.steps(level, player_units):
+            step()
+        if not animation_registry.headless:
+            log.info(self.format_report())
+
+    def memory_report(self):
+        """Resident decoded bytes per faction, plus shared static images."""
+        report = animation_registry.resident_bytes()
+        report["images"] = sprite_store.resident_bytes()
+        return report
+
+    def format_report(self):
+        parts = [f"{group} {size / (1024 * 1024):.1f} MB" for group, size in sorted(self.memory_report().items())]
+        return "Resident assets: " + ", ".join(parts)
+
+
+level_assets = LevelAssets()
\ No newline at end of file
@@ -3,7 +3,7 @@ from units import (
     Zombie_Archer, Zombie_Assassin, Zombie_Farmer, Zombie_Melee, Zombie_Tank,
     Undead_Axeman, Undead_King, Undead_Mage, Undead_Samurai, Undead_Warrior
 )
-import random
+from simclock import sim_clock
 
 class Level:
     def __init__(self, level_number):
@@ -21,4 +21,4 @@ class Level:
             raise ValueError(f"Invalid level number: {self.level_number}")
 
     def get_next_enemy_unit(self):
-        return random.choice(self.units) if self.units else None
\ No newline at end of file
+        return sim_clock.rng.choice(self.units) if self.units else None
\ No newline at end of file
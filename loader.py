@@ -0,0 +1,58 @@
+import asyncio
+import time
+from collections import deque
+from gamelog import log
+
+
+class StreamingLoader:
+    """
+    Runs queued asset decode steps in short slices between asyncio yields.
+
+    Each step is one (label, callable) pair from an asset manifest, such as a
+    spritesheet, its masks or a sound. `run_slice` runs steps until `slice_ms` has
+    elapsed, so in the browser each slice fits inside a frame and the page keeps
+    painting. `progress` gives a real fraction for the loading bar.
+    """
+
+    def __init__(self, steps=(), slice_ms=8):
+        self.slice_ms = slice_ms
+        self.steps = deque()
+        self.done = 0
+        self.total = 0
+        self.label = ""
+        self.add(steps)
+
+    def add(self, steps):
+        for label, step in steps:
+            self.steps.append((label, step))
+            self.total += 1
+
+    @property
+    def finished(self):
+        return not self.steps
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    def run_slice(self, slice_ms=None):
+        """Run steps until the time budget is spent; at least one step runs per call."""
+        deadline = time.perf_counter() + (self.slice_ms if slice_ms is None else slice_ms) / 1000
+        while self.steps:
+            self.label, step = self.steps.popleft()
+            try:
+                step()
+            except Exception as e:
+                log.warning("Failed to load %s: %s", self.label, e)
+            self.done += 1
+            if time.perf_counter() >= deadline:
+                break
+        return self.finished
+
+    async def run(self, on_progress=None):
+        """Run every step, yielding to the event loop (and redrawing progress) between slices."""
+        while not self.finished:
+            self.run_slice()
+            if on_progress:
+                on_progress(self)
+            await asyncio.sleep(0)
\ No newline at end of file
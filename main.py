@@ -1,10 +1,29 @@
 import pygame
 import asyncio
+import time
 from menu import MainMenu
 from game_logic import Game
-from units import preload_all_animations
+from levels import Level
+from loader import StreamingLoader
+from level_assets import level_assets
+from gamelog import log
+
+# Budget for background battle-asset decoding while the menu is running, per frame
+MENU_LOAD_SLICE_MS = 4
+
+
+def draw_loading(screen, font, loader, title):
+    screen.fill((14, 39, 59))
+    screen.blit(font.render(title, True, (255, 255, 255)), (50, 50))
+    bar = pygame.Rect(50, 120, 1920 - 100, 30)
+    pygame.draw.rect(screen, (100, 100, 100), bar)
+    pygame.draw.rect(screen, (0, 200, 0), (bar.x, bar.y, int(bar.width * loader.progress), bar.height))
+    screen.blit(font.render(f"{loader.done}/{loader.total} {loader.label}", True, (255, 255, 255)), (50, 170))
+    pygame.display.flip()
+
 
 async def main():
+    start = time.perf_counter()
     pygame.init()
     pygame.font.init()
     pygame.mixer.init()
@@ -13,15 +32,7 @@ async def main():
     clock = pygame.time.Clock()
     font = pygame.font.SysFont("Arial", 36)
 
-    screen.fill((255, 0, 0))
-    screen.blit(font.render("Initializing...", True, (255, 255, 255)), (50, 50))
-    pygame.display.flip()
-    await asyncio.sleep(1)
-
-    screen.fill((255, 165, 0))
-    screen.blit(font.render("Creating Menu...", True, (255, 255, 255)), (50, 100))
-    pygame.display.flip()
-    await asyncio.sleep(0.5)
+    await StreamingLoader(level_assets.menu_steps()).run(lambda loader: draw_loading(screen, font, loader, "Loading..."))
     try:
         main_menu = MainMenu(screen, clock)
     except Exception as e:
@@ -30,33 +41,25 @@ async def main():
         pygame.display.flip()
         await asyncio.sleep(5)
         raise
+    log.info("Time to interactive menu: %.0f ms", (time.perf_counter() - start) * 1000)
 
-    screen.fill((255, 255, 0))
-    screen.blit(font.render("Preloading Animations...", True, (255, 255, 255)), (50, 150))
-    pygame.display.flip()
-    await asyncio.sleep(0.5)
-    preload_all_animations()
-
-    screen.fill((0, 255, 0))
-    screen.blit(font.render("Starting Menu Loop...", True, (255, 255, 255)), (50, 200))
-    pygame.display.flip()
-    await asyncio.sleep(0.5)
+    # Keep decoding the most likely next battle (the highest unlocked level) in the background
+    battle_loader = StreamingLoader(level_assets.steps(Level(min(main_menu.max_level, 20)), main_menu.get_available_units()),
+                                    slice_ms=MENU_LOAD_SLICE_MS)
 
     while main_menu.active:
         main_menu.run()
+        if not battle_loader.finished:
+            battle_loader.run_slice()
         pygame.display.flip()
         clock.tick(60)
         await asyncio.sleep(0)
 
     if main_menu.game:
-        screen.fill((0, 0, 255))
-        screen.blit(font.render("Starting Game...", True, (255, 255, 255)), (50, 250))
-        pygame.display.flip()
-        await asyncio.sleep(0.5)
-
-        screen.blit(font.render("Creating Game Object...", True, (255, 255, 255)), (50, 300))
-        pygame.display.flip()
-        await asyncio.sleep(0.5)
+        # Already-decoded assets are cache hits, so this only streams what the chosen level still needs
+        level = Level(main_menu.level_number)
+        await StreamingLoader(level_assets.steps(level, main_menu.get_available_units())).run(
+            lambda loader: draw_loading(screen, font, loader, f"Loading level {level.level_number}..."))
         try:
             game = Game(main_menu.level_number, main_menu, screen, clock)
         except Exception as e:
@@ -64,10 +67,8 @@ async def main():
             pygame.display.flip()
             await asyncio.sleep(5)
             raise
+        game.resume_saved_battle()
 
-        screen.blit(font.render("Running Game...", True, (255, 255, 255)), (50, 400))
-        pygame.display.flip()
-        await asyncio.sleep(0.5)
         await game.run()
 
     pygame.quit()
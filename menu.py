@@ -4,6 +4,8 @@ from units import Player_PeasantUnit, Player_ArcherUnit, Player_WarriorUnit, Pla
 from game_logic import Game
 from showroom import Showroom
 from achievements import Achievements
+from sounds import sound_bank
+from fonts import font_registry, text_cache, OPEN_SANS_BOLD, OPEN_SANS_REGULAR
 
 class MainMenu:
     def __init__(self, screen, clock):
@@ -12,7 +14,7 @@ class MainMenu:
         self.active = True
         self.game = False  # Added for game start trigger
         self.level_number = 1  # Added for level selection compatibility
-        self.secured_seeds, self.max_level, self.unit_upgrades, self.base_upgrades = self.load_player_data()
+        self.secured_seeds, self.max_level, self.unit_upgrades, self.base_upgrades, self.battle_snapshot = self.load_player_data()
         self.achievements = Achievements()
 
         # Load background with fallback
@@ -136,13 +138,11 @@ class MainMenu:
         self.scale_factor = 1.0
 
         # Load assets with relative paths
+        self.click_sound = sound_bank.handle("assets/sounds/UI/button_click.wav")
+        self.back_sound = sound_bank.handle("assets/sounds/UI/button_back.wav")
         try:
-            self.click_sound = pygame.mixer.Sound("assets/sounds/UI/button_click.wav")
-            self.back_sound = pygame.mixer.Sound("assets/sounds/UI/button_back.wav")
             self.button_bg = pygame.image.load("assets/ui/ui_buttons.png").convert_alpha()
         except Exception:
-            self.click_sound = None
-            self.back_sound = None
             self.button_bg = pygame.Surface((100, 30))
             self.button_bg.fill((147, 208, 207))
 
@@ -156,17 +156,19 @@ class MainMenu:
                 data.get("secured_seeds", 100),
                 data.get("max_level", 1),
                 data.get("unit_upgrades", None),
-                data.get("base_upgrades", None)
+                data.get("base_upgrades", None),
+                data.get("battle_snapshot", None)
             )
         except Exception:
-            return 100, 1, None, None
+            return 100, 1, None, None, None
 
     def save_player_data(self):
         data = {
             "secured_seeds": self.secured_seeds,
             "max_level": self.max_level,
             "unit_upgrades": self.unit_upgrades,
-            "base_upgrades": self.base_upgrades
+            "base_upgrades": self.base_upgrades,
+            "battle_snapshot": self.battle_snapshot
         }
         try:
             import js
@@ -326,34 +328,30 @@ class MainMenu:
         screen.blit(self.background, (0, 0))
 
         # Load fonts with fallback
-        try:
-            FONT_CTA = pygame.font.Font("assets/fonts/OpenSans-Bold.ttf", 40)
-            FONT_BODY = pygame.font.Font("assets/fonts/OpenSans-Regular.ttf", 32)
-        except Exception:
-            FONT_CTA = pygame.font.SysFont("Open Sans", 40, bold=True)
-            FONT_BODY = pygame.font.SysFont("Open Sans", 32)
+        FONT_CTA = font_registry.get(OPEN_SANS_BOLD, 40)
+        FONT_BODY = font_registry.get(OPEN_SANS_REGULAR, 32)
 
         if not any([self.show_upgrades, self.show_levels, self.show_achievements, self.show_options]):
-            title_text = FONT_CTA.render("Evolution War", True, (249, 249, 242))
+            title_text = text_cache.render(FONT_CTA, "Evolution War", (249, 249, 242))
             screen.blit(title_text, (1920 // 2 - title_text.get_width() // 2, 200))
             for button, rect in self.menu_buttons.items():
                 bg = pygame.transform.scale(self.button_bg, (rect.width, rect.height))
                 screen.blit(bg, (rect.x, rect.y))
-                text = FONT_CTA.render(button, True, (249, 249, 242))
+                text = text_cache.render(FONT_CTA, button, (249, 249, 242))
                 screen.blit(text, (rect.x + (rect.width - text.get_width()) // 2, rect.y + (rect.height - text.get_height()) // 2))
 
         elif self.show_options:
             for button, rect in self.options_buttons.items():
                 bg = pygame.transform.scale(self.button_bg, (rect.width, rect.height))
                 screen.blit(bg, (rect.x, rect.y))
-                text = FONT_CTA.render(button, True, (249, 249, 242))
+                text = text_cache.render(FONT_CTA, button, (249, 249, 242))
                 screen.blit(text, (rect.x + (rect.width - text.get_width()) // 2, rect.y + (rect.height - text.get_height()) // 2))
 
         elif self.show_upgrades:
             for category, rect in self.category_buttons.items():
                 color = (128, 131, 134) if category != self.current_category else (147, 208, 207)
                 pygame.draw.rect(screen, color, rect)
-                text = FONT_BODY.render(category, True, (249, 249, 242))
+                text = text_cache.render(FONT_BODY, category, (249, 249, 242))
                 screen.blit(text, (rect.x + (rect.width - text.get_width()) // 2, rect.y + (rect.height - text.get_height()) // 2))
 
             if self.current_category == "Base":
@@ -367,7 +365,7 @@ class MainMenu:
                         greyed = bg.copy()
                         greyed.fill((100, 100, 100, 150), special_flags=pygame.BLEND_RGBA_SUB)
                         screen.blit(greyed, (rect.x, rect.y))
-                    text = FONT_BODY.render(f"{upgrade} (Lv {data['level']}) - {data['cost']} Seeds", True, (249, 249, 242))
+                    text = text_cache.render(FONT_BODY, f"{upgrade} (Lv {data['level']}) - {data['cost']} Seeds", (249, 249, 242))
                     screen.blit(text, (rect.x + (rect.width - text.get_width()) // 2, rect.y + (rect.height - text.get_height()) // 2))
 
             elif self.current_category == "Units":
@@ -386,16 +384,16 @@ class MainMenu:
                         greyed = bg.copy()
                         greyed.fill((100, 100, 100, 150), special_flags=pygame.BLEND_RGBA_SUB)
                         screen.blit(greyed, (rect.x, rect.y))
-                    text = FONT_BODY.render(f"{upgrade} (Lv {data['level']}) - {data['cost']} Seeds", True, (249, 249, 242))
+                    text = text_cache.render(FONT_BODY, f"{upgrade} (Lv {data['level']}) - {data['cost']} Seeds", (249, 249, 242))
                     screen.blit(text, (rect.x + (rect.width - text.get_width()) // 2, rect.y + (rect.height - text.get_height()) // 2))
 
             bg = pygame.transform.scale(self.button_bg, (self.back_button.width, self.back_button.height))
             screen.blit(bg, (self.back_button.x, self.back_button.y))
-            back_text = FONT_CTA.render("Back", True, (249, 249, 242))
+            back_text = text_cache.render(FONT_CTA, "Back", (249, 249, 242))
             screen.blit(back_text, (self.back_button.x + (self.back_button.width - back_text.get_width()) // 2, self.back_button.y + (self.back_button.height - back_text.get_height()) // 2))
 
         elif self.show_levels:
-            level_title = FONT_CTA.render(f"Select Level (Levels {self.current_section * 5 + 1}-{min((self.current_section + 1) * 5, 20)})", True, (249, 249, 242))
+            level_title = text_cache.render(FONT_CTA, f"Select Level (Levels {self.current_section * 5 + 1}-{min((self.current_section + 1) * 5, 20)})", (249, 249, 242))
             screen.blit(level_title, (1920 // 2 - level_title.get_width() // 2, 100))
             section_start = self.current_section * 5 + 1
             section_end = min(section_start + 4, 20)
@@ -408,7 +406,7 @@ class MainMenu:
                     greyed = bg.copy()
                     greyed.fill((100, 100, 100, 150), special_flags=pygame.BLEND_RGBA_SUB)
                     screen.blit(greyed, (rect.x, rect.y))
-                text = FONT_BODY.render(f"Level {level}", True, (249, 249, 242))
+                text = text_cache.render(FONT_BODY, f"Level {level}", (249, 249, 242))
                 screen.blit(text, (rect.x + (rect.width - text.get_width()) // 2, rect.y + (rect.height - text.get_height()) // 2))
 
             bg_prev = pygame.transform.scale(self.button_bg, (self.prev_button.width, self.prev_button.height))
@@ -418,7 +416,7 @@ class MainMenu:
                 greyed = bg_prev.copy()
                 greyed.fill((100, 100, 100, 150), special_flags=pygame.BLEND_RGBA_SUB)
                 screen.blit(greyed, (self.prev_button.x, self.prev_button.y))
-            prev_text = FONT_CTA.render("Prev", True, (249, 249, 242))
+            prev_text = text_cache.render(FONT_CTA, "Prev", (249, 249, 242))
             screen.blit(prev_text, (self.prev_button.x + (self.prev_button.width - prev_text.get_width()) // 2, self.prev_button.y + (self.prev_button.height - prev_text.get_height()) // 2))
 
             bg_next = pygame.transform.scale(self.button_bg, (self.next_button.width, self.next_button.height))
@@ -428,22 +426,22 @@ class MainMenu:
                 greyed = bg_next.copy()
                 greyed.fill((100, 100, 100, 150), special_flags=pygame.BLEND_RGBA_SUB)
                 screen.blit(greyed, (self.next_button.x, self.next_button.y))
-            next_text = FONT_CTA.render("Next", True, (249, 249, 242))
+            next_text = text_cache.render(FONT_CTA, "Next", (249, 249, 242))
             screen.blit(next_text, (self.next_button.x + (self.next_button.width - next_text.get_width()) // 2, self.next_button.y + (self.next_button.height - next_text.get_height()) // 2))
 
             bg = pygame.transform.scale(self.button_bg, (self.back_button.width, self.back_button.height))
             screen.blit(bg, (self.back_button.x, self.back_button.y))
-            back_text = FONT_CTA.render("Back", True, (249, 249, 242))
+            back_text = text_cache.render(FONT_CTA, "Back", (249, 249, 242))
             screen.blit(back_text, (self.back_button.x + (self.back_button.width - back_text.get_width()) // 2, self.back_button.y + (self.back_button.height - back_text.get_height()) // 2))
 
         elif self.show_achievements:
             self.achievements.draw_achievements_menu(screen)
             bg = pygame.transform.scale(self.button_bg, (self.back_button.width, self.back_button.height))
             screen.blit(bg, (self.back_button.x, self.back_button.y))
-            back_text = FONT_CTA.render("Back", True, (249, 249, 242))
+            back_text = text_cache.render(FONT_CTA, "Back", (249, 249, 242))
             screen.blit(back_text, (self.back_button.x + (self.back_button.width - back_text.get_width()) // 2, self.back_button.y + (self.back_button.height - back_text.get_height()) // 2))
 
-        seeds_text = FONT_BODY.render(f"Secured Seeds: {int(self.secured_seeds)}", True, (249, 249, 242))
+        seeds_text = text_cache.render(FONT_BODY, f"Secured Seeds: {int(self.secured_seeds)}", (249, 249, 242))
         screen.blit(seeds_text, (1920 - seeds_text.get_width() - 20, 50))
         self.achievements.draw_popup(screen)
 
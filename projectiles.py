@@ -0,0 +1,528 @@
+"""
+Pooled arrows and magic balls.
+
+Every projectile in flight lives in one set of preallocated parallel arrays
+(position, previous position, start, velocity, gravity, damage, range, kind,
+direction, target id); a spent slot goes on a free list for the next shot, so
+firing allocates nothing once the pool has grown to the battle's peak. Each
+tick moves every projectile in one pass, vectorized when numpy is installed and
+a plain loop over the arrays otherwise (numpy is not part of the web build),
+then resolves hits: a bounding-box broadphase against each target's rect picks
+the few projectiles that may touch, and only those get the exact rect and
+sprite-mask test, in firing order. Both paths play out exactly like the old
+per-projectile objects, so replays and snapshots are unaffected by which runs.
+
+With `predicted` set, arrows skip the per-tick step. An arrow's arc is closed
+form from the tick it was loosed, and its target is taken to keep moving along
+the lane at its current speed, so the first tick the arrow's box can meet the
+target's rect is solved when it is fired and the arrow is scheduled for then
+(or for leaving its range). Only from that tick does it get the exact rect and
+mask test, and a target whose state, speed or lane position changes from the
+prediction has its arrows rescheduled. An arrow in flight then costs only its
+draw. The outcome is close to, but not tick-for-tick the same as, the default
+path, so the mode is off by default and a battle must not switch mid-replay;
+benchmarks/arrow_prediction.py compares the hit rates of the two.
+
+Targets are units or bases, kept once each in `targets` and referenced by id.
+"""
+import math
+import pygame
+from simclock import sim_clock
+from sprites import get_rotations, sprite_store
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ARROW, MAGIC_BALL = range(2)
+ARROW_GRAVITY = 0.2
+MAGIC_BALL_SPEED = 5
+MAX_DISTANCE = 1000
+# Half sizes of the hit boxes, centred on the projectile
+ARROW_HALF_WIDTH, ARROW_HALF_HEIGHT = 16, 8
+MAGIC_BALL_HALF_SIZE = 16
+FLOAT_FIELDS = ("x", "y", "prev_x", "prev_y", "start_x", "start_y", "vx", "vy", "gravity", "damage", "max_distance",
+                "base_x", "base_y", "base_vy")
+INT_FIELDS = ("kind", "direction", "target", "base_tick", "event_tick", "expire_tick", "serial")
+# Drop targets no projectile refers to once the table is this much bigger than the pool
+TARGET_SLACK = 64
+# Predicted arrows are rescheduled once their target is this many pixels off its predicted x
+DRIFT_TOLERANCE = 1.0
+# Predicted boxes are this much wider than the exact test's: rect rounding on both sides plus the drift allowed,
+# so a tick the exact test could hit on is never skipped
+PREDICTION_MARGIN = 2 + DRIFT_TOLERANCE
+
+
+def aim_point(target, direction):
+    if hasattr(target, 'x') and hasattr(target, 'y'):
+        return target.x + (60 * getattr(target, 'scale_factor', 1.0)), target.y + (102 * getattr(target, 'scale_factor', 1.0))
+    return target.x + (75 if direction == 1 else 150), target.y + 150
+
+
+def is_down(target):
+    """Arrows in flight to a target in this state are dropped."""
+    return (hasattr(target, 'state') and target.state == "die") or (hasattr(target, 'health') and target.health <= 0)
+
+
+def is_standing(target):
+    """Hits on a target in this state deal damage; magic balls keep flying toward it."""
+    return (hasattr(target, 'state') and target.state != "die") or (hasattr(target, 'health') and target.health > 0)
+
+
+def motion_key(target):
+    """What a predicted arrow assumes about its target; any change reschedules the arrows at it."""
+    return (getattr(target, 'state', None), getattr(target, 'speed', 0), getattr(target, 'is_retreating', False),
+            is_down(target))
+
+
+def lane_speed(target):
+    """Pixels per tick the target moves along the lane, as collisions.py moves running units."""
+    if getattr(target, 'state', None) == "run":
+        return target.speed * target.direction
+    return 0
+
+
+class ProjectilePool:
+    def __init__(self, capacity=256, vectorized=None, predicted=False):
+        self.vectorized = np is not None if vectorized is None else vectorized
+        # Set between battles, never with projectiles in flight
+        self.predicted = predicted
+        self.arrays = None
+        self.allocate(capacity)
+        self.free = list(range(capacity - 1, -1, -1))
+        # Occupied slots in firing order, which is the order hits resolve in
+        self.live = []
+        # Predicted arrows in firing order (a dict as an ordered set), and the ticks their next events are due at
+        self.flying = {}
+        self.schedule = {}
+        # target id -> (motion_key, x, tick, lane_speed) the target's predicted arrows were scheduled against
+        self.watch = {}
+        self.targets = []
+        self.target_ids = {}
+        self.tick = 0
+        self.serial = 0
+        # Shots fired and shots that dealt damage, by kind
+        self.fired = [0, 0]
+        self.landed = [0, 0]
+
+    def reset(self):
+        """Empty the pool for a new battle, keeping its storage, and load the projectile sprites."""
+        self.clear()
+        self.fired = [0, 0]
+        self.landed = [0, 0]
+        if self.vectorized != (np is not None and isinstance(self.arrays["x"], np.ndarray)):
+            # Switched between numpy and list storage; nothing is live, so nothing to copy
+            self.arrays = None
+            self.allocate(self.capacity)
+        self.arrow_sprite = sprite_store.get("assets/images/arrow.png", (32, 16), fallback_color=(255, 255, 255))
+        self.arrow_rotations = get_rotations("arrow", self.arrow_sprite)
+        self.magic_ball_sprite = sprite_store.get("assets/images/magicball.png", (32, 32), fallback_color=(128, 0, 128))
+        self.magic_ball_rotations = get_rotations("magicball", self.magic_ball_sprite)
+
+    def allocate(self, capacity):
+        """(Re)allocate storage for `capacity` slots, keeping the contents of existing ones."""
+        old = self.arrays
+        self.arrays = {}
+        for name in FLOAT_FIELDS + INT_FIELDS:
+            kind = float if name in FLOAT_FIELDS else int
+            if self.vectorized:
+                array = np.zeros(capacity, dtype=np.float64 if kind is float else np.int64)
+                if old is not None:
+                    array[:len(old[name])] = old[name]
+            else:
+                array = [kind(0)] * capacity
+                if old is not None:
+                    array[:len(old[name])] = old[name]
+            self.arrays[name] = array
+        self.capacity = capacity
+
+    def __len__(self):
+        return len(self.live) + len(self.flying)
+
+    def clear(self):
+        self.free.extend(reversed(self.live))
+        self.free.extend(reversed(self.flying))
+        self.live = []
+        self.flying = {}
+        self.schedule = {}
+        self.watch = {}
+        self.targets = []
+        self.target_ids = {}
+
+    def target_id(self, target):
+        target_id = self.target_ids.get(id(target))
+        if target_id is None:
+            target_id = self.target_ids[id(target)] = len(self.targets)
+            self.targets.append(target)
+        return target_id
+
+    def add(self, kind, direction, target, x, y, vx, vy, damage, max_distance=MAX_DISTANCE,
+            prev_x=None, prev_y=None, start_x=None, start_y=None, base=None):
+        """`base` is a predicted arrow's (base_x, base_y, base_vy, ticks since), as records() gives it."""
+        if not self.free:
+            old_capacity = self.capacity
+            self.allocate(old_capacity * 2)
+            self.free = list(range(self.capacity - 1, old_capacity - 1, -1))
+        slot = self.free.pop()
+        arrays = self.arrays
+        arrays["kind"][slot] = kind
+        arrays["direction"][slot] = direction
+        arrays["target"][slot] = self.target_id(target)
+        arrays["x"][slot] = x
+        arrays["y"][slot] = y
+        arrays["prev_x"][slot] = x if prev_x is None else prev_x
+        arrays["prev_y"][slot] = y if prev_y is None else prev_y
+        arrays["start_x"][slot] = x if start_x is None else start_x
+        arrays["start_y"][slot] = y if start_y is None else start_y
+        arrays["vx"][slot] = vx
+        arrays["vy"][slot] = vy
+        arrays["gravity"][slot] = ARROW_GRAVITY if kind == ARROW else 0.0
+        arrays["damage"][slot] = damage
+        arrays["max_distance"][slot] = max_distance
+        if kind == ARROW and self.predicted:
+            base_x, base_y, base_vy, age = base or (x, y, vy, 0)
+            arrays["base_tick"][slot] = self.tick - age
+            arrays["base_x"][slot] = base_x
+            arrays["base_y"][slot] = base_y
+            arrays["base_vy"][slot] = base_vy
+            arrays["serial"][slot] = self.serial
+            self.serial += 1
+            self.flying[slot] = None
+            self.predict(slot, self.tick + 1)
+        else:
+            self.live.append(slot)
+        return slot
+
+    def spawn_arrow(self, x, y, direction, target, damage, max_distance=MAX_DISTANCE):
+        """Loose an arrow on a ballistic arc that lands on `target`, with a little random spread in flight time."""
+        target_x, target_y = aim_point(target, direction)
+        dx = target_x - x
+        dy = target_y - y
+        travel_time = max(20, min(60, int(abs(dx) / 10))) + sim_clock.rng.randint(-5, 5)
+        vx = dx / travel_time if dx != 0 else 3 * direction
+        vy = (dy - 0.5 * ARROW_GRAVITY * travel_time * (travel_time - 1)) / travel_time
+        self.fired[ARROW] += 1
+        return self.add(ARROW, direction, target, x, y, vx, vy, damage, max_distance)
+
+    def spawn_magic_ball(self, x, y, direction, target, damage, max_distance=MAX_DISTANCE):
+        """Cast a magic ball flying straight at `target`."""
+        target_x, target_y = aim_point(target, direction)
+        dx = target_x - x
+        dy = target_y - y
+        distance = math.sqrt(dx**2 + dy**2)
+        if distance <= 0:
+            # Already on the target; such a shot vanished before it could be drawn
+            return None
+        self.fired[MAGIC_BALL] += 1
+        return self.add(MAGIC_BALL, direction, target, x, y, MAGIC_BALL_SPEED * (dx / distance),
+                        MAGIC_BALL_SPEED * (dy / distance), damage, max_distance)
+
+    def save_positions(self):
+        arrays = self.arrays
+        if self.vectorized:
+            arrays["prev_x"][:] = arrays["x"]
+            arrays["prev_y"][:] = arrays["y"]
+        else:
+            for slot in self.live:
+                arrays["prev_x"][slot] = arrays["x"][slot]
+                arrays["prev_y"][slot] = arrays["y"][slot]
+
+    def positions(self):
+        self.sync()
+        x, y = self.arrays["x"], self.arrays["y"]
+        return [(float(x[slot]), float(y[slot])) for slot in self.live + list(self.flying)]
+
+    def records(self):
+        """
+        (kind, direction, target, x, y, prev_x, prev_y, start_x, start_y, vx, vy, damage, max_distance, base) in
+        firing order, where base is add()'s: the current position and velocity for projectiles stepped each tick.
+        """
+        self.sync()
+        arrays = self.arrays
+        slots = self.live + list(self.flying)
+
+        # Each field gathered for all slots at once; reading numpy arrays an element at a time is slow
+        def column(name):
+            if self.vectorized:
+                return arrays[name][slots].tolist()
+            values = arrays[name]
+            kind = float if name in FLOAT_FIELDS else int
+            return [kind(values[slot]) for slot in slots]
+
+        values = zip(*(column(name) for name in ("x", "y", "prev_x", "prev_y", "start_x", "start_y", "vx", "vy",
+                                                 "damage", "max_distance")))
+        bases = zip(column("base_x"), column("base_y"), column("base_vy"), column("base_tick"))
+        targets = self.targets
+        live_count = len(self.live)
+        records = []
+        for i, (kind, direction, target, row, (base_x, base_y, base_vy, base_tick)) in enumerate(
+                zip(column("kind"), column("direction"), column("target"), values, bases)):
+            if i < live_count:
+                base = (row[0], row[1], row[7], 0)
+            else:
+                base = (base_x, base_y, base_vy, self.tick - base_tick)
+            records.append((kind, direction, targets[target], *row, base))
+        return records
+
+    def hits(self, slot, target):
+        """The exact test: rect overlap, then for arrows the sprite masks at the arrow's current angle."""
+        arrays = self.arrays
+        x, y = arrays["x"][slot], arrays["y"][slot]
+        if arrays["kind"][slot] == MAGIC_BALL:
+            size = 2 * MAGIC_BALL_HALF_SIZE
+            return pygame.Rect(x - MAGIC_BALL_HALF_SIZE, y - MAGIC_BALL_HALF_SIZE, size, size).colliderect(target.get_rect())
+        if not pygame.Rect(x - ARROW_HALF_WIDTH, y - ARROW_HALF_HEIGHT, 2 * ARROW_HALF_WIDTH,
+                           2 * ARROW_HALF_HEIGHT).colliderect(target.get_rect()):
+            return False
+        mask = target.get_mask() if hasattr(target, 'get_mask') else None
+        if mask is None:
+            return True
+        angle = math.degrees(math.atan2(-arrays["vy"][slot], arrays["vx"][slot]))
+        frame_x, frame_y = target.get_offset()
+        offset = (int(x - target.x - frame_x), int(y - target.y - frame_y))
+        return mask.overlap(self.arrow_rotations.get_mask(angle), offset) is not None
+
+    def update(self):
+        """Advance every projectile one tick and resolve its hits."""
+        self.tick += 1
+        if self.live:
+            if self.vectorized:
+                self.update_vectorized()
+            else:
+                self.update_loop()
+        if self.flying:
+            self.update_predicted()
+        elif self.watch:
+            self.watch = {}
+        if len(self.targets) > 2 * len(self) + TARGET_SLACK:
+            self.compact_targets()
+
+    def update_loop(self):
+        arrays = self.arrays
+        x, y, vx, vy = arrays["x"], arrays["y"], arrays["vx"], arrays["vy"]
+        kind, target_of, targets = arrays["kind"], arrays["target"], self.targets
+        survivors = []
+        for slot in self.live:
+            target = targets[target_of[slot]]
+            if kind[slot] == ARROW:
+                if is_down(target):
+                    self.free.append(slot)
+                    continue
+                x[slot] += vx[slot]
+                y[slot] += vy[slot]
+                vy[slot] += ARROW_GRAVITY
+                if abs(x[slot] - arrays["start_x"][slot]) > arrays["max_distance"][slot]:
+                    self.free.append(slot)
+                    continue
+            else:
+                x[slot] += vx[slot]
+                y[slot] += vy[slot]
+                if math.sqrt((x[slot] - arrays["start_x"][slot])**2 + (y[slot] - arrays["start_y"][slot])**2) > arrays["max_distance"][slot]:
+                    self.free.append(slot)
+                    continue
+                if not is_standing(target):
+                    self.free.append(slot)
+                    continue
+            if self.hits(slot, target):
+                if is_standing(target):
+                    target.take_damage(float(arrays["damage"][slot]))
+                    self.landed[kind[slot]] += 1
+                self.free.append(slot)
+                continue
+            survivors.append(slot)
+        self.live = survivors
+
+    def update_vectorized(self):
+        arrays = self.arrays
+        live = np.array(self.live)
+        targets = self.targets
+        target_of = arrays["target"][live]
+        down = np.array([is_down(target) for target in targets])[target_of]
+        standing = np.array([is_standing(target) for target in targets])[target_of]
+        arrow = arrays["kind"][live] == ARROW
+
+        # Arrows whose target is already down are dropped where they are
+        spent = arrow & down
+        moving = live[~spent]
+        arrays["x"][moving] += arrays["vx"][moving]
+        arrays["y"][moving] += arrays["vy"][moving]
+        arrays["vy"][moving] += arrays["gravity"][moving]
+
+        x, y = arrays["x"][live], arrays["y"][live]
+        dx = x - arrays["start_x"][live]
+        dy = y - arrays["start_y"][live]
+        travelled = np.where(arrow, np.abs(dx), np.sqrt(dx**2 + dy**2))
+        spent |= travelled > arrays["max_distance"][live]
+        # Magic balls fly on to a fallen target and vanish there
+        spent |= ~arrow & ~standing
+
+        # Broadphase against every target's rect, a pixel wider than the exact test so rounding never misses a hit
+        rects = [target.get_rect() for target in targets]
+        left = np.array([rect.left for rect in rects])[target_of]
+        top = np.array([rect.top for rect in rects])[target_of]
+        right = np.array([rect.right for rect in rects])[target_of]
+        bottom = np.array([rect.bottom for rect in rects])[target_of]
+        half_width = np.where(arrow, ARROW_HALF_WIDTH, MAGIC_BALL_HALF_SIZE) + 1
+        half_height = np.where(arrow, ARROW_HALF_HEIGHT, MAGIC_BALL_HALF_SIZE) + 1
+        near = ~spent & (x - half_width < right) & (x + half_width > left) & (y - half_height < bottom) & (y + half_height > top)
+
+        # Exact tests in firing order; a hit that fells a target spends the shots fired after it
+        felled_at = {}
+        for position in np.flatnonzero(near).tolist():
+            slot = self.live[position]
+            target = targets[target_of[position]]
+            dropped = is_down(target) if arrow[position] else not is_standing(target)
+            if dropped:
+                spent[position] = True
+            elif self.hits(slot, target):
+                if is_standing(target):
+                    target.take_damage(float(arrays["damage"][slot]))
+                    self.landed[arrays["kind"][slot]] += 1
+                    if is_down(target):
+                        felled_at.setdefault(target_of[position], position)
+                spent[position] = True
+        for target_id, position in felled_at.items():
+            spent[position + 1:] |= target_of[position + 1:] == target_id
+
+        self.free.extend(live[spent].tolist())
+        self.live = live[~spent].tolist()
+
+    def flight_position(self, slot, n):
+        """Closed-form position of a predicted arrow `n` ticks after its base tick."""
+        arrays = self.arrays
+        return (arrays["base_x"][slot] + n * arrays["vx"][slot],
+                arrays["base_y"][slot] + n * arrays["base_vy"][slot] + arrays["gravity"][slot] * n * (n - 1) / 2)
+
+    def place(self, slot, tick):
+        """Write a predicted arrow's position at `tick` into the arrays, as the per-tick step would have left it."""
+        arrays = self.arrays
+        n = tick - arrays["base_tick"][slot]
+        arrays["prev_x"][slot], arrays["prev_y"][slot] = self.flight_position(slot, max(n - 1, 0))
+        arrays["x"][slot], arrays["y"][slot] = self.flight_position(slot, n)
+        arrays["vy"][slot] = arrays["base_vy"][slot] + n * arrays["gravity"][slot]
+
+    def sync(self):
+        for slot in self.flying:
+            self.place(slot, self.tick)
+
+    def predict(self, slot, first):
+        """
+        Schedule the predicted arrow in `slot` for the first tick from `first` on that its box, PREDICTION_MARGIN
+        wider than the exact test's, overlaps its target's rect moved along the lane; or for the tick it leaves its
+        range.
+        """
+        arrays = self.arrays
+        target_id = int(arrays["target"][slot])
+        target = self.targets[target_id]
+        watch = self.watch.get(target_id)
+        if watch is None:
+            watch = self.watch[target_id] = (motion_key(target), target.x, self.tick, lane_speed(target))
+        _, watch_x, watch_tick, speed = watch
+
+        base_tick = arrays["base_tick"][slot]
+        vx = arrays["vx"][slot]
+        # The step that carries the arrow past max_distance frees it before any hit test
+        ahead = arrays["max_distance"][slot] - math.copysign(arrays["base_x"][slot] - arrays["start_x"][slot], vx)
+        expire = max(first, base_tick + math.floor(ahead / abs(vx)) + 1)
+        arrays["expire_tick"][slot] = expire
+
+        # The arrow's x less the target's left edge changes linearly, so the x overlap is one run of ticks
+        rect = target.get_rect()
+        left = rect.left + watch_x - target.x + speed * (first - watch_tick)
+        gap = self.flight_position(slot, first - base_tick)[0] - left
+        low, high = -ARROW_HALF_WIDTH - PREDICTION_MARGIN, rect.width + ARROW_HALF_WIDTH + PREDICTION_MARGIN
+        rate = vx - speed
+        if rate == 0:
+            start, end = (first, expire) if low < gap < high else (expire, expire)
+        else:
+            after, before = sorted(((low - gap) / rate, (high - gap) / rate))
+            start = first + max(0, math.floor(after) + 1)
+            end = min(expire, first + math.ceil(before))
+
+        # The y overlap is then checked tick by tick over that run
+        top = rect.top - ARROW_HALF_HEIGHT - PREDICTION_MARGIN
+        bottom = rect.bottom + ARROW_HALF_HEIGHT + PREDICTION_MARGIN
+        due = expire
+        for tick in range(start, end):
+            if top < self.flight_position(slot, tick - base_tick)[1] < bottom:
+                due = tick
+                break
+        arrays["event_tick"][slot] = due
+        self.schedule.setdefault(due, []).append(slot)
+
+    def update_predicted(self):
+        arrays = self.arrays
+        now = self.tick
+        target_of, targets = arrays["target"], self.targets
+        changed = set()
+        for target_id, (key, x, tick, speed) in self.watch.items():
+            target = targets[target_id]
+            if motion_key(target) != key or abs(target.x - (x + speed * (now - tick))) > DRIFT_TOLERANCE:
+                changed.add(target_id)
+        if changed:
+            for target_id in changed:
+                del self.watch[target_id]
+            for slot in [slot for slot in self.flying if target_of[slot] in changed]:
+                if is_down(targets[target_of[slot]]):
+                    del self.flying[slot]
+                    self.free.append(slot)
+                else:
+                    self.predict(slot, now)
+
+        serial = arrays["serial"]
+        # In firing order, as the per-tick path resolves hits
+        for slot in sorted(self.schedule.pop(now, ()), key=serial.__getitem__):
+            # Entries left behind by a rescheduled or spent arrow
+            if slot not in self.flying or arrays["event_tick"][slot] != now:
+                continue
+            target = targets[target_of[slot]]
+            if is_down(target) or now >= arrays["expire_tick"][slot]:
+                del self.flying[slot]
+                self.free.append(slot)
+                continue
+            self.place(slot, now)
+            if self.hits(slot, target):
+                if is_standing(target):
+                    target.take_damage(float(arrays["damage"][slot]))
+                    self.landed[ARROW] += 1
+                del self.flying[slot]
+                self.free.append(slot)
+            else:
+                self.predict(slot, now + 1)
+
+    def compact_targets(self):
+        target_of = self.arrays["target"]
+        remap = {}
+        targets = []
+        for slot in self.live + list(self.flying):
+            old = int(target_of[slot])
+            if old not in remap:
+                remap[old] = len(targets)
+                targets.append(self.targets[old])
+            target_of[slot] = remap[old]
+        self.targets = targets
+        self.target_ids = {id(target): i for i, target in enumerate(targets)}
+        self.watch = {remap[old]: watch for old, watch in self.watch.items() if old in remap}
+
+    def draw(self, screen):
+        arrays = self.arrays
+        for slot in self.live:
+            x = sim_clock.interpolate(arrays["prev_x"][slot], arrays["x"][slot])
+            y = sim_clock.interpolate(arrays["prev_y"][slot], arrays["y"][slot])
+            angle = math.degrees(math.atan2(-arrays["vy"][slot], arrays["vx"][slot]))
+            if arrays["kind"][slot] == ARROW:
+                screen.blit(self.arrow_rotations.get(angle), (x - ARROW_HALF_WIDTH, y - ARROW_HALF_HEIGHT))
+            else:
+                screen.blit(self.magic_ball_rotations.get(angle), (x - MAGIC_BALL_HALF_SIZE, y - MAGIC_BALL_HALF_SIZE))
+        for slot in self.flying:
+            n = self.tick - arrays["base_tick"][slot]
+            prev_x, prev_y = self.flight_position(slot, max(n - 1, 0))
+            x, y = self.flight_position(slot, n)
+            x = sim_clock.interpolate(prev_x, x)
+            y = sim_clock.interpolate(prev_y, y)
+            angle = math.degrees(math.atan2(-(arrays["base_vy"][slot] + n * arrays["gravity"][slot]), arrays["vx"][slot]))
+            screen.blit(self.arrow_rotations.get(angle), (x - ARROW_HALF_WIDTH, y - ARROW_HALF_HEIGHT))
+
+
+projectile_pool = ProjectilePool()
\ No newline at end of file
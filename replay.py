@@ -0,0 +1,135 @@
+"""
+Replays a battle from its input log, tick for tick.
+
+    python replay.py last_battle.replay.json [--to TICK] [--headless]
+
+The battle is rebuilt from the log's level, seed and profile, and each recorded
+input is applied before the tick it was recorded at, so the simulation repeats
+exactly; the state checksums in the log are compared along the way and the
+first mismatch is reported. `--to` fast-forwards to a tick without drawing and
+then plays on in real time from there. `--headless` runs the whole log without
+a window and prints the timing of the slowest ticks, for chasing field reports
+of frame spikes. Animation frame counts and sprite masks feed into the
+simulation, so a log recorded by headless.py replays on the same blank stand-in
+sprites (and so only with --headless).
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+
+import pygame
+import headless
+import snapshot
+from headless import HeadlessGame, HeadlessProfile
+from inputlog import SPAWN, UPGRADE, OKAY, load_log, state_hash
+from simclock import sim_clock
+from units import UNIT_ROSTER
+
+UNIT_TYPES = {unit_type.name: unit_type for unit_type in UNIT_ROSTER["Player"]}
+SLOWEST_TICKS = 10
+
+
+class ReplayPlayer:
+    def __init__(self, log, screen, clock=None):
+        self.log = log
+        profile = HeadlessProfile(log["max_level"], [UNIT_TYPES[name] for name in log["player_units"]],
+                                  log["unit_upgrades"])
+        profile.secured_seeds = log["secured_seeds"]
+        self.game = HeadlessGame(log["level"], profile, screen, clock, log["seed"])
+        self.game.player_base.health = self.game.player_base.max_health = log["base_health"]
+        self.game.passive_income = log["passive_income"]
+        if log.get("snapshot"):
+            snapshot.restore(self.game, snapshot.from_text(log["snapshot"]))
+        self.inputs = deque(log["inputs"])
+        self.expected = dict(log["checkpoints"])
+        self.mismatch = None
+
+    @property
+    def finished(self):
+        return sim_clock.ticks >= self.log["ticks"]
+
+    def apply_inputs(self):
+        while self.inputs and self.inputs[0][0] == sim_clock.ticks:
+            tick, code, *args = self.inputs.popleft()
+            if code == SPAWN:
+                self.game.spawn_unit(UNIT_TYPES[args[0]])
+            elif code == UPGRADE:
+                self.game.apply_upgrade(self.game.units[args[0]], args[1])
+            elif code == OKAY:
+                self.game.event_handler.press_okay()
+
+    def step(self):
+        self.apply_inputs()
+        self.game.step()
+        expected = self.expected.get(sim_clock.ticks)
+        if expected is not None and self.mismatch is None and state_hash(self.game) != expected:
+            self.mismatch = sim_clock.ticks
+
+    def fast_forward(self, tick):
+        """Run the simulation up to `tick` without drawing."""
+        while sim_clock.ticks < tick and not self.finished:
+            self.step()
+
+    def play(self, screen, clock):
+        """Play the rest of the log in real time, drawing with interpolation, until it ends or the window closes."""
+        while not self.finished:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+            for _ in range(sim_clock.advance(clock.tick(60))):
+                if self.finished:
+                    break
+                self.game.save_positions()
+                self.step()
+            self.game.draw(screen)
+            pygame.display.flip()
+
+    def profile_ticks(self):
+        """Run the whole log, returning (milliseconds, tick) for the slowest ticks."""
+        timings = []
+        while not self.finished:
+            start = time.perf_counter()
+            self.step()
+            timings.append(((time.perf_counter() - start) * 1000, sim_clock.ticks))
+        return sorted(timings, reverse=True)[:SLOWEST_TICKS]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded battle")
+    parser.add_argument("log")
+    parser.add_argument("--to", type=int, default=0, help="fast-forward to this tick before drawing")
+    parser.add_argument("--headless", action="store_true", help="no window; report the slowest ticks")
+    args = parser.parse_args()
+    log = load_log(args.log)
+
+    if log["placeholder_assets"]:
+        headless.init()
+        args.headless = True
+    elif args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.get_surface() or pygame.display.set_mode((1, 1) if args.headless else (1920, 1080))
+    clock = pygame.time.Clock()
+    player = ReplayPlayer(log, screen, clock)
+    print(f"Level {log['level']}, seed {log['seed']}, {log['ticks']} ticks, {len(log['inputs'])} inputs")
+
+    if args.headless:
+        for ms, tick in player.profile_ticks():
+            print(f"tick {tick:>6}: {ms:.2f} ms")
+    else:
+        start = time.perf_counter()
+        player.fast_forward(args.to)
+        print(f"Fast-forwarded to tick {sim_clock.ticks} in {(time.perf_counter() - start) * 1000:.0f} ms")
+        player.play(screen, clock)
+
+    if player.mismatch is not None:
+        print(f"Replay diverged from the recording at tick {player.mismatch}")
+        return 1
+    print(f"Replay matched the recording through tick {sim_clock.ticks}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
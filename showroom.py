@@ -1,5 +1,8 @@
 # showroom.py
 import pygame
+from animations import animation_registry
+from fonts import font_registry, text_cache
+from gamelog import log
 
 class Showroom:
     def __init__(self, screen, clock):
@@ -24,32 +27,20 @@ class Showroom:
             # Add more as needed
         ]
         for path in sprite_paths:
-            try:
-                spritesheet = pygame.image.load(path).convert_alpha()
-                frame_width = 192
-                frame_height = 192
-                frames_per_state = 14
-                if spritesheet.get_width() >= frame_width and spritesheet.get_height() >= frame_height:
-                    idle_frames = []
-                    for i in range(frames_per_state):
-                        x = i * frame_width
-                        if x + frame_width <= spritesheet.get_width():
-                            frame = spritesheet.subsurface((x, 0, frame_width, frame_height))
-                            frame = pygame.transform.scale(frame, (192, 192))
-                            idle_frames.append(frame)
-                        else:
-                            break
-                    if idle_frames:
-                        name = path.split('/')[-1].replace('.png', '')
-                        faction = path.split('/')[-2]
-                        full_name = f"{faction}/{name}"
-                        self.sprite_data[full_name] = {
-                            "frames": idle_frames,
-                            "frame": 0,
-                            "last_update": pygame.time.get_ticks()
-                        }
-            except Exception as e:
-                print(f"Failed to load {path}: {e}")
+            name = path.split('/')[-1].replace('.png', '')
+            faction = path.split('/')[-2]
+            # Shares the battle's cached (and, if baked, atlas-trimmed) frames
+            idle_frames = animation_registry.get(faction, name)["idle"]
+            if path in animation_registry.missing_spritesheets:
+                log.warning("Failed to load %s", path)
+                continue
+            full_name = f"{faction}/{name}"
+            self.sprite_data[full_name] = {
+                "frames": idle_frames,
+                "offsets": animation_registry.get_offsets(faction, name)["idle"],
+                "frame": 0,
+                "last_update": pygame.time.get_ticks()
+            }
 
     def update_animations(self):
         now = pygame.time.get_ticks()
@@ -69,7 +60,7 @@ class Showroom:
 
     def draw(self, screen):
         screen.fill((14, 39, 59))
-        FONT_BODY = pygame.font.SysFont("Open Sans", 24)
+        FONT_BODY = font_registry.get("Open Sans", 24)
 
         for i, (name, data) in enumerate(self.sprite_data.items()):
             col = i % 5
@@ -78,12 +69,13 @@ class Showroom:
             y = 50 + row * 200 - self.scroll_y
             if 0 <= y <= 1080 - 192:
                 frame = data["frames"][data["frame"]]
-                screen.blit(frame, (x, y))
-                text = FONT_BODY.render(name, True, (249, 249, 242))
+                offset_x, offset_y = data["offsets"][data["frame"]]
+                screen.blit(frame, (x + offset_x, y + offset_y))
+                text = text_cache.render(FONT_BODY, name, (249, 249, 242))
                 screen.blit(text, (x + (192 - text.get_width()) // 2, y + 192))
 
         pygame.draw.rect(screen, (147, 208, 207), self.back_button)
-        back_text = FONT_BODY.render("Back", True, (249, 249, 242))
+        back_text = text_cache.render(FONT_BODY, "Back", (249, 249, 242))
         screen.blit(back_text, (self.back_button.x + 10, self.back_button.y + 15))
 
     def run(self):
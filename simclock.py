@@ -0,0 +1,59 @@
+import random
+
+TICK_RATE = 60
+# Most simulation steps run for one rendered frame; past that the game slows down instead of stalling
+MAX_STEPS_PER_FRAME = 5
+
+
+class SimClock:
+    """
+    Fixed-timestep game clock.
+
+    Gameplay timers (attack cooldowns, range-check throttling, hurt time, animation
+    delays, seed drop lifetime, enemy spawns) read `now()`, which only advances by
+    whole simulation steps, so a step plays out the same at any frame rate.
+    `advance(frame_ms)` feeds real frame time into the accumulator and returns how
+    many steps to run; `alpha` is the leftover fraction of a step for drawing
+    between the last two simulated positions.
+
+    All gameplay randomness draws from `rng`, which `reset(seed)` reseeds at the
+    start of each battle so a battle replays exactly from its seed and inputs.
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, max_steps=MAX_STEPS_PER_FRAME):
+        self.tick_rate = tick_rate
+        self.tick_ms = 1000 / tick_rate
+        self.max_steps = max_steps
+        self.rng = random.Random()
+        self.reset()
+
+    def reset(self, seed=None):
+        self.rng.seed(seed)
+        self.ticks = 0
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+    def now(self):
+        """Simulated time in whole milliseconds, like pygame.time.get_ticks()."""
+        return self.ticks * 1000 // self.tick_rate
+
+    def step(self):
+        self.ticks += 1
+
+    def advance(self, frame_ms):
+        self.accumulator += frame_ms
+        steps = int(self.accumulator // self.tick_ms)
+        if steps > self.max_steps:
+            # Drop the backlog rather than spiralling further behind
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.tick_ms
+        self.alpha = self.accumulator / self.tick_ms
+        return steps
+
+    def interpolate(self, previous, current):
+        return previous + (current - previous) * self.alpha
+
+
+sim_clock = SimClock()
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""
+Binary battle snapshots: save a Game mid-battle and restore it exactly.
+
+A snapshot is one bytes blob: a fixed header (magic, version, level, tick,
+seed, the Game's scalars and story flags, both bases, the RNG state), a table
+of the unit class names it uses, then fixed-size records for units, projectiles
+in firing order, seed drops and the cart. Floats are stored as doubles so a
+restored battle carries on bit-for-bit as the original would have.
+
+References between entities (a unit's attack target, an arrow's target, the
+Bandit King) are stored as indexes into units + enemy_units, or REF_NONE /
+REF_PLAYER_BASE / REF_ENEMY_BASE.
+
+to_text()/from_text() wrap a blob for the JSON player data bridge.
+"""
+import base64
+import math
+import struct
+import zlib
+
+from entities import PLAYER, ENEMY
+from simclock import sim_clock
+from units import UNIT_ROSTER, CartUnit
+from game_logic import SeedDrop
+
+MAGIC = b"RSSB"
+SNAPSHOT_VERSION = 3
+
+REF_NONE = -1
+REF_PLAYER_BASE = -2
+REF_ENEMY_BASE = -3
+# hurt_start is None outside the hurt state
+NO_TIME = -(1 << 31)
+
+UNIT_STATES = ["idle", "run", "attack", "hurt", "die"]
+STATE_INDEX = {state: i for i, state in enumerate(UNIT_STATES)}
+UNIT_TYPES = {unit_type.name: unit_type for unit_types in UNIT_ROSTER.values() for unit_type in unit_types}
+GAME_FLAGS = ["game_over", "won", "level_up_available", "show_intro", "show_end_story", "show_bandit_intro",
+              "units_moving_back", "king_moving", "enemy_spawns_stopped", "show_bandit_surrender",
+              "show_surrender_part_two", "show_king_threat", "surrender_triggered"]
+
+# magic, version, level, tick, seed, seeds, xp, max_xp, passive_income, fade_alpha, last_enemy_spawn, start_time,
+# flags, player base health/max/destroyed, enemy base health/max/destroyed, bandit king ref, has cart,
+# unit type names length, unit, projectile and seed drop counts
+HEADER = struct.Struct("<4sHHIQdiidiiiIdd?dd?i?HIII")
+# MT19937 state words plus its index, and the cached gauss value (NaN when unset)
+RNG_STATE = struct.Struct("<625Id")
+# type index, player side, state, frame, attacking, retreating, attack target, x, prev_x, initial_x,
+# health, max_health, attack_power, speed, attack_cooldown, attack_frame_delay,
+# last_update, last_attack, hurt_start, last_range_check
+UNIT = struct.Struct("<H?BH??i9d4i")
+# kind, direction, target, ticks since base, x, y, prev_x, prev_y, start_x, start_y, vx, vy, damage, max_distance,
+# base x, base y, base vy (see ProjectilePool.add)
+PROJECTILE = struct.Struct("<Bbii13d")
+# x, value, creation_time, alpha
+SEED_DROP = struct.Struct("<dHid")
+# x, prev_x, target_x, speed, moving
+CART = struct.Struct("<dddd?")
+
+
+def flag_bits(game):
+    return sum(1 << i for i, name in enumerate(GAME_FLAGS) if getattr(game, name))
+
+
+def save(game):
+    """Serialize the battle state of `game` into a snapshot blob."""
+    all_units = game.units + game.enemy_units
+    index_of = {id(unit): i for i, unit in enumerate(all_units)}
+    index_of[id(game.player_base)] = REF_PLAYER_BASE
+    index_of[id(game.enemy_base)] = REF_ENEMY_BASE
+    index_of[id(None)] = REF_NONE
+    ref_of = index_of.get
+
+    def ref(target):
+        return ref_of(id(target), REF_NONE)
+
+    type_names = sorted({unit.name for unit in all_units})
+    type_index = {name: i for i, name in enumerate(type_names)}
+    names = "\0".join(type_names).encode()
+    player, enemy = game.player_base, game.enemy_base
+
+    projectiles = game.projectiles.records()
+    size = (HEADER.size + RNG_STATE.size + len(names) + UNIT.size * len(all_units)
+            + PROJECTILE.size * len(projectiles) + SEED_DROP.size * len(game.seed_drops)
+            + (CART.size if game.cart else 0))
+    blob = bytearray(size)
+    HEADER.pack_into(blob, 0, MAGIC, SNAPSHOT_VERSION, game.level.level_number, sim_clock.ticks, game.seed,
+                     game.seeds, game.xp, game.max_xp, game.passive_income, game.fade_alpha,
+                     game.last_enemy_spawn, game.start_time, flag_bits(game),
+                     player.health, player.max_health, player.destroyed, enemy.health, enemy.max_health,
+                     enemy.destroyed, ref(game.bandit_king), game.cart is not None, len(names),
+                     len(all_units), len(projectiles), len(game.seed_drops))
+    offset = HEADER.size
+    _, state, gauss_next = sim_clock.rng.getstate()
+    RNG_STATE.pack_into(blob, offset, *state, math.nan if gauss_next is None else gauss_next)
+    offset += RNG_STATE.size
+    blob[offset:offset + len(names)] = names
+    offset += len(names)
+
+    # The per-unit cost is most of a save, so ref() is inlined here
+    pack_unit, unit_size = UNIT.pack_into, UNIT.size
+    for player_side, side_units in ((True, game.units), (False, game.enemy_units)):
+        for unit in side_units:
+            hurt_start = unit.hurt_start
+            pack_unit(blob, offset, type_index[unit.name], player_side, STATE_INDEX[unit.state], unit.frame,
+                      unit.is_attacking, unit.is_retreating, ref_of(id(unit.attack_target), REF_NONE), unit.x,
+                      unit.prev_x, unit.initial_x, unit.health, unit.max_health, unit.attack_power, unit.speed,
+                      unit.attack_cooldown, unit.attack_frame_delay, unit.last_update, unit.last_attack,
+                      NO_TIME if hurt_start is None else hurt_start, unit.last_range_check)
+            offset += unit_size
+
+    for kind, direction, target, *values, (base_x, base_y, base_vy, age) in projectiles:
+        PROJECTILE.pack_into(blob, offset, kind, direction, ref(target), age, *values, base_x, base_y, base_vy)
+        offset += PROJECTILE.size
+
+    for drop in game.seed_drops:
+        SEED_DROP.pack_into(blob, offset, drop.x, drop.value, drop.creation_time, drop.alpha)
+        offset += SEED_DROP.size
+
+    if game.cart:
+        cart = game.cart
+        CART.pack_into(blob, offset, cart.x, cart.prev_x, cart.target_x, cart.speed, cart.moving)
+    return bytes(blob)
+
+
+def read_header(blob):
+    if len(blob) < HEADER.size or blob[:4] != MAGIC:
+        raise ValueError("Not a battle snapshot")
+    header = HEADER.unpack_from(blob, 0)
+    if header[1] != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported battle snapshot version: {header[1]}")
+    return header
+
+
+def level_of(blob):
+    return read_header(blob)[2]
+
+
+def has_ended(blob):
+    """Whether the snapshot's battle was already won or lost when it was taken."""
+    # The enemy base falling doesn't end level 5, where the Bandit King comes out next
+    flags, player_health = read_header(blob)[12:14]
+    return bool(flags & (1 << GAME_FLAGS.index("game_over"))) or player_health <= 0
+
+
+def restore(game, blob):
+    """Replace the battle state of `game`, a fresh Game for the same level, with the snapshot's."""
+    (_, _, level_number, ticks, seed, seeds, xp, max_xp, passive_income, fade_alpha, last_enemy_spawn, start_time,
+     flags, player_health, player_max_health, player_destroyed, enemy_health, enemy_max_health, enemy_destroyed,
+     bandit_king, has_cart, names_length, unit_count, projectile_count, drop_count) = read_header(blob)
+    if level_number != game.level.level_number:
+        raise ValueError(f"Snapshot is of level {level_number}, not level {game.level.level_number}")
+
+    sim_clock.ticks = ticks
+    offset = HEADER.size
+    *rng_state, gauss_next = RNG_STATE.unpack_from(blob, offset)
+    offset += RNG_STATE.size
+    type_names = blob[offset:offset + names_length].decode().split("\0")
+    offset += names_length
+
+    game.seed = seed
+    game.seeds, game.xp, game.max_xp = seeds, xp, max_xp
+    game.passive_income, game.fade_alpha = passive_income, fade_alpha
+    game.last_enemy_spawn, game.start_time = last_enemy_spawn, start_time
+    for i, name in enumerate(GAME_FLAGS):
+        setattr(game, name, bool(flags & (1 << i)))
+    game.player_base.health, game.player_base.max_health = player_health, player_max_health
+    game.player_base.destroyed = player_destroyed
+    game.enemy_base.health, game.enemy_base.max_health = enemy_health, enemy_max_health
+    game.enemy_base.destroyed = enemy_destroyed
+
+    all_units, targets = [], []
+    game.entities.clear()
+    for _ in range(unit_count):
+        (type_index, player_side, state_index, frame, is_attacking, is_retreating, target, x, prev_x, initial_x,
+         health, max_health, attack_power, speed, attack_cooldown, attack_frame_delay, last_update, last_attack,
+         hurt_start, last_range_check) = UNIT.unpack_from(blob, offset)
+        offset += UNIT.size
+        unit = UNIT_TYPES[type_names[type_index]](game.player_faction if player_side else game.enemy_faction, x)
+        unit.prev_x, unit.initial_x = prev_x, initial_x
+        unit.state, unit.frame = UNIT_STATES[state_index], frame
+        unit.is_attacking, unit.is_retreating = is_attacking, is_retreating
+        unit.health, unit.max_health, unit.attack_power, unit.speed = health, max_health, attack_power, speed
+        unit.attack_cooldown, unit.attack_frame_delay = attack_cooldown, attack_frame_delay
+        unit.last_update, unit.last_attack, unit.last_range_check = last_update, last_attack, last_range_check
+        unit.hurt_start = None if hurt_start == NO_TIME else hurt_start
+        game.entities.add(unit, PLAYER if player_side else ENEMY)
+        all_units.append(unit)
+        targets.append(target)
+
+    def resolve(ref):
+        if ref == REF_PLAYER_BASE:
+            return game.player_base
+        if ref == REF_ENEMY_BASE:
+            return game.enemy_base
+        return None if ref == REF_NONE else all_units[ref]
+
+    for unit, target in zip(all_units, targets):
+        unit.attack_target = resolve(target)
+    game.bandit_king = resolve(bandit_king)
+    game.selected_unit = None
+
+    game.projectiles.clear()
+    for _ in range(projectile_count):
+        (kind, direction, target, age, x, y, prev_x, prev_y, start_x, start_y, vx, vy, damage,
+         max_distance, base_x, base_y, base_vy) = PROJECTILE.unpack_from(blob, offset)
+        offset += PROJECTILE.size
+        game.projectiles.add(kind, direction, resolve(target), x, y, vx, vy, damage, max_distance,
+                             prev_x, prev_y, start_x, start_y, (base_x, base_y, base_vy, age))
+
+    game.seed_drops = []
+    for _ in range(drop_count):
+        x, value, creation_time, alpha = SEED_DROP.unpack_from(blob, offset)
+        offset += SEED_DROP.size
+        drop = SeedDrop(0, 0, value)
+        drop.x, drop.creation_time, drop.alpha = x, creation_time, alpha
+        game.seed_drops.append(drop)
+
+    game.cart = None
+    if has_cart:
+        x, prev_x, target_x, speed, moving = CART.unpack_from(blob, offset)
+        game.cart = CartUnit(x, 880 - 150, target_x)
+        game.cart.prev_x, game.cart.speed, game.cart.moving = prev_x, speed, moving
+
+    # Last, since rebuilding seed drops draws from the RNG
+    sim_clock.rng.setstate((3, tuple(rng_state), None if math.isnan(gauss_next) else gauss_next))
+
+
+def to_text(blob):
+    """Compress and base64 a snapshot for storing in player data."""
+    return base64.b64encode(zlib.compress(blob, 1)).decode("ascii")
+
+
+def from_text(text):
+    return zlib.decompress(base64.b64decode(text))
\ No newline at end of file
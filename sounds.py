@@ -0,0 +1,88 @@
+import pygame
+from collections import deque
+
+
+class SoundHandle:
+    """Shared, lazily decoded reference to a sound in the bank; safe to hold at class level."""
+
+    def __init__(self, bank, sound_id):
+        self.bank = bank
+        self.sound_id = sound_id
+
+    def play(self):
+        return self.bank.play(self.sound_id)
+
+
+class VoiceManager:
+    """
+    Caps simultaneous plays per sound id.
+
+    When a sound already has `max_voices` channels playing, the oldest one is stolen
+    for the new play. Repeated plays of the same id within `dedupe_window` ms (one
+    tick at 60 fps) are dropped, so a mass attack on one frame starts a single voice.
+    """
+
+    def __init__(self, max_voices=4, dedupe_window=16):
+        self.max_voices = max_voices
+        self.dedupe_window = dedupe_window
+        self.limits = {}
+        self.voices = {}
+        self.last_played = {}
+
+    def set_limit(self, sound_id, max_voices):
+        self.limits[sound_id] = max_voices
+
+    def play(self, sound_id, sound):
+        now = pygame.time.get_ticks()
+        last = self.last_played.get(sound_id)
+        if last is not None and now - last < self.dedupe_window:
+            return None
+        self.last_played[sound_id] = now
+
+        channels = deque(channel for channel in self.voices.get(sound_id, ()) if channel.get_busy() and channel.get_sound() is sound)
+        self.voices[sound_id] = channels
+        if len(channels) >= self.limits.get(sound_id, self.max_voices):
+            channel = channels.popleft()
+            channel.play(sound)
+        else:
+            channel = sound.play()
+        if channel:
+            channels.append(channel)
+        return channel
+
+
+class SoundBank:
+    """Decodes each sound file once and routes playback through a VoiceManager."""
+
+    def __init__(self, voices=None):
+        self.sounds = {}
+        self.handles = {}
+        self.voices = voices or VoiceManager()
+
+    def handle(self, sound_id):
+        handle = self.handles.get(sound_id)
+        if handle is None:
+            handle = SoundHandle(self, sound_id)
+            self.handles[sound_id] = handle
+        return handle
+
+    def get(self, sound_id):
+        if sound_id not in self.sounds:
+            try:
+                self.sounds[sound_id] = pygame.mixer.Sound(sound_id)
+            except Exception:
+                self.sounds[sound_id] = None
+        return self.sounds[sound_id]
+
+    def preload(self, sound_ids):
+        for sound_id in sound_ids:
+            self.get(sound_id)
+
+    def play(self, sound_id):
+        sound = self.get(sound_id)
+        if sound is None:
+            return None
+        return self.voices.play(sound_id, sound)
+
+
+sound_bank = SoundBank()
\ No newline at end of file
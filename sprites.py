@@ -0,0 +1,132 @@
+import pygame
+from animations import build_mask
+from atlas import atlas
+from gamelog import log
+
+# Angular resolution of pre-rendered projectile rotations, in degrees.
+# Smaller steps look smoother but keep more surfaces resident (360 / step per sprite).
+ROTATION_STEP = 5
+# Fading sprites share copies at this many alpha levels instead of owning one each
+ALPHA_LEVELS = 32
+
+
+class SpriteStore:
+    """
+    Loads, scales and caches static images (projectiles, pickups, buildings) once.
+
+    Returned surfaces are shared and must not be modified; use `get_faded` for
+    per-instance transparency.
+    """
+
+    def __init__(self):
+        self.cache = {}
+        self.faded = {}
+        # Headless runs never decode images; every sprite is a plain surface of the requested size
+        self.headless = False
+
+    def get(self, path, size=None, scale=None, fallback_size=None, fallback_color=(255, 255, 255)):
+        key = (path, size, scale)
+        sprite = self.cache.get(key)
+        if sprite is None:
+            sprite = self.load(path, size, scale, fallback_size or size, fallback_color)
+            self.cache[key] = sprite
+        return sprite
+
+    def load(self, path, size, scale, fallback_size, fallback_color):
+        if self.headless:
+            return pygame.Surface(fallback_size or (1, 1))
+        baked = atlas.image(path, size) if size is not None else None
+        if baked:
+            return baked
+        try:
+            sprite = pygame.image.load(path).convert_alpha()
+            if scale is not None:
+                size = (int(sprite.get_width() * scale), int(sprite.get_height() * scale))
+            if size is not None:
+                sprite = pygame.transform.scale(sprite, size)
+            return sprite
+        except Exception as e:
+            log.warning("Failed to load sprite: %s - %s", path, e)
+            sprite = pygame.Surface(fallback_size)
+            sprite.fill(fallback_color)
+            return sprite
+
+    def resident_bytes(self):
+        surfaces = list(self.cache.values()) + list(self.faded.values())
+        return sum(surface.get_width() * surface.get_height() * surface.get_bytesize() for surface in surfaces)
+
+    def get_faded(self, sprite, alpha):
+        level = int(alpha * ALPHA_LEVELS / 256)
+        if level >= ALPHA_LEVELS - 1:
+            return sprite
+        key = (sprite, level)
+        faded = self.faded.get(key)
+        if faded is None:
+            faded = sprite.copy()
+            faded.set_alpha(level * 256 // ALPHA_LEVELS)
+            self.faded[key] = faded
+        return faded
+
+
+sprite_store = SpriteStore()
+
+
+def load_image(path, alpha=True):
+    """
+    Decode and convert an image for display.
+
+    In headless mode nothing is decoded; this raises so the caller takes its
+    existing fallback surface.
+    """
+    if sprite_store.headless:
+        raise RuntimeError(f"Not loading {path} in headless mode")
+    image = pygame.image.load(path)
+    return image.convert_alpha() if alpha else image.convert()
+
+
+class RotationCache:
+    """
+    Rotations of a single sprite pre-rendered at a fixed angular step.
+
+    `get(angle)` returns the rotation nearest to `angle`; masks for each rotation are
+    built on first use and shared by every projectile using the cache.
+    """
+
+    def __init__(self, sprite, step):
+        self.step = step
+        self.count = max(1, int(round(360 / step)))
+        self.frames = [pygame.transform.rotate(sprite, i * 360 / self.count) for i in range(self.count)]
+        self.masks = [None] * self.count
+
+    def index(self, angle):
+        return int(round(angle * self.count / 360)) % self.count
+
+    def get(self, angle):
+        return self.frames[self.index(angle)]
+
+    def get_mask(self, angle):
+        i = self.index(angle)
+        mask = self.masks[i]
+        if mask is None:
+            mask = build_mask(self.frames[i])
+            self.masks[i] = mask
+        return mask
+
+
+rotation_caches = {}
+
+
+def get_rotations(name, sprite):
+    """Return the shared RotationCache for `name`, building it from `sprite` on first use."""
+    rotations = rotation_caches.get(name)
+    if rotations is None:
+        rotations = RotationCache(sprite, ROTATION_STEP)
+        rotation_caches[name] = rotations
+    return rotations
+
+
+def set_rotation_step(step):
+    """Change the angular resolution; caches are rebuilt lazily at the new step."""
+    global ROTATION_STEP
+    ROTATION_STEP = step
+    rotation_caches.clear()
\ No newline at end of file
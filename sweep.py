@@ -0,0 +1,211 @@
+"""
+Balance sweeps: many headless battles across a parameter grid, in parallel.
+
+    python sweep.py [SPEC.json] [--out sweep_results.json.gz] [--workers N]
+
+The grid is levels x unit mixes x profiles x stat overrides x seeds (see
+DEFAULT_SPEC for the spec format). A profile is a player_data.json-style file
+whose unit and base upgrades apply to the player. Overrides patch unit class
+attributes ("Player_Warrior.base_attack") or faction modifiers
+("Bandits.health_mod") for the battle.
+
+Battles run in a ProcessPoolExecutor, one per job. Results are checkpointed to
+a gzip'd columnar JSON file (one list per column, strings dictionary-encoded);
+rerunning with the same --out skips every battle already in it. Each row carries
+a hash of everything its battle depended on (the level and seed, the mix's units,
+the profile's contents, the override values, `every` and `max_ticks`), so a
+battle is only skipped when that hash matches, and the summary only counts rows
+of the current spec. Prints win rate and mean time-to-kill (seconds to destroy
+the enemy base) per grid cell.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import product
+
+import headless
+from game_logic import Game
+from units import UNIT_ROSTER
+
+DEFAULT_SPEC = {
+    "levels": [1, 3, 6, 11],
+    "mixes": {"peasants": ["Peasant"], "warriors": ["Warrior"], "balanced": ["Peasant", "Warrior", "Tank"],
+              "ranged": ["Warrior", "Archer"]},
+    "every": 120,
+    "profiles": {"fresh": None, "saved": "player_data.json"},
+    "overrides": {"baseline": {}},
+    "seeds": 3,
+    "max_ticks": 36000,
+}
+KEY_COLUMNS = ["level", "mix", "profile", "overrides", "seed"]
+# Hash of the resolved job parameters; what resumes are matched on
+PARAMS_COLUMN = "params"
+RESULT_COLUMNS = ["winner", "ticks", "sim_seconds", "wall_ms", "player_base_health", "enemy_base_health",
+                  "player_spawned", "player_alive", "enemy_kills", "enemy_alive", "seeds", "xp"]
+COLUMNS = KEY_COLUMNS + [PARAMS_COLUMN] + RESULT_COLUMNS
+STRING_COLUMNS = {"mix", "profile", "overrides", "params", "winner"}
+# Completed battles between rewrites of the results file
+CHECKPOINT_EVERY = 25
+
+
+def job_key(job):
+    return tuple(job[column] for column in KEY_COLUMNS)
+
+
+def job_params(job, spec, profiles):
+    """Hash of what the job's battle depends on, with the spec's names resolved to their values."""
+    params = {"level": job["level"], "seed": job["seed"], "mix": spec["mixes"][job["mix"]],
+              "profile": profiles[job["profile"]], "overrides": spec["overrides"][job["overrides"]],
+              "every": spec["every"], "max_ticks": spec["max_ticks"]}
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def make_jobs(spec):
+    profiles = {name: headless.load_player_data(path) if path else None for name, path in spec["profiles"].items()}
+    jobs = []
+    for level, mix, profile, overrides, seed in product(spec["levels"], spec["mixes"], spec["profiles"],
+                                                         spec["overrides"], range(spec["seeds"])):
+        job = {"level": level, "mix": mix, "profile": profile, "overrides": overrides, "seed": seed}
+        job[PARAMS_COLUMN] = job_params(job, spec, profiles)
+        jobs.append(job)
+    return jobs
+
+
+def resolve_target(name):
+    """The class or faction object an override key like "Player_Tank.cost" refers to."""
+    for unit_types in UNIT_ROSTER.values():
+        for unit_type in unit_types:
+            if unit_type.name == name or unit_type.__name__ == name:
+                return unit_type
+    if name in Game.FACTION_MAP:
+        return Game.FACTION_MAP[name]
+    raise KeyError(f"Unknown unit or faction in override: {name}")
+
+
+@contextmanager
+def overridden(overrides):
+    """Temporarily set unit class attributes and faction modifiers."""
+    saved = []
+    try:
+        for key, value in overrides.items():
+            name, attribute = key.rsplit(".", 1)
+            target = resolve_target(name)
+            saved.append((target, attribute, getattr(target, attribute)))
+            setattr(target, attribute, value)
+        yield
+    finally:
+        for target, attribute, value in reversed(saved):
+            setattr(target, attribute, value)
+
+
+def run_job(job, spec):
+    profile_path = spec["profiles"][job["profile"]]
+    player_data = headless.load_player_data(profile_path) if profile_path else None
+    script = headless.RepeatingInput(spec["mixes"][job["mix"]], spec["every"])
+    with overridden(spec["overrides"][job["overrides"]]):
+        result = headless.run_battle(job["level"], script, max_ticks=spec["max_ticks"], seed=job["seed"],
+                                     player_data=player_data)
+    return {**job, **{column: result[column] for column in RESULT_COLUMNS}}
+
+
+def save_results(path, rows):
+    """Write rows as columns; string columns are stored as a value table plus integer codes."""
+    columns = {}
+    for column in COLUMNS:
+        values = [row[column] for row in rows]
+        if column in STRING_COLUMNS:
+            table = sorted(set(values))
+            codes = {value: i for i, value in enumerate(table)}
+            columns[column] = {"values": table, "codes": [codes[value] for value in values]}
+        else:
+            columns[column] = values
+    temp_path = path + ".tmp"
+    with gzip.open(temp_path, "wt") as f:
+        json.dump({"rows": len(rows), "columns": columns}, f, separators=(",", ":"))
+    # Replace in one step so an interrupted write never leaves a truncated file
+    os.replace(temp_path, path)
+
+
+def load_results(path):
+    if not os.path.exists(path):
+        return []
+    with gzip.open(path, "rt") as f:
+        data = json.load(f)
+    columns = {}
+    for column, values in data["columns"].items():
+        if isinstance(values, dict):
+            values = [values["values"][code] for code in values["codes"]]
+        columns[column] = values
+    return [{column: columns[column][i] for column in columns} for i in range(data["rows"])]
+
+
+def summarize(rows):
+    """Win rate and mean time-to-kill per (level, mix, profile, overrides) cell."""
+    cells = {}
+    for row in rows:
+        cells.setdefault(job_key(row)[:-1], []).append(row)
+    summary = []
+    for cell, cell_rows in sorted(cells.items(), key=lambda item: [str(part) for part in item[0]]):
+        wins = [row for row in cell_rows if row["winner"] == "player"]
+        time_to_kill = sum(row["sim_seconds"] for row in wins) / len(wins) if wins else None
+        summary.append((*cell, len(cell_rows), len(wins) / len(cell_rows), time_to_kill))
+    return summary
+
+
+def print_summary(rows):
+    print(f"{'level':>5} {'mix':<12} {'profile':<10} {'overrides':<14} {'runs':>4} {'win rate':>8} {'ttk s':>7}")
+    for level, mix, profile, overrides, runs, win_rate, time_to_kill in summarize(rows):
+        ttk = f"{time_to_kill:.1f}" if time_to_kill is not None else "-"
+        print(f"{level:>5} {mix:<12} {profile:<10} {overrides:<14} {runs:>4} {win_rate:>8.0%} {ttk:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a grid of headless battles in parallel")
+    parser.add_argument("spec", nargs="?", help="JSON sweep spec; defaults to DEFAULT_SPEC")
+    parser.add_argument("--out", default="sweep_results.json.gz")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    spec = DEFAULT_SPEC
+    if args.spec:
+        with open(args.spec) as f:
+            spec = {**DEFAULT_SPEC, **json.load(f)}
+
+    # Rows saved before the params column existed can't be matched to a spec
+    rows = [row for row in load_results(args.out) if PARAMS_COLUMN in row]
+    all_jobs = make_jobs(spec)
+    done = {row[PARAMS_COLUMN] for row in rows}
+    jobs = [job for job in all_jobs if job[PARAMS_COLUMN] not in done]
+    print(f"{len(all_jobs) - len(jobs)} of {len(all_jobs)} battles already in {args.out}, "
+          f"{len(jobs)} to run on {args.workers} workers")
+
+    pending = 0
+    executor = ProcessPoolExecutor(max_workers=args.workers)
+    try:
+        futures = [executor.submit(run_job, job, spec) for job in jobs]
+        for future in as_completed(futures):
+            rows.append(future.result())
+            pending += 1
+            if pending >= CHECKPOINT_EVERY:
+                save_results(args.out, rows)
+                pending = 0
+                print(f"{len(rows)} battles saved")
+        executor.shutdown()
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("Interrupted; rerun with the same --out to resume")
+    finally:
+        save_results(args.out, rows)
+
+    # Only this spec's battles, under its names; rows of other specs stay in the file for later resumes
+    results = {row[PARAMS_COLUMN]: row for row in rows}
+    print_summary([{**results[job[PARAMS_COLUMN]], **job} for job in all_jobs if job[PARAMS_COLUMN] in results])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
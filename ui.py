@@ -1,5 +1,11 @@
 import pygame
 from units import Player_PeasantUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit
+from sounds import sound_bank
+from sprites import load_image
+from fonts import font_registry
+
+ICON_OFFSET = 10
+FILL_STEPS = 36
 
 class Button:
     def __init__(self, x, y, width, height, text, ui_instance):
@@ -7,7 +13,7 @@ class Button:
         self.text = text
         self.ui = ui_instance
         try:
-            base_image = pygame.image.load("assets/ui/ui_buybuttons.png").convert_alpha()
+            base_image = load_image("assets/ui/ui_buybuttons.png")
             base_image = pygame.transform.scale(base_image, (width, height))
             self.normal = base_image
             self.greyed = pygame.transform.scale(base_image.copy(), (width, height))
@@ -15,16 +21,12 @@ class Button:
         except Exception:
             self.normal = pygame.Surface((width, height), pygame.SRCALPHA)
             self.greyed = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.font = pygame.font.SysFont("Arial", 24)
+        self.font = font_registry.get("Arial", 24)
         self.text_surface = self.font.render(text, True, (249, 249, 242))
         self.hovered = False
         self.clicked = False
-        try:
-            self.click_sound = pygame.mixer.Sound("assets/sounds/UI/button_click.wav")
-            self.back_sound = pygame.mixer.Sound("assets/sounds/UI/button_back.wav")
-        except Exception:
-            self.click_sound = None
-            self.back_sound = None
+        self.click_sound = sound_bank.handle("assets/sounds/UI/button_click.wav")
+        self.back_sound = sound_bank.handle("assets/sounds/UI/button_back.wav")
 
     def update(self, mouse_pos, mouse_clicked):
         self.hovered = self.rect.collidepoint(mouse_pos)
@@ -36,11 +38,15 @@ class Button:
         elif not mouse_clicked:
             self.clicked = False
 
-    def draw(self, screen, button_image):
-        screen.blit(button_image, (self.rect.x, self.rect.y))
-        text_x = self.rect.x + (self.rect.width - self.text_surface.get_width()) // 2
-        text_y = self.rect.y + 10 + 90
-        screen.blit(self.text_surface, (text_x, text_y))
+    def compose(self, button_image, icon):
+        # The icon sits ICON_OFFSET px above the button, so the composite is that much taller
+        surface = pygame.Surface((self.rect.width, self.rect.height + ICON_OFFSET), pygame.SRCALPHA)
+        surface.blit(button_image, (0, ICON_OFFSET))
+        text_x = (self.rect.width - self.text_surface.get_width()) // 2
+        text_y = ICON_OFFSET + 10 + 90
+        surface.blit(self.text_surface, (text_x, text_y))
+        surface.blit(icon, ((self.rect.width - icon.get_width()) // 2, 0))
+        return surface
 
 class UI:
     def __init__(self, game, screen_width, screen_height=1080):
@@ -59,11 +65,13 @@ class UI:
         self.last_seeds = None
         self.seeds_text_surface = None
         self.unit_icons = {}
+        self.button_cache = {}
+        self.button_images = {}
         try:
-            self.background = pygame.image.load("assets/ui/ui_background.png").convert_alpha()
+            self.background = load_image("assets/ui/ui_background.png")
             bg_height = self.screen_height - 880
             self.background = pygame.transform.scale(self.background, (self.screen_width, bg_height))
-            self.background_overlay = pygame.image.load("assets/ui/ui_background_overlay.png").convert_alpha()
+            self.background_overlay = load_image("assets/ui/ui_background_overlay.png")
             overlay_height = bg_height
             self.background_overlay = pygame.transform.scale(self.background_overlay, (self.screen_width, overlay_height))
         except Exception:
@@ -73,7 +81,7 @@ class UI:
             self.background_overlay.fill((0, 0, 0, 0))
         self.setup_buttons()
         self.preload_icons()
-        self.font = pygame.font.SysFont("Arial", 24)
+        self.font = font_registry.get("Arial", 24)
 
     def setup_buttons(self):
         button_width = 180
@@ -117,30 +125,34 @@ class UI:
         if self.last_seeds != int(self.game.seeds):
             self.last_seeds = int(self.game.seeds)
             self.seeds_text_surface = self.font.render(f"Seeds: {self.last_seeds}", True, (249, 249, 242))
+            self.button_images = {unit_type: self.get_button_image(button, unit_type) for button, unit_type in self.buy_buttons}
         if self.seeds_text_surface:
             screen.blit(self.seeds_text_surface, (10, 10))
 
         for button, unit_type in self.buy_buttons:
-            seeds = self.game.seeds
-            cost = unit_type.cost
-            fill_ratio = 1.0 if seeds >= cost else (seeds / cost if cost > 0 else 1.0)
-
-            button_image = button.normal.copy()
+            screen.blit(self.button_images[unit_type], (button.rect.x, button.rect.y - ICON_OFFSET))
 
-            if fill_ratio < 1.0:
-                alpha_mask = pygame.Surface((button.rect.width, button.rect.height), pygame.SRCALPHA)
-                fill_width = int(button.rect.width * fill_ratio)
-                alpha_mask.fill((255, 255, 255, int(255 * 0.25)))
-                if fill_ratio > 0:
-                    pygame.draw.rect(alpha_mask, (255, 255, 255, 255), (0, 0, fill_width, button.rect.height))
-                button_image.blit(alpha_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    def get_button_image(self, button, unit_type):
+        seeds = self.last_seeds
+        cost = unit_type.cost
+        fill_ratio = 1.0 if seeds >= cost else (seeds / cost if cost > 0 else 1.0)
+        step = int(fill_ratio * FILL_STEPS)
+        key = (unit_type, step)
+        if key in self.button_cache:
+            return self.button_cache[key]
 
-            button.draw(screen, button_image)
+        button_image = button.normal.copy()
+        if step < FILL_STEPS:
+            alpha_mask = pygame.Surface((button.rect.width, button.rect.height), pygame.SRCALPHA)
+            fill_width = button.rect.width * step // FILL_STEPS
+            alpha_mask.fill((255, 255, 255, int(255 * 0.25)))
+            if fill_width > 0:
+                pygame.draw.rect(alpha_mask, (255, 255, 255, 255), (0, 0, fill_width, button.rect.height))
+            button_image.blit(alpha_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
-            icon = self.unit_icons[unit_type]
-            icon_x = button.rect.x + (button.rect.width - icon.get_width()) // 2
-            icon_y = button.rect.y - 10
-            screen.blit(icon, (icon_x, icon_y))
+        composite = button.compose(button_image, self.unit_icons[unit_type])
+        self.button_cache[key] = composite
+        return composite
 
     def scale(self, scale_factor):
         pass
\ No newline at end of file
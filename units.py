@@ -1,121 +1,117 @@
 import pygame
-import math
-import random
 from factions import Player, Bandits, Undead, Zombies
 from collisions import check_player_collisions, check_enemy_collisions
-
-def preload_all_animations():
-    for unit_type in [Player_PeasantUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit,
-                      Bandit_Razor, Bandit_Madman, Bandit_Archer, Bandit_Tank, Bandit_King,
-                      Zombie_Archer, Zombie_Assassin, Zombie_Farmer, Zombie_Melee, Zombie_Tank,
-                      Undead_Axeman, Undead_King, Undead_Mage, Undead_Samurai, Undead_Warrior]:
-        faction = "Player" if unit_type in [Player_PeasantUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit] else \
-                  "Bandits" if unit_type in [Bandit_Razor, Bandit_Madman, Bandit_Archer, Bandit_Tank, Bandit_King] else \
-                  "Undead" if unit_type in [Undead_Axeman, Undead_King, Undead_Mage, Undead_Samurai, Undead_Warrior] else "Zombies"
-        unit = unit_type(faction, 0)
-        unit.load_animations()
+from animations import animation_registry
+from sprites import sprite_store
+from sounds import sound_bank
+from healthbars import HealthBar
+from gamelog import log
+from simclock import sim_clock
+from projectiles import projectile_pool
 
 class Unit:
+    # Per-unit state only; stats, sounds and sprite data are shared through the class and animation_registry
+    __slots__ = ("faction", "x", "prev_x", "initial_x", "health", "max_health", "attack_power", "speed",
+                 "attack_cooldown", "direction", "animations", "offsets", "masks", "mirrored_animations",
+                 "mirrored_offsets", "mirrored_masks", "state", "frame", "attack_frame_delay", "last_update",
+                 "attack_target", "is_attacking", "last_attack", "hurt_start", "last_range_check", "is_retreating",
+                 "health_bar", "entity_id", "entity_index")
     hurt_duration = 200
-    missing_spritesheets = set()
+    sprite_scale = 1.0
+    scale_factor = 1.0
+    base_frame_delay = 100
+    y = 688
+    attack_sound = sound_bank.handle("assets/sounds/Units/melee_sword.ogg")
+    death_sound = None
+    is_zombie = False
 
     def __init__(self, faction, x):
         self.faction = faction
         self.x = x
+        self.prev_x = x
         self.initial_x = x
-        self.y = 688
         self.health = self.base_health
         self.max_health = self.health
         self.attack_power = self.base_attack
         self.speed = self.base_speed
-        self.base_attack_cooldown = self.__class__.base_attack_cooldown
         self.attack_cooldown = self.base_attack_cooldown
         self.direction = 1 if (faction == "Player" or (hasattr(faction, 'name') and faction.name == "Player")) else -1
         self.animations = {}
         self.state = "idle"
         self.frame = 0
-        self.base_frame_delay = 100
         self.attack_frame_delay = self.base_attack_cooldown / 14
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = sim_clock.now()
         self.attack_target = None
         self.is_attacking = False
         self.last_attack = 0
         self.hurt_start = None
         self.last_range_check = 0
         self.is_retreating = False
-        self.scale_factor = 1.0
-        # Sound initialization
-        self.attack_sound = None
-        self.death_sound = None
-        self.is_zombie = False
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_sword.ogg")
-        except Exception:
-            self.attack_sound = None
+        fill_color = (0, 255, 0) if self.direction == 1 else (255, 0, 0)
+        self.health_bar = HealthBar(int(114 * self.scale_factor), int(10 * self.scale_factor), fill_color,
+                                    int(16 * self.scale_factor), int(20 * self.scale_factor))
         self.load_animations()
 
     def load_animations(self):
-        faction_name = self.faction if isinstance(self.faction, str) else self.faction.name
-        faction_folder = faction_name.capitalize()
-        spritesheet_path = f"assets/sprites/{faction_folder}/{self.name}.png"
-        
-        if spritesheet_path in Unit.missing_spritesheets:
-            self.set_default_animations()
-            return
-        
-        try:
-            spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
-            frame_width = 192
-            frame_height = 192
-            frames_per_state = 14
-            state_rows = {"idle": 0, "run": 1, "attack": 2, "die": 3}
-            self.animations = {}
-            for state, row in state_rows.items():
-                frames = []
-                for i in range(frames_per_state):
-                    x = i * frame_width
-                    y = row * frame_height
-                    if x + frame_width <= spritesheet.get_width() and y + frame_height <= spritesheet.get_height():
-                        frame = spritesheet.subsurface((x, y, frame_width, frame_height))
-                        scaled_width = int(frame_width * self.scale_factor)
-                        scaled_height = int(frame_height * self.scale_factor)
-                        frame = pygame.transform.smoothscale(frame, (scaled_width, scaled_height))
-                        frames.append(frame)
-                self.animations[state] = frames if frames else [pygame.Surface((int(192 * self.scale_factor), int(192 * self.scale_factor)))]
-            self.animations["hurt"] = [pygame.transform.smoothscale(self.animations["die"][0], (int(192 * self.scale_factor), int(192 * self.scale_factor)))] if self.animations["die"] else [pygame.Surface((int(192 * self.scale_factor), int(192 * self.scale_factor)))]
-        except Exception:
-            Unit.missing_spritesheets.add(spritesheet_path)
-            self.set_default_animations()
-
-    def set_default_animations(self):
-        default_colors = {
-            "Player_Peasant": (255, 0, 0), "Player_Archer": (0, 255, 0), "Player_Warrior": (0, 0, 255), "Player_Tank": (0, 100, 100),
-            "Bandit_Razor": (255, 100, 0), "Bandit_Madman": (255, 0, 100), "Bandit_Archer": (100, 255, 0), "Bandit_Tank": (100, 0, 100),
-            "Bandit_King": (255, 165, 0),
-            "Zombie_Melee": (255, 0, 0), "Zombie_Archer": (0, 255, 0), "Zombie_Tank": (100, 0, 100), "Zombie_Assassin": (255, 255, 0), "Zombie_Farmer": (0, 255, 255),
-            "Undead_Axeman": (128, 0, 0), "Undead_King": (128, 128, 0), "Undead_Mage": (128, 0, 128), "Undead_Samurai": (0, 128, 128), "Undead_Warrior": (128, 128, 128)
-        }
-        color = default_colors.get(self.name, (255, 255, 255))
-        default_frame = pygame.Surface((int(192 * self.scale_factor), int(192 * self.scale_factor)))
-        default_frame.fill(color)
-        self.animations = {state: [default_frame] for state in ["idle", "run", "attack", "die", "hurt"]}
+        scale = self.sprite_scale * self.scale_factor
+        self.animations = animation_registry.get(self.faction, self.name, scale)
+        self.offsets = animation_registry.get_offsets(self.faction, self.name, scale)
+        self.masks = animation_registry.get_masks(self.faction, self.name, scale)
+        # Only left-facing units need the flipped sets; player units share the originals
+        if self.direction == -1:
+            self.mirrored_animations = animation_registry.get(self.faction, self.name, scale, mirrored=True)
+            self.mirrored_offsets = animation_registry.get_offsets(self.faction, self.name, scale, mirrored=True)
+            self.mirrored_masks = animation_registry.get_masks(self.faction, self.name, scale, mirrored=True)
+        else:
+            self.mirrored_animations = self.animations
+            self.mirrored_offsets = self.offsets
+            self.mirrored_masks = self.masks
+
+    def is_mirrored(self):
+        return self.direction == -1 and not self.is_retreating
+
+    def get_frame(self):
+        return self.current_of(self.mirrored_animations if self.is_mirrored() else self.animations)
+
+    def get_offset(self):
+        """Position of the current (possibly trimmed) frame inside the full-size cell."""
+        return self.current_of(self.mirrored_offsets if self.is_mirrored() else self.offsets) or (0, 0)
+
+    def get_mask(self):
+        return self.current_of(self.mirrored_masks if self.is_mirrored() else self.masks)
+
+    def current_of(self, sequences):
+        frames = sequences.get(self.state)
+        if not frames:
+            return None
+        return frames[min(self.frame, len(frames) - 1)]
 
     def get_icon(self):
         if self.animations["idle"]:
-            return pygame.transform.smoothscale(self.animations["idle"][0], (192, 192))
+            size = int(192 * self.sprite_scale * self.scale_factor)
+            icon = pygame.Surface((size, size), pygame.SRCALPHA)
+            icon.blit(self.animations["idle"][0], self.offsets["idle"][0])
+            return pygame.transform.smoothscale(icon, (192, 192))
         return pygame.Surface((192, 192))
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, int(120 * self.scale_factor), int(192 * self.scale_factor))
 
+    def save_position(self):
+        """Remember x before a simulation step so drawing can interpolate toward the new one."""
+        self.prev_x = self.x
+
+    def draw_x(self):
+        return sim_clock.interpolate(self.prev_x, self.x)
+
     def update_animation(self):
-        js.console.log("Entering update_animation")
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         frame_delay = self.attack_frame_delay if self.state == "attack" else self.base_frame_delay
         if now - self.last_update < frame_delay:
             return None
         self.last_update = now
-        js.console.log(f"State: {self.state}, Frame: {self.frame}")
+        if log.debug_on:
+            log.debug("%s state: %s, frame: %s", self.name, self.state, self.frame)
 
         if self.state not in self.animations or not self.animations[self.state]:
             self.state = "idle"
@@ -150,14 +146,14 @@ class Unit:
             self.frame = (self.frame + 1) % (max_frame + 1)
             return None         
 
-    def move(self, all_units, enemy_base, player_base, buckets, bucket_size):
+    def move(self, all_units, enemy_base, player_base, index):
         if self.state in ["attack", "die"]:
             return
 
         if self.direction == 1:
-            new_x, new_state, target = check_player_collisions(self, buckets, bucket_size, enemy_base)
+            new_x, new_state, target = check_player_collisions(self, index, enemy_base)
         elif self.direction == -1:
-            new_x, new_state, target = check_enemy_collisions(self, buckets, bucket_size, player_base)
+            new_x, new_state, target = check_enemy_collisions(self, index, player_base)
 
         self.x = new_x
         if new_state == "attack" and target:
@@ -166,7 +162,7 @@ class Unit:
             self.state = new_state
 
     def in_attack_range(self, target):
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         if now - self.last_range_check < 200:
             return False
         self.last_range_check = now
@@ -177,7 +173,7 @@ class Unit:
     def attack(self, target):
         if self.state == "die":
             return
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         if now - self.last_attack >= self.attack_cooldown:
             self.state = "attack"
             self.frame = 0
@@ -203,35 +199,25 @@ class Unit:
         elif self.state != "attack":
             self.state = "hurt"
             self.frame = 0
-            self.hurt_start = pygame.time.get_ticks()
+            self.hurt_start = sim_clock.now()
 
     def die(self):
         pass  # Death sound moved to take_damage
 
     def draw(self, screen):
-        if self.state in self.animations and self.animations[self.state]:
-            frame_index = min(self.frame, len(self.animations[self.state]) - 1)
-            frame = self.animations[self.state][frame_index]
-            if self.direction == -1 and not self.is_retreating:
-                frame = pygame.transform.flip(frame, True, False)
-            screen.blit(frame, (self.x, self.y))
-
-        bar_width = int(114 * self.scale_factor)
-        bar_height = int(10 * self.scale_factor)
-        health_ratio = self.health / self.max_health
-        fill_width = bar_width * health_ratio
-        bar_x = self.x + ((192 * self.scale_factor) - bar_width) // 2
+        x = self.draw_x()
+        frame = self.get_frame()
+        if frame is not None:
+            offset_x, offset_y = self.get_offset()
+            screen.blit(frame, (x + offset_x, self.y + offset_y))
+
+        bar_x = x + ((192 * self.scale_factor) - self.health_bar.width) // 2
         bar_y = self.y - int(20 * self.scale_factor)
-        pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-        fill_color = (0, 255, 0) if (self.faction == "Player" or (hasattr(self.faction, 'name') and self.faction.name == "Player")) else (255, 0, 0)
-        pygame.draw.rect(screen, fill_color, (bar_x, bar_y, fill_width, bar_height))
-        
-        hp_font = pygame.font.SysFont("Arial", int(16 * self.scale_factor))
-        hp_text = hp_font.render(f"{int(self.health)}/{self.max_health}", True, (255, 255, 255))
-        screen.blit(hp_text, (bar_x + (bar_width - hp_text.get_width()) // 2, bar_y - int(20 * self.scale_factor)))
+        self.health_bar.draw(screen, bar_x, bar_y, self.health, self.max_health)
 
 # Player Units
 class Player_PeasantUnit(Unit):
+    __slots__ = ()
     name = "Player_Peasant"
     base_health = 50
     base_attack = 20
@@ -239,15 +225,10 @@ class Player_PeasantUnit(Unit):
     base_attack_cooldown = 1000
     cost = 20
     attack_range = 125
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        try:
-            self.attack_sound = pygame.mixer.Sound("assets/sounds/Units/melee_fist.ogg")
-        except Exception:
-            self.attack_sound = None
+    attack_sound = sound_bank.handle("assets/sounds/Units/melee_fist.ogg")
 
 class Player_ArcherUnit(Unit):
+    __slots__ = ()
     name = "Player_Archer"
     base_health = 30
     base_attack = 15
@@ -257,7 +238,7 @@ class Player_ArcherUnit(Unit):
     attack_range = 250
 
     def update_animation(self):
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         frame_delay = self.attack_frame_delay if self.state == "attack" else self.base_frame_delay
         if now - self.last_update < frame_delay:
             return None
@@ -276,9 +257,11 @@ class Player_ArcherUnit(Unit):
                 arrow_start_x = self.x + int(115 * self.scale_factor)
                 arrow_start_y = self.y + int(105 * self.scale_factor)
                 if hasattr(self.attack_target, 'state') and self.attack_target.state != "die":
-                    return Arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    projectile_pool.spawn_arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    return None
                 elif hasattr(self.attack_target, 'health') and self.attack_target.health > 0:
-                    return Arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    projectile_pool.spawn_arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    return None
             if self.frame > max_frame:
                 self.is_attacking = False
                 self.attack_target = None
@@ -299,6 +282,7 @@ class Player_ArcherUnit(Unit):
             return None
 
 class Player_WarriorUnit(Unit):
+    __slots__ = ()
     name = "Player_Warrior"
     base_health = 80
     base_attack = 25
@@ -308,6 +292,7 @@ class Player_WarriorUnit(Unit):
     attack_range = 125
 
 class Player_TankUnit(Unit):
+    __slots__ = ()
     name = "Player_Tank"
     base_health = 150
     base_attack = 10
@@ -318,6 +303,7 @@ class Player_TankUnit(Unit):
 
 # Bandit Units
 class Bandit_Razor(Unit):
+    __slots__ = ()
     name = "Bandit_Razor"
     base_health = 40
     base_attack = 25
@@ -327,6 +313,7 @@ class Bandit_Razor(Unit):
     attack_range = 125
 
 class Bandit_Madman(Unit):
+    __slots__ = ()
     name = "Bandit_Madman"
     base_health = 60
     base_attack = 20
@@ -336,6 +323,7 @@ class Bandit_Madman(Unit):
     attack_range = 125
 
 class Bandit_Archer(Unit):
+    __slots__ = ()
     name = "Bandit_Archer"
     base_health = 30
     base_attack = 15
@@ -345,7 +333,7 @@ class Bandit_Archer(Unit):
     attack_range = 250
 
     def update_animation(self):
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         frame_delay = self.attack_frame_delay if self.state == "attack" else self.base_frame_delay
         if now - self.last_update < frame_delay:
             return None
@@ -364,9 +352,11 @@ class Bandit_Archer(Unit):
                 arrow_start_x = self.x + int(77 * self.scale_factor)
                 arrow_start_y = self.y + int(105 * self.scale_factor)
                 if hasattr(self.attack_target, 'state') and self.attack_target.state != "die":
-                    return Arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    projectile_pool.spawn_arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    return None
                 elif hasattr(self.attack_target, 'health') and self.attack_target.health > 0:
-                    return Arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    projectile_pool.spawn_arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    return None
             if self.frame > max_frame:
                 self.is_attacking = False
                 self.attack_target = None
@@ -387,6 +377,7 @@ class Bandit_Archer(Unit):
             return None
 
 class Bandit_Tank(Unit):
+    __slots__ = ()
     name = "Bandit_Tank"
     base_health = 150
     base_attack = 10
@@ -396,6 +387,7 @@ class Bandit_Tank(Unit):
     attack_range = 125
 
 class Bandit_King(Unit):
+    __slots__ = ()
     name = "Bandit_King"
     base_health = 1000
     base_attack = 20
@@ -403,74 +395,30 @@ class Bandit_King(Unit):
     base_attack_cooldown = 1000
     cost = 0
     attack_range = 125
+    sprite_scale = 1.5
+    y = 592
 
     def __init__(self, faction, x):
         super().__init__(faction, x)
-        self.y = 592
-
-    def load_animations(self):
-        faction_name = self.faction if isinstance(self.faction, str) else self.faction.name
-        faction_folder = faction_name.capitalize()
-        spritesheet_path = f"assets/sprites/{faction_folder}/{self.name}.png"
-        
-        if spritesheet_path in Unit.missing_spritesheets:
-            self.set_default_animations()
-            return
-        
-        try:
-            spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
-            frame_width = 192
-            frame_height = 192
-            frames_per_state = 14
-            state_rows = {"idle": 0, "run": 1, "attack": 2, "die": 3}
-            self.animations = {}
-            for state, row in state_rows.items():
-                frames = []
-                for i in range(frames_per_state):
-                    x = i * frame_width
-                    y = row * frame_height
-                    if x + frame_width <= spritesheet.get_width() and y + frame_height <= spritesheet.get_height():
-                        frame = spritesheet.subsurface((x, y, frame_width, frame_height))
-                        frame = pygame.transform.smoothscale(frame, (288, 288))
-                        frames.append(frame)
-                self.animations[state] = frames if frames else [pygame.Surface((288, 288))]
-            self.animations["hurt"] = [pygame.transform.smoothscale(self.animations["die"][0], (288, 288))] if self.animations["die"] else [pygame.Surface((288, 288))]
-        except Exception:
-            Unit.missing_spritesheets.add(spritesheet_path)
-            self.set_default_animations()
-
-    def set_default_animations(self):
-        default_frame = pygame.Surface((288, 288))
-        default_frame.fill((255, 165, 0))
-        self.animations = {state: [default_frame] for state in ["idle", "run", "attack", "die", "hurt"]}
+        self.health_bar = HealthBar(171, 15, (255, 0, 0), 24, 30)
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, 180, 288)
 
     def draw(self, screen):
-        if self.state in self.animations and self.animations[self.state]:
-            frame_index = min(self.frame, len(self.animations[self.state]) - 1)
-            frame = self.animations[self.state][frame_index]
-            if self.direction == -1 and not self.is_retreating:
-                frame = pygame.transform.flip(frame, True, False)
-            screen.blit(frame, (self.x, self.y))
-
-        bar_width = 171
-        bar_height = 15
-        health_ratio = self.health / self.max_health
-        fill_width = bar_width * health_ratio
-        bar_x = self.x + (288 - bar_width) // 2
+        x = self.draw_x()
+        frame = self.get_frame()
+        if frame is not None:
+            offset_x, offset_y = self.get_offset()
+            screen.blit(frame, (x + offset_x, self.y + offset_y))
+
+        bar_x = x + (288 - self.health_bar.width) // 2
         bar_y = self.y - 30
-        pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-        fill_color = (255, 0, 0)
-        pygame.draw.rect(screen, fill_color, (bar_x, bar_y, fill_width, bar_height))
-        
-        hp_font = pygame.font.SysFont("Arial", 24)
-        hp_text = hp_font.render(f"{int(self.health)}/{self.max_health}", True, (255, 255, 255))
-        screen.blit(hp_text, (bar_x + (bar_width - hp_text.get_width()) // 2, bar_y - 30))
+        self.health_bar.draw(screen, bar_x, bar_y, self.health, self.max_health)
 
 # Zombie Units
 class Zombie_Melee(Unit):
+    __slots__ = ()
     name = "Zombie_Melee"
     base_health = 50
     base_attack = 20
@@ -478,16 +426,11 @@ class Zombie_Melee(Unit):
     base_attack_cooldown = 1000
     cost = 20
     attack_range = 125
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        self.is_zombie = True
-        try:
-            self.death_sound = pygame.mixer.Sound("assets/sounds/Units/Zombie_die.ogg")
-        except Exception:
-            self.death_sound = None
+    is_zombie = True
+    death_sound = sound_bank.handle("assets/sounds/Units/Zombie_die.ogg")
 
 class Zombie_Archer(Unit):
+    __slots__ = ()
     name = "Zombie_Archer"
     base_health = 30
     base_attack = 15
@@ -495,17 +438,11 @@ class Zombie_Archer(Unit):
     base_attack_cooldown = 1000
     cost = 30
     attack_range = 250
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        self.is_zombie = True
-        try:
-            self.death_sound = pygame.mixer.Sound("assets/sounds/Units/Zombie_die.ogg")
-        except Exception:
-            self.death_sound = None
+    is_zombie = True
+    death_sound = sound_bank.handle("assets/sounds/Units/Zombie_die.ogg")
 
     def update_animation(self):
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         frame_delay = self.attack_frame_delay if self.state == "attack" else self.base_frame_delay
         if now - self.last_update < frame_delay:
             return None
@@ -524,9 +461,11 @@ class Zombie_Archer(Unit):
                 arrow_start_x = self.x + int(77 * self.scale_factor)
                 arrow_start_y = self.y + int(105 * self.scale_factor)
                 if hasattr(self.attack_target, 'state') and self.attack_target.state != "die":
-                    return Arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    projectile_pool.spawn_arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    return None
                 elif hasattr(self.attack_target, 'health') and self.attack_target.health > 0:
-                    return Arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    projectile_pool.spawn_arrow(arrow_start_x, arrow_start_y, self.direction, self.attack_target, self.attack_power)
+                    return None
             if self.frame > max_frame:
                 self.is_attacking = False
                 self.attack_target = None
@@ -547,6 +486,7 @@ class Zombie_Archer(Unit):
             return None
 
 class Zombie_Assassin(Unit):
+    __slots__ = ()
     name = "Zombie_Assassin"
     base_health = 20
     base_attack = 30
@@ -554,16 +494,11 @@ class Zombie_Assassin(Unit):
     base_attack_cooldown = 500
     cost = 40
     attack_range = 125
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        self.is_zombie = True
-        try:
-            self.death_sound = pygame.mixer.Sound("assets/sounds/Units/Zombie_die.ogg")
-        except Exception:
-            self.death_sound = None
+    is_zombie = True
+    death_sound = sound_bank.handle("assets/sounds/Units/Zombie_die.ogg")
 
 class Zombie_Farmer(Unit):
+    __slots__ = ()
     name = "Zombie_Farmer"
     base_health = 60
     base_attack = 15
@@ -571,16 +506,11 @@ class Zombie_Farmer(Unit):
     base_attack_cooldown = 1200
     cost = 25
     attack_range = 125
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        self.is_zombie = True
-        try:
-            self.death_sound = pygame.mixer.Sound("assets/sounds/Units/Zombie_die.ogg")
-        except Exception:
-            self.death_sound = None
+    is_zombie = True
+    death_sound = sound_bank.handle("assets/sounds/Units/Zombie_die.ogg")
 
 class Zombie_Tank(Unit):
+    __slots__ = ()
     name = "Zombie_Tank"
     base_health = 150
     base_attack = 10
@@ -588,17 +518,12 @@ class Zombie_Tank(Unit):
     base_attack_cooldown = 1500
     cost = 60
     attack_range = 125
-
-    def __init__(self, faction, x):
-        super().__init__(faction, x)
-        self.is_zombie = True
-        try:
-            self.death_sound = pygame.mixer.Sound("assets/sounds/Units/Zombie_die.ogg")
-        except Exception:
-            self.death_sound = None
+    is_zombie = True
+    death_sound = sound_bank.handle("assets/sounds/Units/Zombie_die.ogg")
 
 # Undead Units
 class Undead_Axeman(Unit):
+    __slots__ = ()
     name = "Undead_Axeman"
     base_health = 70
     base_attack = 25
@@ -608,6 +533,7 @@ class Undead_Axeman(Unit):
     attack_range = 125
 
 class Undead_King(Unit):
+    __slots__ = ()
     name = "Undead_King"
     base_health = 100
     base_attack = 30
@@ -617,6 +543,7 @@ class Undead_King(Unit):
     attack_range = 150
 
 class Undead_Mage(Unit):
+    __slots__ = ()
     name = "Undead_Mage"
     base_health = 50
     base_attack = 25
@@ -626,7 +553,7 @@ class Undead_Mage(Unit):
     attack_range = 200
 
     def update_animation(self):
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         frame_delay = self.attack_frame_delay if self.state == "attack" else self.base_frame_delay
         if now - self.last_update < frame_delay:
             return None
@@ -645,9 +572,11 @@ class Undead_Mage(Unit):
                 magicball_start_x = self.x + int(77 * self.scale_factor)
                 magicball_start_y = self.y + int(105 * self.scale_factor)
                 if hasattr(self.attack_target, 'state') and self.attack_target.state != "die":
-                    return MagicBall(magicball_start_x, magicball_start_y, self.direction, self.attack_target, self.attack_power)
+                    projectile_pool.spawn_magic_ball(magicball_start_x, magicball_start_y, self.direction, self.attack_target, self.attack_power)
+                    return None
                 elif hasattr(self.attack_target, 'health') and self.attack_target.health > 0:
-                    return MagicBall(magicball_start_x, magicball_start_y, self.direction, self.attack_target, self.attack_power)
+                    projectile_pool.spawn_magic_ball(magicball_start_x, magicball_start_y, self.direction, self.attack_target, self.attack_power)
+                    return None
             if self.frame > max_frame:
                 self.is_attacking = False
                 self.attack_target = None
@@ -668,6 +597,7 @@ class Undead_Mage(Unit):
             return None
 
 class Undead_Samurai(Unit):
+    __slots__ = ()
     name = "Undead_Samurai"
     base_health = 60
     base_attack = 35
@@ -677,6 +607,7 @@ class Undead_Samurai(Unit):
     attack_range = 125
 
 class Undead_Warrior(Unit):
+    __slots__ = ()
     name = "Undead_Warrior"
     base_health = 80
     base_attack = 20
@@ -685,180 +616,33 @@ class Undead_Warrior(Unit):
     cost = 30
     attack_range = 125
 
+UNIT_ROSTER = {
+    "Player": [Player_PeasantUnit, Player_ArcherUnit, Player_WarriorUnit, Player_TankUnit],
+    "Bandits": [Bandit_Razor, Bandit_Madman, Bandit_Archer, Bandit_Tank, Bandit_King],
+    "Zombies": [Zombie_Archer, Zombie_Assassin, Zombie_Farmer, Zombie_Melee, Zombie_Tank],
+    "Undead": [Undead_Axeman, Undead_King, Undead_Mage, Undead_Samurai, Undead_Warrior]
+}
+
 # Cart Unit
 class CartUnit:
+    __slots__ = ("faction", "x", "prev_x", "target_x", "speed", "moving", "sprite")
+    y = 688
+
     def __init__(self, x, y, target_x, faction="Bandits"):
         self.faction = faction
         self.x = x
-        self.y = 688
+        self.prev_x = x
         self.target_x = target_x
         self.speed = -1.5
         self.moving = True
-        try:
-            self.sprite = pygame.image.load("assets/images/Cart.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (150, 150))
-        except Exception:
-            self.sprite = pygame.Surface((150, 150))
-            self.sprite.fill((139, 69, 19))
+        self.sprite = sprite_store.get("assets/images/Cart.png", (150, 150), fallback_color=(139, 69, 19))
 
     def update(self):
         if self.moving and self.x > self.target_x:
             self.x += self.speed
 
-    def draw(self, screen):
-        screen.blit(self.sprite, (self.x, self.y))
-
-# Projectile Classes
-class Arrow:
-    def __init__(self, x, y, direction, target, damage, max_distance=1000):
-        self.x = x
-        self.y = y
-        self.start_x = x
-        self.direction = direction
-        self.target = target
-        self.damage = damage
-        self.active = True
-        self.max_distance = max_distance
-
-        if hasattr(target, 'x') and hasattr(target, 'y'):
-            self.target_x = target.x + (60 * getattr(target, 'scale_factor', 1.0))
-            self.target_y = target.y + (102 * getattr(target, 'scale_factor', 1.0))
-        else:
-            self.target_x = target.x + (75 if direction == 1 else 150)
-            self.target_y = target.y + 150
-
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        self.gravity = 0.2
-        travel_time = max(20, min(60, int(abs(dx) / 10))) + random.randint(-5, 5)
-        self.velocity_x = dx / travel_time if dx != 0 else 3 * direction
-        self.velocity_y = (dy - 0.5 * self.gravity * travel_time * (travel_time - 1)) / travel_time
-
-        try:
-            self.sprite = pygame.image.load("assets/images/arrow.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (32, 16))
-        except Exception:
-            self.sprite = pygame.Surface((32, 16))
-            self.sprite.fill((255, 255, 255))
-
-        self.rotated_sprite = self.sprite
-
-    def update(self, all_units):
-        if not self.active:
-            return True
-
-        if not self.target or (hasattr(self.target, 'state') and self.target.state == "die") or \
-           (hasattr(self.target, 'health') and self.target.health <= 0):
-            self.active = False
-            return True
-
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        self.velocity_y += self.gravity
-
-        traveled_distance = abs(self.x - self.start_x)
-        if traveled_distance > self.max_distance:
-            self.active = False
-            return True
-
-        angle = math.degrees(math.atan2(-self.velocity_y, self.velocity_x))
-        self.rotated_sprite = pygame.transform.rotate(self.sprite, angle)
-
-        arrow_rect = pygame.Rect(self.x - 16, self.y - 8, 32, 16)
-        target_rect = self.target.get_rect()
-
-        if arrow_rect.colliderect(target_rect):
-            if self.check_pixel_collision(self.target):
-                if (hasattr(self.target, 'state') and self.target.state != "die") or \
-                   (hasattr(self.target, 'health') and self.target.health > 0):
-                    self.target.take_damage(self.damage)
-                self.active = False
-                return True
-        return False
-
-    def check_pixel_collision(self, target):
-        if hasattr(target, 'animations') and target.state in target.animations:
-            frame = target.animations[target.state][target.frame]
-            if target.direction == -1:
-                frame = pygame.transform.flip(frame, True, False)
-            mask = pygame.mask.from_surface(frame)
-            arrow_mask = pygame.mask.from_surface(self.rotated_sprite)
-            offset_x = int(self.x - target.x)
-            offset_y = int(self.y - target.y)
-            overlap = mask.overlap(arrow_mask, (offset_x, offset_y))
-            return overlap is not None
-        return True
-
-    def draw(self, screen):
-        if self.active:
-            screen.blit(self.rotated_sprite, (self.x - 16, self.y - 8))
-
-class MagicBall:
-    def __init__(self, x, y, direction, target, damage, max_distance=1000):
-        self.x = x
-        self.y = y
-        self.start_x = x
-        self.start_y = y
-        self.direction = direction
-        self.target = target
-        self.damage = damage
-        self.active = True
-        self.max_distance = max_distance
-        self.speed = 5
-
-        if hasattr(target, 'x') and hasattr(target, 'y'):
-            target_x = target.x + (60 * getattr(target, 'scale_factor', 1.0))
-            target_y = target.y + (102 * getattr(target, 'scale_factor', 1.0))
-        else:
-            target_x = target.x + (75 if direction == 1 else 150)
-            target_y = target.y + 150
-        dx = target_x - x
-        dy = target_y - y
-        distance = math.sqrt(dx**2 + dy**2)
-        if distance > 0:
-            self.vx = self.speed * (dx / distance)
-            self.vy = self.speed * (dy / distance)
-        else:
-            self.vx = 0
-            self.vy = 0
-            self.active = False
-
-        try:
-            self.sprite = pygame.image.load("assets/images/magicball.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (32, 32))
-        except Exception:
-            self.sprite = pygame.Surface((32, 32))
-            self.sprite.fill((128, 0, 128))
-
-        angle = math.degrees(math.atan2(-self.vy, self.vx))
-        self.rotated_sprite = pygame.transform.rotate(self.sprite, angle)
-
-    def update(self, all_units):
-        if not self.active:
-            return True
-
-        self.x += self.vx
-        self.y += self.vy
-
-        traveled_distance = math.sqrt((self.x - self.start_x)**2 + (self.y - self.start_y)**2)
-        if traveled_distance > self.max_distance:
-            self.active = False
-            return True
-
-        if self.target and ((hasattr(self.target, 'state') and self.target.state != "die") or
-                           (hasattr(self.target, 'health') and self.target.health > 0)):
-            target_rect = self.target.get_rect()
-            magicball_rect = pygame.Rect(self.x - 16, self.y - 16, 32, 32)
-            if magicball_rect.colliderect(target_rect):
-                self.target.take_damage(self.damage)
-                self.active = False
-                return True
-        else:
-            self.active = False
-            return True
-
-        return False
+    def save_position(self):
+        self.prev_x = self.x
 
     def draw(self, screen):
-        if self.active:
-            screen.blit(self.rotated_sprite, (self.x - 16, self.y - 16))
\ No newline at end of file
+        screen.blit(self.sprite, (sim_clock.interpolate(self.prev_x, self.x), self.y))
\ No newline at end of file